@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/benchmarks/eviction_policies.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 19:45
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Benchmark replaying Zipfian and scan-polluted Zipfian workloads against bounded `InMemoryBackend`
+with each eviction policy, reporting hit ratio and operations per second
+
+  python benchmarks/eviction_policies.py --capacity 1000 --keys 100000 --requests 200000
+"""
+
+### Standard packages ###
+from argparse import ArgumentParser, Namespace
+from asyncio import run
+from itertools import accumulate
+from random import Random
+from time import perf_counter
+from typing import Dict, List, Type
+
+### Local modules ###
+from cachette.backends.inmemory import InMemoryBackend
+from cachette.codecs.vanilla import VanillaCodec
+from cachette.policies import Policy
+from cachette.policies.arc import ARCPolicy
+from cachette.policies.lfu import LFUPolicy
+from cachette.policies.lru import LRUPolicy
+from cachette.policies.s3fifo import S3FIFOPolicy
+from cachette.policies.tinylfu import TinyLFUPolicy
+
+POLICIES: Dict[str, Type[Policy]] = {
+  "arc": ARCPolicy,
+  "lfu": LFUPolicy,
+  "lru": LRUPolicy,
+  "s3fifo": S3FIFOPolicy,
+  "tinylfu": TinyLFUPolicy,
+}
+
+
+def zipfian(keys: int, requests: int, skew: float, random: Random) -> List[str]:
+  weights: List[float] = list(accumulate(1 / (rank**skew) for rank in range(1, keys + 1)))
+  return [f"key-{rank}" for rank in random.choices(range(keys), cum_weights=weights, k=requests)]
+
+
+def scanned(trace: List[str], length: int, every: int) -> List[str]:
+  ### Interleaves one-off sequential scans of unique keys among regular requests ###
+  polluted: List[str] = []
+  for index, key in enumerate(trace):
+    polluted.append(key)
+    if index % every == 0:
+      polluted.extend(f"scan-{index}-{offset}" for offset in range(length))
+  return polluted
+
+
+async def replay(policy: Type[Policy], capacity: int, trace: List[str]) -> Dict[str, float]:
+  backend: InMemoryBackend = InMemoryBackend(
+    codec=VanillaCodec(), max_entries=capacity, policy=policy(), ttl=3600
+  )
+  hits: int = 0
+  started: float = perf_counter()
+  for key in trace:
+    if await backend.fetch(key) is None:
+      await backend.put(key, key)
+    else:
+      hits += 1
+  elapsed: float = perf_counter() - started
+  return {"hit_ratio": hits / len(trace), "ops": len(trace) / elapsed}
+
+
+async def main(arguments: Namespace) -> None:
+  random: Random = Random(arguments.seed)
+  zipf: List[str] = zipfian(arguments.keys, arguments.requests, arguments.skew, random)
+  workloads: Dict[str, List[str]] = {
+    "zipfian": zipf,
+    "scan": scanned(zipf, arguments.capacity, arguments.requests // 10),
+  }
+  for workload, trace in workloads.items():
+    print(f"{workload} ({len(trace)} requests, capacity {arguments.capacity})")
+    for name, policy in POLICIES.items():
+      result: Dict[str, float] = await replay(policy, arguments.capacity, trace)
+      print(f"  {name:<8} hit ratio {result['hit_ratio']:>7.2%}  {result['ops']:>10,.0f} ops/sec")
+
+
+if __name__ == "__main__":
+  parser: ArgumentParser = ArgumentParser(description=__doc__)
+  parser.add_argument("--capacity", default=1000, type=int)
+  parser.add_argument("--keys", default=100_000, type=int)
+  parser.add_argument("--requests", default=200_000, type=int)
+  parser.add_argument("--seed", default=8, type=int)
+  parser.add_argument("--skew", default=0.9, type=float)
+  run(main(parser.parse_args()))
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/benchmarks/inmemory_threads.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 23:10
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Benchmark hammering one shared `InMemoryBackend` from increasing amounts of threads, as sync
+endpoints do from the thread pool, with and without sharding, reporting operations per second;
+run on free-threaded builds with `-X gil=0` and `-X gil=1` to compare with and without the GIL
+
+  python benchmarks/inmemory_threads.py --operations 200000 --shards 1 16 --threads 1 2 4 8
+"""
+
+### Standard packages ###
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
+import sys
+from time import perf_counter
+from typing import Any, Coroutine, List
+
+### Local modules ###
+from cachette.backends.inmemory import InMemoryBackend
+from cachette.codecs.vanilla import VanillaCodec
+
+
+def complete(coroutine: Coroutine[Any, Any, Any]) -> Any:
+  ### In-memory operations never suspend, drive them without per-thread event loops ###
+  try:
+    coroutine.send(None)
+  except StopIteration as stop:
+    return stop.value
+  raise RuntimeError("Coroutine suspended unexpectedly.")
+
+
+def operate(backend: InMemoryBackend, keys: List[str], writes: float) -> None:
+  random: Random = Random(len(keys))
+  for key in keys:
+    if random.random() < writes:
+      complete(backend.put(key, key))
+    elif complete(backend.fetch(key)) is None:
+      complete(backend.put(key, key))
+
+
+def measure(arguments: Namespace, shards: int, threads: int) -> float:
+  backend: InMemoryBackend = InMemoryBackend(
+    codec=VanillaCodec(), max_entries=arguments.capacity, shards=shards, ttl=3600
+  )
+  random: Random = Random(arguments.seed)
+  share: int = arguments.operations // threads
+  batches: List[List[str]] = [
+    [f"key-{random.randrange(arguments.keys)}" for _ in range(share)] for _ in range(threads)
+  ]
+  with ThreadPoolExecutor(max_workers=threads) as executor:
+    started: float = perf_counter()
+    for future in [executor.submit(operate, backend, batch, arguments.writes) for batch in batches]:
+      future.result()
+    elapsed: float = perf_counter() - started
+  return share * threads / elapsed
+
+
+def main(arguments: Namespace) -> None:
+  ### Absent before 3.13, where the GIL is always enabled ###
+  enabled: bool = getattr(sys, "_is_gil_enabled", lambda: True)()
+  print(f"python {sys.version.split()[0]}, GIL {'enabled' if enabled else 'disabled'}")
+  for shards in arguments.shards:
+    for threads in arguments.threads:
+      ops: float = measure(arguments, shards, threads)
+      print(f"  shards {shards:>4}  threads {threads:>3}  {ops:>12,.0f} ops/sec")
+
+
+if __name__ == "__main__":
+  parser: ArgumentParser = ArgumentParser(description=__doc__)
+  parser.add_argument("--capacity", default=10_000, type=int)
+  parser.add_argument("--keys", default=50_000, type=int)
+  parser.add_argument("--operations", default=200_000, type=int)
+  parser.add_argument("--seed", default=8, type=int)
+  parser.add_argument("--shards", default=[1, 16], nargs="+", type=int)
+  parser.add_argument("--threads", default=[1, 2, 4, 8], nargs="+", type=int)
+  parser.add_argument("--writes", default=0.1, type=float)
+  main(parser.parse_args())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/benchmarks/records.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 21:10
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Microbenchmark comparing construction time and resident size of in-memory entries built as
+validated pydantic models, as `InMemoryBackend` used to do, against `__slots__` records
+
+  python benchmarks/records.py --entries 100000
+"""
+
+### Standard packages ###
+from argparse import ArgumentParser, Namespace
+from asyncio import run
+from time import perf_counter_ns
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any, Callable, Dict, List
+
+### Third-party packages ###
+from pydantic import BaseModel, StrictBytes, StrictInt
+
+### Local modules ###
+from cachette.backends.inmemory import InMemoryBackend, Value
+from cachette.codecs.vanilla import VanillaCodec
+
+
+class ValidatedValue(BaseModel):
+  data: StrictBytes
+  expires: StrictInt
+
+
+def construction(record: Callable[..., Any], entries: int) -> float:
+  started: int = perf_counter_ns()
+  for index in range(entries):
+    record(data=b"value", expires=index)
+  return (perf_counter_ns() - started) / entries
+
+
+def footprint(record: Callable[..., Any], entries: int) -> float:
+  start()
+  records: List[Any] = [record(data=b"value", expires=index) for index in range(entries)]
+  current: int = get_traced_memory()[0]
+  stop()
+  del records
+  ### Subtract list of references holding records ###
+  return current / entries - 8
+
+
+async def puts(entries: int) -> float:
+  backend: InMemoryBackend = InMemoryBackend(codec=VanillaCodec(), ttl=60)
+  started: int = perf_counter_ns()
+  for index in range(entries):
+    await backend.put(f"key-{index}", "value")
+  return (perf_counter_ns() - started) / entries
+
+
+def main(arguments: Namespace) -> None:
+  records: Dict[str, Callable[..., Any]] = {"pydantic": ValidatedValue, "__slots__": Value}
+  for name, record in records.items():
+    print(
+      f"{name:<10} {construction(record, arguments.entries):>8.1f} ns/op  "
+      f"{footprint(record, arguments.entries):>6.1f} bytes/entry"
+    )
+  print(f"{'put':<10} {run(puts(arguments.entries)):>8.1f} ns/op")
+
+
+if __name__ == "__main__":
+  parser: ArgumentParser = ArgumentParser(description=__doc__)
+  parser.add_argument("--entries", default=100_000, type=int)
+  main(parser.parse_args())
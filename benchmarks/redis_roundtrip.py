@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/benchmarks/redis_roundtrip.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 12:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Benchmark comparing `fetch` round-trip latency of a client created per call, as `RedisBackend`
+used to do, against the long-lived pooled client
+
+  python benchmarks/redis_roundtrip.py --url redis://localhost:6379 --iterations 2000
+"""
+
+### Standard packages ###
+from argparse import ArgumentParser, Namespace
+from asyncio import run
+from statistics import mean, quantiles
+from time import perf_counter
+from typing import List
+
+### Third-party packages ###
+from redis.asyncio import Redis
+
+### Local modules ###
+from cachette.backends.redis import RedisBackend
+from cachette.codecs.vanilla import VanillaCodec
+
+
+def report(label: str, latencies: List[float]) -> None:
+  percentiles: List[float] = quantiles(latencies, n=100)
+  print(
+    f"{label:<10} mean {mean(latencies) * 1e6:>9.1f}us  "
+    f"p50 {percentiles[49] * 1e6:>9.1f}us  p99 {percentiles[98] * 1e6:>9.1f}us"
+  )
+
+
+async def per_call(url: str, iterations: int) -> List[float]:
+  latencies: List[float] = []
+  for _ in range(iterations):
+    started: float = perf_counter()
+    client: Redis = Redis.from_url(url=url)
+    await client.get("benchmark")
+    await client.connection_pool.disconnect()
+    latencies.append(perf_counter() - started)
+  return latencies
+
+
+async def pooled(url: str, iterations: int) -> List[float]:
+  backend: RedisBackend = RedisBackend(codec=VanillaCodec(), redis_url=url, ttl=60)
+  await backend.open()
+  latencies: List[float] = []
+  for _ in range(iterations):
+    started: float = perf_counter()
+    await backend.fetch("benchmark")
+    latencies.append(perf_counter() - started)
+  await backend.close()
+  return latencies
+
+
+async def main(arguments: Namespace) -> None:
+  report("per-call", await per_call(arguments.url, arguments.iterations))
+  report("pooled", await pooled(arguments.url, arguments.iterations))
+
+
+if __name__ == "__main__":
+  parser: ArgumentParser = ArgumentParser(description=__doc__)
+  parser.add_argument("--iterations", default=2000, type=int)
+  parser.add_argument("--url", default="redis://localhost:6379")
+  run(main(parser.parse_args()))
@@ -30,6 +30,24 @@ app: Application = Application()
 app.services.add_scoped(Cachette)
 
 
+async def open_cachette(application: Application) -> None:
+  """
+  Opens cachette backend connections when App starts up
+  """
+  await Cachette().open()
+
+
+async def close_cachette(application: Application) -> None:
+  """
+  Drains cachette backend connections when App shuts down
+  """
+  await Cachette().close()
+
+
+app.on_start += open_cachette
+app.on_stop += close_cachette
+
+
 @post("/")
 async def setter(data: FromJSON[Payload], cachette: Cachette):
   """
@@ -13,13 +13,12 @@
 Example for using FastAPI Cachette extension in tandem with BackgroundTasks
 """
 
-from asyncio import run
 from cachette import Cachette
 from fastapi import BackgroundTasks, Depends, FastAPI
 from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
-app = FastAPI()
+app = FastAPI(lifespan=Cachette.lifespan)
 
 
 ### Cachette Configurations ###
@@ -36,11 +35,11 @@ class Payload(BaseModel):
 
 ### Routing ###
 @app.get("/{key}", response_class=PlainTextResponse, status_code=200)
-def getter(key: str, cachette: Cachette = Depends()):
+async def getter(key: str, cachette: Cachette = Depends()):
   """
   Returns key value
   """
-  value: str = run(cachette.fetch(key))
+  value: str = await cachette.fetch(key)
   return value
 
 
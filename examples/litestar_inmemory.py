@@ -43,7 +43,9 @@ async def setter(data: Payload, cachette: Cachette) -> str:
 
 
 app: Litestar = Litestar(
-  route_handlers=[getter, setter], dependencies={"cachette": Provide(Cachette)}
+  route_handlers=[getter, setter],
+  dependencies={"cachette": Provide(Cachette, sync_to_thread=False)},
+  lifespan=[Cachette.lifespan],
 )
 
 
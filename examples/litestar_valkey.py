@@ -50,7 +50,8 @@ async def setter(data: Payload, cachette: Cachette) -> str:
 
 app: Litestar = Litestar(
   route_handlers=[getter, setter],
-  dependencies={"cachette": Provide(Cachette)},
+  dependencies={"cachette": Provide(Cachette, sync_to_thread=False)},
+  lifespan=[Cachette.lifespan],
 )
 
 
@@ -59,7 +59,7 @@ async def getter(request: Request):
 routes: List[Route] = []
 routes.append(Route("/{key:str}", getter, methods=["GET"]))
 routes.append(Route("/", setter, methods=["POST"]))
-app: Starlette = Starlette(routes=routes)
+app: Starlette = Starlette(lifespan=Cachette.lifespan, routes=routes)
 
 
 __all__ = ("app",)
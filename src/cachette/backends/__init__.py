@@ -13,15 +13,33 @@
 
 ### Standard packages ###
 from abc import abstractmethod
+from asyncio import gather
 from time import time
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class Backend:
+  __slots__ = ()
+
+  ### Default time-to-live in seconds, set by each implementation ###
+  ttl: int
+
   @property
   def now(self) -> int:
     return int(time())
 
+  async def open(self) -> None:
+    """
+    Opens connection pools and prepares backend resources ahead of first request;
+    no-op for backends without any resources to prepare.
+    """
+
+  async def close(self) -> None:
+    """
+    Drains connection pools and releases backend resources at application shutdown;
+    no-op for backends without any resources to release.
+    """
+
   @abstractmethod
   async def fetch(self, key: str) -> Any:
     """
@@ -44,14 +62,19 @@ class Backend:
     raise NotImplementedError
 
   @abstractmethod
-  async def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+  async def put(
+    self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[List[str]] = None
+  ) -> None:
     """
-    Abstract Method: Puts the value within the cache with key and assigned time-to-live value
+    Abstract Method: Puts the value within the cache with key and assigned time-to-live value;
+    backends not recording tags raise `NotImplementedError` when given any
 
     ---
     :param:  key  `str` identifies key-value pair
     :param:  value  `Any` value to have stored identified by key
     :param:  ttl  `int` time before value expires within cache; default: `None`
+    :param:  tags  `List[str]` groups key is invalidated along with by `invalidate_tags`;
+      default: `None`
     :returns:  `None`
     """
     raise NotImplementedError
@@ -68,5 +91,50 @@ class Backend:
     """
     raise NotImplementedError
 
+  async def fetch_many(self, keys: List[str]) -> List[Any]:
+    """
+    Fetches values of multiple keys from cache in a single pass; generic fallback issuing
+    concurrent `fetch` calls for backends without native batch support
+
+    ---
+    :param:  keys  `List[str]` identifies key-value pairs
+    :returns:  `List[Any]`  values in the same order as given keys; `None` for missing keys
+    """
+    return list(await gather(*(self.fetch(key) for key in keys)))
+
+  async def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+    """
+    Puts multiple key-value pairs within the cache with the same time-to-live value; generic
+    fallback issuing concurrent `put` calls for backends without native batch support
+
+    ---
+    :param:  items  `Dict[str, Any]` key-value pairs to have stored
+    :param:  ttl  `int` time before values expire within cache; default: `None`
+    :returns:  `None`
+    """
+    await gather(*(self.put(key, value, ttl) for key, value in items.items()))
+
+  async def clear_many(self, keys: List[str]) -> int:
+    """
+    Clears multiple key-value pairs from cache; generic fallback issuing concurrent `clear` calls
+    for backends without native batch support
+
+    ---
+    :param:  keys  `List[str]` identifies key-value pairs to be cleared from cache
+    :returns:  `int`  amount of items cleared
+    """
+    return sum(await gather(*(self.clear(key=key) for key in keys)))
+
+  async def invalidate_tags(self, tags: List[str]) -> int:
+    """
+    Clears key-value pairs put with any of given tags; only backends recording tags on `put`,
+    "redis" and "valkey", support tag-based invalidation
+
+    ---
+    :param:  tags  `List[str]` identifies groups of key-value pairs to be cleared from cache
+    :returns:  `int`  amount of items cleared
+    """
+    raise NotImplementedError(f"{type(self).__name__} does not support tags.")
+
 
 __all__ = ("Backend",)
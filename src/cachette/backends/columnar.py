@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/backends/columnar.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-19 00:20
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining `ColumnarBackend` backend subclass keeping encoded values in a contiguous arena
+indexed by NumPy arrays of expiry times, offsets and lengths
+"""
+
+### Standard packages ###
+from asyncio import CancelledError, Task, ensure_future, sleep
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+### Third-party packages ###
+from numpy import array, concatenate, cumsum, flatnonzero, full, int64, ndarray, where, zeros
+
+### Local modules ###
+from cachette.backends import Backend
+from cachette.codecs import Codec
+
+### Arena smaller than this is never compacted inline, left for periodic compaction ###
+COMPACTION_THRESHOLD: int = 1 << 20
+
+
+class ColumnarBackend(Backend):
+  """
+  In-process store mapping keys onto slots of columnar arrays rather than one python object per
+  entry; expiry times, arena offsets and lengths of encoded values are kept in NumPy `int64`
+  arrays, free slots marked by negative expiry. Overwritten and removed values leave garbage in
+  the arena, compacted once it exceeds `compaction_ratio` of arena size. Expired slots are found
+  by one vectorized comparison every `expiration_interval` seconds in background after `open`,
+  and `fetch_many` checks expiry of all keys in bulk.
+  """
+
+  __slots__ = (
+    "arena",
+    "codec",
+    "compaction_ratio",
+    "expiration_interval",
+    "expires",
+    "free",
+    "garbage",
+    "keys",
+    "lengths",
+    "lock",
+    "offsets",
+    "slots",
+    "sweeper",
+    "ttl",
+  )
+
+  def __init__(
+    self,
+    codec: Codec,
+    ttl: int,
+    expiration_interval: Union[int, float] = 1.0,
+    compaction_ratio: float = 0.5,
+    capacity: int = 1024,
+  ) -> None:
+    self.codec = codec
+    self.compaction_ratio = compaction_ratio
+    self.expiration_interval = expiration_interval
+    self.ttl = ttl
+    self.arena: bytearray = bytearray()
+    self.expires: ndarray = full(capacity, -1, dtype=int64)
+    self.offsets: ndarray = zeros(capacity, dtype=int64)
+    self.lengths: ndarray = zeros(capacity, dtype=int64)
+    self.keys: List[Optional[str]] = [None] * capacity
+    self.free: List[int] = list(range(capacity - 1, -1, -1))
+    self.slots: Dict[str, int] = {}
+    self.garbage: int = 0
+    self.lock: Lock = Lock()
+    self.sweeper: Optional[Task] = None
+
+  @property
+  def size(self) -> int:
+    return len(self.slots)
+
+  def stats(self) -> Dict[str, int]:
+    """
+    Reports amount of entries and slots along with arena size and garbage awaiting compaction
+
+    ---
+    :returns:  `Dict[str, int]`  sizes keyed by name
+    """
+    return {
+      "arena": len(self.arena),
+      "capacity": len(self.keys),
+      "entries": len(self.slots),
+      "garbage": self.garbage,
+    }
+
+  ### Lifecycle ###
+  async def open(self) -> None:
+    if self.sweeper is None:
+      self.sweeper = ensure_future(self.sweep_periodically())
+
+  async def close(self) -> None:
+    if self.sweeper is not None:
+      sweeper: Task = self.sweeper
+      self.sweeper = None
+      sweeper.cancel()
+      try:
+        await sweeper
+      except CancelledError:
+        pass
+
+  async def sweep_periodically(self) -> None:
+    """
+    Frees expired slots and compacts arena until cancelled
+    """
+    while True:
+      await sleep(self.expiration_interval)
+      with self.lock:
+        self.sweep(self.now)
+        if self.garbage > self.compaction_ratio * len(self.arena):
+          self.compact()
+
+  ### Slots ###
+  def grow(self) -> None:
+    capacity: int = len(self.keys)
+    self.expires = concatenate((self.expires, full(capacity, -1, dtype=int64)))
+    self.offsets = concatenate((self.offsets, zeros(capacity, dtype=int64)))
+    self.lengths = concatenate((self.lengths, zeros(capacity, dtype=int64)))
+    self.keys.extend([None] * capacity)
+    self.free.extend(range(2 * capacity - 1, capacity - 1, -1))
+
+  def sweep(self, now: int) -> int:
+    """
+    Frees slots expired by now, found by one vectorized comparison over expiry times
+
+    ---
+    :param:  now  `int` current time in seconds
+    :returns:  `int`  amount of slots freed
+    """
+    expired: ndarray = flatnonzero((self.expires >= 0) & (self.expires < now))
+    if not len(expired):
+      return 0
+    self.garbage += int(self.lengths[expired].sum())
+    self.expires[expired] = -1
+    self.lengths[expired] = 0
+    for slot in expired.tolist():
+      del self.slots[self.keys[slot]]
+      self.keys[slot] = None
+      self.free.append(slot)
+    return len(expired)
+
+  def compact(self) -> None:
+    """
+    Rewrites arena with values of occupied slots only, in slot order, reclaiming garbage
+    """
+    occupied: ndarray = flatnonzero(self.expires >= 0)
+    lengths: ndarray = self.lengths[occupied]
+    view: memoryview = memoryview(self.arena)
+    arena: bytearray = bytearray().join(
+      view[offset : offset + length]
+      for offset, length in zip(self.offsets[occupied].tolist(), lengths.tolist())
+    )
+    view.release()
+    self.offsets[occupied] = cumsum(lengths) - lengths
+    self.arena = arena
+    self.garbage = 0
+
+  def discard(self, slot: int) -> None:
+    key: Optional[str] = self.keys[slot]
+    if key is not None:
+      del self.slots[key]
+    self.keys[slot] = None
+    self.garbage += int(self.lengths[slot])
+    self.expires[slot] = -1
+    self.lengths[slot] = 0
+    self.free.append(slot)
+
+  def read(self, slot: int) -> bytes:
+    offset: int = int(self.offsets[slot])
+    return bytes(self.arena[offset : offset + int(self.lengths[slot])])
+
+  def write(self, key: str, data: bytes, expires: int) -> None:
+    slot: Optional[int] = self.slots.get(key)
+    if slot is None:
+      if not self.free:
+        self.grow()
+      slot = self.free.pop()
+      self.slots[key] = slot
+      self.keys[slot] = key
+    else:
+      self.garbage += int(self.lengths[slot])
+    self.offsets[slot] = len(self.arena)
+    self.lengths[slot] = len(data)
+    self.expires[slot] = expires
+    self.arena += data
+    if self.garbage > max(self.compaction_ratio * len(self.arena), COMPACTION_THRESHOLD):
+      self.compact()
+
+  async def fetch(self, key: str) -> Any:
+    return (await self.fetch_with_ttl(key))[1]
+
+  async def fetch_with_ttl(self, key: str) -> Tuple[int, Any]:
+    now: int = self.now
+    with self.lock:
+      slot: Optional[int] = self.slots.get(key)
+      if slot is None:
+        return -1, None
+      expires: int = int(self.expires[slot])
+      if expires < now:
+        self.discard(slot)
+        return 0, None
+      data: bytes = self.read(slot)
+    return expires - now, self.codec.loads(data)
+
+  async def put(
+    self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[List[str]] = None
+  ) -> None:
+    if tags:
+      raise NotImplementedError(f"{type(self).__name__} does not support tags.")
+    data: bytes = self.codec.dumps(value)
+    with self.lock:
+      self.write(key, data, self.now + (ttl or self.ttl))
+
+  async def fetch_many(self, keys: List[str]) -> List[Any]:
+    now: int = self.now
+    with self.lock:
+      slots: ndarray = array([self.slots.get(key, -1) for key in keys], dtype=int64)
+      found: ndarray = slots >= 0
+      ### Missing keys index last slot, masked out right after ###
+      live: ndarray = found & (where(found, self.expires[slots], -1) >= now)
+      for slot in set(slots[found & ~live].tolist()):
+        self.discard(slot)
+      payloads: List[Optional[bytes]] = [
+        self.read(slot) if alive else None for slot, alive in zip(slots.tolist(), live.tolist())
+      ]
+    return [self.codec.loads(data) if data is not None else None for data in payloads]
+
+  async def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+    encoded: List[Tuple[str, bytes]] = [
+      (key, self.codec.dumps(value)) for key, value in items.items()
+    ]
+    with self.lock:
+      expires: int = self.now + (ttl or self.ttl)
+      for key, data in encoded:
+        self.write(key, data, expires)
+
+  async def clear_many(self, keys: List[str]) -> int:
+    count: int = 0
+    with self.lock:
+      for key in keys:
+        slot: Optional[int] = self.slots.get(key)
+        if slot is not None:
+          self.discard(slot)
+          count += 1
+    return count
+
+  async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+    if namespace:
+      prefix: str = f"{namespace}:"
+      with self.lock:
+        keys: List[str] = [key for key in self.slots if key.startswith(prefix)]
+      return await self.clear_many(keys)
+    elif key:
+      return await self.clear_many([key])
+    return 0
+
+
+__all__ = ("ColumnarBackend",)
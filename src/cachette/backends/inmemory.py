@@ -12,63 +12,522 @@
 """Module defining backend subclass used with In-memory key-value store"""
 
 ### Standard packages ###
-from typing import Any, Dict, List, Optional, Tuple
-
-### Third-party packages ###
-from pydantic import BaseModel, StrictBytes, StrictInt, StrictStr
+from asyncio import CancelledError, Task, ensure_future, sleep, to_thread
+from copy import copy, deepcopy
+from heapq import heapify, heappop, heappush
+from os.path import exists
+from threading import Lock
+from time import perf_counter, time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 ### Local modules ###
 from cachette.backends import Backend
 from cachette.codecs import Codec
+from cachette.objects import estimate_size, freeze, thaw, unwrapped
+from cachette.policies import Policy
+from cachette.policies.lru import LRUPolicy
+from cachette.snapshots import read_snapshot, write_snapshot
 
 
-class Value(BaseModel):
-  data: StrictBytes
-  expires: StrictInt
+class Value(object):
+  __slots__ = ("data", "expires", "size")
 
+  def __init__(self, data: Any, expires: int, size: int) -> None:
+    self.data = data
+    self.expires = expires
+    self.size = size
 
-class InMemoryBackend(Backend):
-  store: Dict[str, Value] = {}
 
-  def __init__(self, codec: Codec, ttl: StrictInt):
-    self.codec = codec
-    self.ttl = ttl
+def identity(obj: Any) -> Any:
+  return obj
+
+
+def portion(bound: Optional[int], shards: int, index: int) -> Optional[int]:
+  """
+  Splits bound across shards, spreading remainder over the first shards so that portions sum up
+  to bound exactly
+
+  ---
+  :param:  bound  `Optional[int]` bound of the entire store, if any
+  :param:  shards  `int` amount of shards
+  :param:  index  `int` position of shard
+  :returns:  `Optional[int]`  bound of shard at index
+  """
+  if bound is None:
+    return None
+  return bound // shards + (index < bound % shards)
+
+
+class Shard(object):
+  """
+  Partition of in-memory store with its own lock, eviction policy, namespace index and expiry
+  heap; methods expect the lock to be held by caller so that reads observing an expired entry
+  discard it atomically
+  """
+
+  __slots__ = (
+    "evictions",
+    "expiry",
+    "lock",
+    "max_bytes",
+    "max_entries",
+    "namespaces",
+    "nbytes",
+    "policy",
+    "store",
+    "tracked",
+  )
+
+  def __init__(
+    self,
+    policy: Policy,
+    max_bytes: Optional[int] = None,
+    max_entries: Optional[int] = None,
+    tracked: bool = False,
+  ) -> None:
+    self.lock: Lock = Lock()
+    self.max_bytes = max_bytes
+    self.max_entries = max_entries
+    self.policy = policy
+    self.store: Dict[str, Value] = {}
+    self.nbytes: int = 0
+    self.evictions: int = 0
+
+    ### Keys by each of their ":"-delimited prefixes ###
+    self.namespaces: Dict[str, Set[str]] = {}
+
+    ### Expiry times of keys kept only when expired entries are reclaimed actively ###
+    self.tracked = tracked
+    self.expiry: List[Tuple[int, str]] = []
+
+  def reclaim(self, now: int, deadline: float) -> int:
+    """
+    Pops expired entries off expiry heap until none remain or deadline passes
+
+    ---
+    :param:  now  `int` current time in seconds
+    :param:  deadline  `float` performance counter value after which reclaiming pauses
+    :returns:  `int`  amount of entries reclaimed
+    """
+    count: int = 0
+    popped: int = 0
+    while self.expiry and self.expiry[0][0] < now:
+      expires, key = heappop(self.expiry)
+      value: Optional[Value] = self.store.get(key)
+      ### Heap entries of overwritten or removed keys are left behind and skipped lazily ###
+      if value is not None and value.expires == expires:
+        self.discard(key)
+        count += 1
+      popped += 1
+      if popped % 64 == 0 and perf_counter() >= deadline:
+        break
+    return count
 
-  async def fetch(self, key: StrictStr) -> Any:
+  def get(self, key: str, now: int) -> Optional[Value]:
     value: Optional[Value] = self.store.get(key)
-    if not value:
+    if value is None:
+      return None
+    if value.expires < now:
+      self.discard(key)
+      return None
+    self.policy.touch(key)
+    return value
+
+  def set(self, key: str, data: Any, expires: int, size: int) -> None:
+    if self.max_bytes is not None and size > self.max_bytes:
+      self.discard(key)
+      self.evictions += 1
       return
-    elif value.expires < self.now:
-      del self.store[key]
+    previous: Optional[Value] = self.store.pop(key, None)
+    if previous is not None:
+      self.nbytes -= previous.size
+    ### Room is made before key is recorded so that policies never evict the key being put ###
+    known: bool = previous is not None
+    while (self.max_entries is not None and len(self.store) >= self.max_entries) or (
+      self.max_bytes is not None and self.nbytes + size > self.max_bytes
+    ):
+      victim: str = self.policy.evict()
+      if victim == key:
+        known = False
+        continue
+      self.nbytes -= self.store.pop(victim).size
+      self.unindex(victim)
+      self.evictions += 1
+    self.store[key] = Value(data=data, expires=expires, size=size)
+    self.nbytes += size
+    if known:
+      self.policy.touch(key)
     else:
-      return self.codec.loads(value.data)
+      self.policy.insert(key)
+    if previous is None:
+      self.index(key)
+    if self.tracked:
+      heappush(self.expiry, (expires, key))
+      if len(self.expiry) > 2 * len(self.store) + 1024:
+        self.expiry = [(value.expires, key) for key, value in self.store.items()]
+        heapify(self.expiry)
 
-  async def fetch_with_ttl(self, key: StrictStr) -> Tuple[int, Any]:
-    value: Optional[Value] = self.store.get(key)
-    if not value:
-      return -1, None
-    if value.expires < self.now:
-      del self.store[key]
-      return (0, None)
-    else:
-      return (value.expires - self.now, self.codec.loads(value.data))
+  def discard(self, key: str) -> bool:
+    value: Optional[Value] = self.store.pop(key, None)
+    if value is None:
+      return False
+    self.nbytes -= value.size
+    self.policy.remove(key)
+    self.unindex(key)
+    return True
+
+  def index(self, key: str) -> None:
+    position: int = key.find(":")
+    while position != -1:
+      namespace: str = key[:position]
+      keys: Optional[Set[str]] = self.namespaces.get(namespace)
+      if keys is None:
+        self.namespaces[namespace] = {key}
+      else:
+        keys.add(key)
+      position = key.find(":", position + 1)
+
+  def unindex(self, key: str) -> None:
+    position: int = key.find(":")
+    while position != -1:
+      namespace: str = key[:position]
+      keys: Set[str] = self.namespaces[namespace]
+      keys.discard(key)
+      if not keys:
+        del self.namespaces[namespace]
+      position = key.find(":", position + 1)
+
+
+class InMemoryBackend(Backend):
+  """
+  In-process store of encoded values, optionally bounded by amount of entries and by total size
+  of encoded values; entries are evicted as selected by eviction policy, least recently used
+  first by default, once either bound is reached. When `expiration_interval` is given, expired
+  entries are also reclaimed actively by a background task started on `open`, popping expiry
+  times off a min-heap in time slices bounded by `expiration_budget` seconds. Keys are indexed by
+  each of their ":"-delimited prefixes so that namespaces are counted and cleared without
+  scanning the entire store. When `object_mode` is given, values are kept as python objects
+  instead of encoded; read as shared "reference", "copy", "deepcopy" or "frozen" read-only view,
+  sized for bounds by `sizeof` estimate.
+
+  The store is partitioned by key hash into `shards`, each guarded by its own lock, so that
+  threads running sync endpoints or free-threaded interpreters may share one backend; encoding
+  and decoding happen outside of locks. Each shard holds an equal part of bounds and its own copy
+  of `policy`, eviction order is therefore kept per shard; keys hashed unevenly may have a shard
+  evict before the store as a whole reaches its bounds.
+
+  When `snapshot_path` is given, entries are restored from snapshot in background on `open` while
+  serving, and written to snapshot on `close`, sparing backing stores a refill after restarts.
+  """
+
+  __slots__ = (
+    "codec",
+    "dumps",
+    "expiration_budget",
+    "expiration_interval",
+    "loads",
+    "max_bytes",
+    "max_entries",
+    "object_mode",
+    "reaper",
+    "reclaim_seconds",
+    "reclaimed",
+    "restorer",
+    "shards",
+    "sizeof",
+    "snapshot_path",
+    "snapshot_skipped",
+    "ttl",
+  )
+
+  def __init__(
+    self,
+    codec: Codec,
+    ttl: int,
+    max_bytes: Optional[int] = None,
+    max_entries: Optional[int] = None,
+    policy: Optional[Policy] = None,
+    expiration_interval: Optional[Union[int, float]] = None,
+    expiration_budget: float = 0.001,
+    object_mode: Optional[str] = None,
+    sizeof: Optional[Callable[[Any], int]] = None,
+    shards: int = 1,
+    snapshot_path: Optional[str] = None,
+  ):
+    self.codec = codec
+    self.object_mode = object_mode
+    self.dumps: Callable[[Any], Any] = codec.dumps
+    self.loads: Callable[[Any], Any] = codec.loads
+    self.sizeof: Callable[[Any], int] = len
+    if object_mode is not None:
+      dumps: Callable[[Any], Any]
+      loads: Callable[[Any], Any]
+      dumps, loads = {
+        "copy": (copy, copy),
+        "deepcopy": (deepcopy, deepcopy),
+        "frozen": (freeze, identity),
+        "reference": (identity, identity),
+      }[object_mode]
+      self.dumps, self.loads = unwrapped(dumps), unwrapped(loads)
+      self.sizeof = sizeof or estimate_size
+    self.ttl = ttl
+    self.max_bytes = max_bytes
+    self.max_entries = max_entries
+    for name, bound in (("max_bytes", max_bytes), ("max_entries", max_entries)):
+      if bound is not None and bound < shards:
+        raise ValueError(f'The "{name}" value cannot be less than "shards".')
+    prototype: Policy = policy or LRUPolicy()
+    self.shards: Tuple[Shard, ...] = tuple(
+      Shard(
+        max_bytes=portion(max_bytes, shards, index),
+        max_entries=portion(max_entries, shards, index),
+        policy=prototype if index == 0 else deepcopy(prototype),
+        tracked=expiration_interval is not None,
+      )
+      for index in range(shards)
+    )
+
+    ### Active expiration ###
+    self.expiration_budget = expiration_budget
+    self.expiration_interval = expiration_interval
+    self.reaper: Optional[Task] = None
+    self.reclaimed: int = 0
+    self.reclaim_seconds: float = 0.0
+
+    ### Snapshots ###
+    self.restorer: Optional[Task] = None
+    self.snapshot_path = snapshot_path
+    self.snapshot_skipped: int = 0
 
-  async def put(self, key: StrictStr, value: StrictStr, ttl: Optional[StrictInt] = None) -> None:
-    data: bytes = self.codec.dumps(value)
+  @property
+  def size(self) -> int:
+    return sum(len(shard.store) for shard in self.shards)
+
+  def shard(self, key: str) -> Shard:
+    return self.shards[hash(key) % len(self.shards)]
+
+  def count(self, namespace: str) -> int:
+    """
+    Counts keys within namespace, expired keys not yet reclaimed included
+
+    ---
+    :param:  namespace  `str` identifies namespace, matching keys prefixed by namespace and ":"
+    :returns:  `int`  amount of keys within namespace
+    """
+    return sum(len(shard.namespaces.get(namespace, ())) for shard in self.shards)
+
+  def stats(self) -> Dict[str, float]:
+    """
+    Reports current size of the store, amount of entries evicted to stay within bounds, amount
+    of expired entries reclaimed actively along with reclaim throughput and amount of entries
+    left out of the last snapshot for not being picklable
+
+    ---
+    :returns:  `Dict[str, float]`  sizes and counters keyed by name
+    """
+    throughput: float = self.reclaimed / self.reclaim_seconds if self.reclaim_seconds else 0.0
+    return {
+      "bytes": sum(shard.nbytes for shard in self.shards),
+      "entries": self.size,
+      "evictions": sum(shard.evictions for shard in self.shards),
+      "reclaimed": self.reclaimed,
+      "reclaimed_per_second": throughput,
+      "snapshot_skipped": self.snapshot_skipped,
+    }
+
+  ### Lifecycle ###
+  async def open(self) -> None:
+    if self.expiration_interval is not None and self.reaper is None:
+      self.reaper = ensure_future(self.expire(self.expiration_interval))
+    if self.snapshot_path is not None and self.restorer is None and exists(self.snapshot_path):
+      self.restorer = ensure_future(self.restore(self.snapshot_path))
+
+  async def close(self) -> None:
+    if self.reaper is not None:
+      reaper: Task = self.reaper
+      self.reaper = None
+      reaper.cancel()
+      try:
+        await reaper
+      except CancelledError:
+        pass
+    if self.restorer is not None:
+      restorer: Task = self.restorer
+      self.restorer = None
+      ### Entries not yet restored would otherwise be left out of the next snapshot ###
+      try:
+        await restorer
+      except (OSError, ValueError):
+        pass
+    if self.snapshot_path is not None:
+      await self.snapshot(self.snapshot_path)
+
+  async def expire(self, interval: Union[int, float]) -> None:
+    """
+    Reclaims expired entries until cancelled, yielding to the event loop after each time slice
+
+    ---
+    :param:  interval  `Union[int, float]` seconds slept between time slices at most
+    """
+    while True:
+      started: float = perf_counter()
+      self.reclaim(self.now, started + self.expiration_budget)
+      self.reclaim_seconds += perf_counter() - started
+      delay: float = interval
+      for shard in self.shards:
+        if shard.expiry:
+          ### Entries expire once current time passes their expiry second ###
+          delay = min(delay, max(shard.expiry[0][0] + 1 - time(), 0.0))
+      await sleep(delay)
+
+  def reclaim(self, now: int, deadline: float) -> int:
+    """
+    Reclaims expired entries of each shard in turn until none remain or deadline passes
+
+    ---
+    :param:  now  `int` current time in seconds
+    :param:  deadline  `float` performance counter value after which reclaiming pauses
+    :returns:  `int`  amount of entries reclaimed
+    """
+    count: int = 0
+    for shard in self.shards:
+      with shard.lock:
+        count += shard.reclaim(now, deadline)
+      if perf_counter() >= deadline:
+        break
+    self.reclaimed += count
+    return count
+
+  ### Snapshots ###
+  async def snapshot(self, path: str) -> int:
+    """
+    Writes entries not yet expired along with their expiry times into snapshot file at path;
+    written in a worker thread and replaced atomically once complete. Frozen objects are thawed
+    before pickled; objects which cannot be pickled are left out, counted by `stats` as
+    "snapshot_skipped"
+
+    ---
+    :param:  path  `str` file-system path of snapshot
+    :returns:  `int`  amount of entries written
+    """
+    now: int = self.now
+    entries: List[Tuple[str, int, Any]] = []
+    for shard in self.shards:
+      with shard.lock:
+        entries.extend(
+          (key, value.expires, value.data)
+          for key, value in shard.store.items()
+          if value.expires >= now
+        )
+    writing: Iterable[Tuple[str, int, Any]] = entries
+    if self.object_mode == "frozen":
+      ### Thawed lazily as written by worker thread ###
+      thawing: Callable[[Any], Any] = unwrapped(thaw)
+      writing = ((key, expires, thawing(data)) for key, expires, data in entries)
+    count: int
+    count, self.snapshot_skipped = await to_thread(
+      write_snapshot, path, writing, self.object_mode is not None
+    )
+    return count
+
+  async def restore(self, path: str, batch: int = 1024) -> int:
+    """
+    Loads entries not yet expired from snapshot file at path, yielding to the event loop after
+    each batch so that requests are served meanwhile; keys put since are left untouched
+
+    ---
+    :param:  path  `str` file-system path of snapshot
+    :param:  batch  `int` amount of entries restored between yields; default: 1024
+    :returns:  `int`  amount of entries restored
+    """
+    objects: bool = self.object_mode is not None
+    entries: List[Tuple[str, int, Any]] = await to_thread(read_snapshot, path, self.now, objects)
+    count: int = 0
+    for index, (key, expires, data) in enumerate(entries):
+      if index % batch == batch - 1:
+        await sleep(0)
+      if objects:
+        data = self.dumps(data)
+      size: int = self.sizeof(data) if self.max_bytes is not None or not objects else 0
+      shard: Shard = self.shard(key)
+      with shard.lock:
+        if key not in shard.store and expires >= self.now:
+          shard.set(key, data, expires, size)
+          count += 1
+    return count
+
+  ### Store ###
+  def get(self, key: str, now: int) -> Optional[Value]:
+    shard: Shard = self.shard(key)
+    with shard.lock:
+      return shard.get(key, now)
+
+  def set(self, key: str, data: Any, expires: int) -> None:
+    ### Objects are only estimated when bounded by size, estimates may traverse entire objects ###
+    size: int = self.sizeof(data) if self.max_bytes is not None or self.object_mode is None else 0
+    shard: Shard = self.shard(key)
+    with shard.lock:
+      shard.set(key, data, expires, size)
+
+  def discard(self, key: str) -> bool:
+    shard: Shard = self.shard(key)
+    with shard.lock:
+      return shard.discard(key)
+
+  async def fetch(self, key: str) -> Any:
+    value: Optional[Value] = self.get(key, self.now)
+    if value is not None:
+      return self.loads(value.data)
+
+  async def fetch_with_ttl(self, key: str) -> Tuple[int, Any]:
+    now: int = self.now
+    shard: Shard = self.shard(key)
+    with shard.lock:
+      value: Optional[Value] = shard.store.get(key)
+      if not value:
+        return -1, None
+      if value.expires < now:
+        shard.discard(key)
+        return (0, None)
+      shard.policy.touch(key)
+    return (value.expires - now, self.loads(value.data))
+
+  async def put(
+    self, key: str, value: str, ttl: Optional[int] = None, tags: Optional[List[str]] = None
+  ) -> None:
+    if tags:
+      raise NotImplementedError(f"{type(self).__name__} does not support tags.")
+    self.set(key, self.dumps(value), self.now + (ttl or self.ttl))
+
+  async def fetch_many(self, keys: List[str]) -> List[Any]:
+    now: int = self.now
+    values: List[Any] = []
+    for key in keys:
+      value: Optional[Value] = self.get(key, now)
+      values.append(self.loads(value.data) if value is not None else None)
+    return values
+
+  async def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
     expires: int = self.now + (ttl or self.ttl)
-    self.store[key] = Value(data=data, expires=expires)
+    for key, value in items.items():
+      self.set(key, self.dumps(value), expires)
 
-  async def clear(
-    self, namespace: Optional[StrictStr] = None, key: Optional[StrictStr] = None
-  ) -> int:
+  async def clear_many(self, keys: List[str]) -> int:
     count: int = 0
-    if namespace:
-      keys: List[str] = list(filter(lambda key: key.startswith(namespace or ""), self.store.keys()))
-      for key in keys:
-        del self.store[key]
+    for key in keys:
+      if self.discard(key):
         count += 1
-    elif key and self.store.get(key):
-      del self.store[key]
+    return count
+
+  async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+    count: int = 0
+    if namespace:
+      for shard in self.shards:
+        with shard.lock:
+          for key in list(shard.namespaces.get(namespace, ())):
+            shard.discard(key)
+            count += 1
+    elif key and self.discard(key):
       count += 1
     return count
 
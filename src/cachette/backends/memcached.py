@@ -12,25 +12,65 @@
 """Module defining `MemcachedBackend` backend subclass used with Memcached key-value store"""
 
 ### Standard packages ###
-from typing import Any, Optional, Tuple
+from asyncio import gather, open_unix_connection
+from typing import Any, Dict, List, Optional, Tuple
 
 ### Third-party packages ###
 from aiomcache import Client
-from pydantic import BaseModel, StrictStr
+from aiomcache.pool import Connection, MemcachePool
 
 ### Local modules ###
 from cachette.backends import Backend
+from cachette.clients import LoopClients
 from cachette.codecs import Codec
 
 
-class MemcachedBackend(Backend, BaseModel):
-  class Config:
-    arbitrary_types_allowed: bool = True
+class UnixMemcachePool(MemcachePool):
+  """
+  Connection pool for co-located memcached listening on unix-domain socket path as host; aiomcache
+  only opens tcp connections, so that connection creation of pool built by client is overridden
+  as of aiomcache 0.8.2, the floor required by "memcached" extra
+  """
 
-  ### member vars ###
-  codec: Codec
-  memcached_host: StrictStr
-  ttl: int
+  async def _create_new_conn(self) -> Optional[Connection]:
+    if self.size() < self._maxsize:
+      reader, writer = await open_unix_connection(self._host, **self.conn_args)
+      if self.size() < self._maxsize:
+        return Connection(reader, writer)
+      reader.feed_eof()
+      writer.close()
+    return None
+
+
+class MemcachedBackend(Backend):
+  __slots__ = ("_clients", "codec", "max_connections", "memcached_host", "min_connections", "ttl")
+
+  def __init__(
+    self,
+    codec: Codec,
+    memcached_host: str,
+    ttl: int,
+    max_connections: Optional[int] = None,
+    min_connections: Optional[int] = None,
+  ) -> None:
+    ### member vars ###
+    self.codec = codec
+    self.memcached_host = memcached_host
+    self.ttl = ttl
+
+    ### Connection pool ###
+    self.max_connections = max_connections
+    self.min_connections = min_connections
+    self._clients: LoopClients[Client] = LoopClients()
+
+  async def open(self) -> None:
+    ### Pre-warm connection pool ###
+    await self.mcache.version()
+
+  async def close(self) -> None:
+    client: Optional[Client] = self._clients.pop()
+    if client is not None:
+      await client.close()
 
   async def fetch(self, key: str) -> Any:
     data: Optional[bytes] = await self.mcache.get(key.encode())
@@ -43,10 +83,37 @@ class MemcachedBackend(Backend, BaseModel):
       return 3600, self.codec.loads(data)
     return 0, None
 
-  async def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+  async def put(
+    self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[List[str]] = None
+  ) -> None:
+    if tags:
+      raise NotImplementedError(f"{type(self).__name__} does not support tags.")
     data: bytes = self.codec.dumps(value)
     await self.mcache.set(key.encode(), data, exptime=ttl or self.ttl)
 
+  async def fetch_many(self, keys: List[str]) -> List[Any]:
+    if not keys:
+      return []
+    ### Duplicate keys are rejected by `multi_get`; fetched once and mapped back in order ###
+    unique: List[str] = list(dict.fromkeys(keys))
+    datas: Tuple[Optional[bytes], ...] = await self.mcache.multi_get(
+      *(key.encode() for key in unique)
+    )
+    values: Dict[str, Any] = {
+      key: self.codec.loads(data) if data else None for key, data in zip(unique, datas)
+    }
+    return [values[key] for key in keys]
+
+  async def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+    ### No multi-set command on memcached; spread writes over pooled connections instead ###
+    exptime: int = ttl or self.ttl
+    await gather(
+      *(
+        self.mcache.set(key.encode(), self.codec.dumps(value), exptime=exptime)
+        for key, value in items.items()
+      )
+    )
+
   async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
     count: int = 0
     if namespace:
@@ -55,9 +122,34 @@ class MemcachedBackend(Backend, BaseModel):
       count += (0, 1)[await self.mcache.delete(key.encode())]
     return count
 
+  def connect(self) -> Client:
+    """
+    Creates client bound to a connection pool of its own; connects through unix-domain socket
+    when `memcached_host` is given as "unix://" url or absolute path.
+
+    ---
+    :returns:  `Client`  asynchronous client bound to new connection pool
+    """
+    pool_size: int = self.max_connections or 2
+    pool_minsize: int = min(self.min_connections or pool_size, pool_size)
+    if self.memcached_host.startswith(("unix://", "/")):
+      path: str = self.memcached_host.replace("unix://", "", 1)
+      client: Client = Client(host=path, port=0, pool_size=pool_size, pool_minsize=pool_minsize)
+      ### Pool built by client is kept, and closed along with it, opening unix connections ###
+      client._pool.__class__ = UnixMemcachePool
+      return client
+    return Client(host=self.memcached_host, pool_size=pool_size, pool_minsize=pool_minsize)
+
   @property
   def mcache(self) -> Client:
-    return Client(host=self.memcached_host)
+    """
+    Long-lived client sharing one connection pool across all operations on the running event
+    loop; created on first access from each loop, as by `asyncio.run` within sync endpoints
+
+    ---
+    :returns:  `Client`  asynchronous client bound to shared connection pool
+    """
+    return self._clients.get(self.connect)
 
 
 __all__ = ("MemcachedBackend",)
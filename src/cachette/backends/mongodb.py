@@ -12,7 +12,8 @@
 """Module defining backend subclass used with MongoDB key-value database"""
 
 ### Standard packages ###
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
+from warnings import warn
 
 ### Third-party packages ###
 from motor.motor_asyncio import (
@@ -20,63 +21,188 @@ from motor.motor_asyncio import (
   AsyncIOMotorCollection,
   AsyncIOMotorDatabase,
 )
-from pydantic import BaseModel, StrictInt, StrictStr
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure
+from pymongo.results import DeleteResult
 
 ### Local modules ###
 from cachette.backends import Backend
+from cachette.clients import LoopClients
 from cachette.codecs import Codec
 
 
-class MongoDBBackend(Backend, BaseModel):
-  class Config:
-    arbitrary_types_allowed: bool = True
+class MongoDBBackend(Backend):
+  __slots__ = (
+    "_clients",
+    "codec",
+    "compressors",
+    "database_name",
+    "max_connections",
+    "min_connections",
+    "server_selection_timeout",
+    "socket_connect_timeout",
+    "socket_timeout",
+    "table_name",
+    "ttl",
+    "url",
+  )
 
-  codec: Codec
-  database_name: StrictStr
-  table_name: StrictStr
-  ttl: StrictInt
-  url: StrictStr
+  def __init__(
+    self,
+    codec: Codec,
+    database_name: str,
+    table_name: str,
+    ttl: int,
+    url: str,
+    compressors: Optional[List[str]] = None,
+    max_connections: Optional[int] = None,
+    min_connections: Optional[int] = None,
+    server_selection_timeout: Optional[Union[int, float]] = None,
+    socket_connect_timeout: Optional[Union[int, float]] = None,
+    socket_timeout: Optional[Union[int, float]] = None,
+  ) -> None:
+    self.codec = codec
+    self.database_name = database_name
+    self.table_name = table_name
+    self.ttl = ttl
+    self.url = url
+
+    ### Connection pool ###
+    self.compressors = compressors
+    self.max_connections = max_connections
+    self.min_connections = min_connections
+    self.server_selection_timeout = server_selection_timeout
+    self.socket_connect_timeout = socket_connect_timeout
+    self.socket_timeout = socket_timeout
+    self._clients: LoopClients[AsyncIOMotorClient] = LoopClients()
+
+  def connect(self) -> AsyncIOMotorClient:
+    """
+    Creates motor client bound to a connection pool of its own, configured by pool options
+
+    ---
+    :returns:  `AsyncIOMotorClient`  asynchronous client bound to new connection pool
+    """
+    options: Dict[str, Any] = {}
+    if self.compressors:
+      options["compressors"] = ",".join(self.compressors)
+    if self.max_connections is not None:
+      options["maxPoolSize"] = self.max_connections
+    if self.min_connections is not None:
+      options["minPoolSize"] = self.min_connections
+    if self.server_selection_timeout is not None:
+      options["serverSelectionTimeoutMS"] = int(self.server_selection_timeout * 1000)
+    if self.socket_connect_timeout is not None:
+      options["connectTimeoutMS"] = int(self.socket_connect_timeout * 1000)
+    if self.socket_timeout is not None:
+      options["socketTimeoutMS"] = int(self.socket_timeout * 1000)
+    return AsyncIOMotorClient(self.url, **options)
+
+  @property
+  def client(self) -> AsyncIOMotorClient:
+    """
+    Long-lived motor client sharing one connection pool across all operations on the running
+    event loop; created on first access from each loop, as by `asyncio.run` within sync
+    endpoints, and released by `close`
+
+    ---
+    :returns:  `AsyncIOMotorClient`  asynchronous client bound to shared connection pool
+    """
+    return self._clients.get(self.connect)
 
   @property
   def db(self) -> AsyncIOMotorDatabase:
-    return AsyncIOMotorClient(self.url)[self.database_name]
+    return self.client[self.database_name]
 
   @property
   def collection(self) -> AsyncIOMotorCollection:
-    return AsyncIOMotorClient(self.url)[self.database_name][self.table_name]
+    return self.client[self.database_name][self.table_name]
 
   @classmethod
   async def init(
     cls,
     codec: Codec,
-    database_name: StrictStr,
-    table_name: StrictStr,
-    ttl: StrictInt,
-    url: StrictStr,
+    database_name: str,
+    table_name: str,
+    ttl: int,
+    url: str,
   ) -> "MongoDBBackend":
-    client: AsyncIOMotorClient = AsyncIOMotorClient(url)
+    backend: "MongoDBBackend" = cls(
+      codec=codec, database_name=database_name, table_name=table_name, ttl=ttl, url=url
+    )
+    await backend.open()
+    return backend
+
+  async def open(self) -> None:
     ### Create Collection if None existed ###
-    names: list = await client[database_name].list_collection_names(filter={"name": table_name})
+    names: list = await self.db.list_collection_names(filter={"name": self.table_name})
     if len(names) == 0:
-      await client[database_name].create_collection(table_name)
-    return cls(
-      **{
-        "codec": codec,
-        "database_name": database_name,
-        "table_name": table_name,
-        "ttl": ttl,
-        "url": url,
-      }
-    )
+      await self.db.create_collection(self.table_name)
+    ### Unique so that concurrent upserts of the same key cannot insert duplicate documents ###
+    try:
+      await self.collection.create_index("key", unique=True)
+    except OperationFailure as error:
+      ### Earlier versions left keys upserted concurrently twice (DuplicateKey) along with ###
+      ### a non-unique index (IndexOptionsConflict); duplicates are removed before reindex  ###
+      if error.code not in {11000, 85}:
+        raise
+      await self.deduplicate()
+      await self.reindex(replace=error.code == 85)
+
+  async def deduplicate(self) -> int:
+    """
+    Removes all but the latest expiring document of each key stored more than once
+
+    ---
+    :returns:  `int`  amount of documents removed
+    """
+    removed: int = 0
+    pipeline: List[Dict[str, Any]] = [
+      {"$sort": {"expires": -1}},
+      {"$group": {"_id": "$key", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+      {"$match": {"count": {"$gt": 1}}},
+    ]
+    async for group in self.collection.aggregate(pipeline, allowDiskUse=True):
+      result: DeleteResult = await self.collection.delete_many({"_id": {"$in": group["ids"][1:]}})
+      removed += result.deleted_count
+    return removed
 
-  async def fetch(self, key: StrictStr) -> Any:
+  async def reindex(self, replace: bool) -> None:
+    """
+    Creates unique index on keys once duplicates are removed, replacing non-unique index when
+    given; falls back to non-unique index should duplicates be put again in the meantime
+
+    ---
+    :param:  replace  `bool` whether non-unique index on keys exists and is to be dropped first
+    """
+    if replace:
+      await self.collection.drop_index("key_1")
+    try:
+      await self.collection.create_index("key", unique=True)
+    except OperationFailure as error:
+      if error.code != 11000:
+        if replace:
+          await self.collection.create_index("key")
+        raise
+      warn(
+        f'Keys of "{self.table_name}" collection are duplicated; indexed as non-unique.',
+        RuntimeWarning,
+      )
+      await self.collection.create_index("key")
+
+  async def close(self) -> None:
+    client: Optional[AsyncIOMotorClient] = self._clients.pop()
+    if client is not None:
+      client.close()
+
+  async def fetch(self, key: str) -> Any:
     document: dict = await self.collection.find_one({"key": key})
     if document and document.get("expires", 0) > self.now:
       value: bytes = document.get("value", None)
       return self.codec.loads(value)
     return None
 
-  async def fetch_with_ttl(self, key: StrictStr) -> Tuple[int, Any]:
+  async def fetch_with_ttl(self, key: str) -> Tuple[int, Any]:
     document: dict = await self.collection.find_one({"key": key})
     if document:
       value: bytes = document.get("value", None)
@@ -86,19 +212,52 @@ class MongoDBBackend(Backend, BaseModel):
       return ttl, self.codec.loads(value)
     return -1, None
 
-  async def put(self, key: StrictStr, value: Any, ttl: Optional[StrictInt] = None) -> None:
+  async def put(
+    self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[List[str]] = None
+  ) -> None:
+    if tags:
+      raise NotImplementedError(f"{type(self).__name__} does not support tags.")
     ttl = ttl or self.ttl
     data: bytes = self.codec.dumps(value)
     item: dict = {"key": key, "value": data, "expires": self.now + ttl}
-    document: dict = await self.collection.find_one({"key": key})
-    if document:
-      await self.collection.update_one({"key": key}, {"$set": item})
-    else:
-      await self.collection.insert_one(item)
+    await self.collection.update_one({"key": key}, {"$set": item}, upsert=True)
+
+  async def fetch_many(self, keys: List[str]) -> List[Any]:
+    if not keys:
+      return []
+    now: int = self.now
+    documents: Dict[str, bytes] = {
+      document["key"]: document.get("value", None)
+      async for document in self.collection.find({"key": {"$in": keys}, "expires": {"$gt": now}})
+    }
+    return [self.codec.loads(documents[key]) if key in documents else None for key in keys]
+
+  async def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+    if not items:
+      return
+    expires: int = self.now + (ttl or self.ttl)
+    await self.collection.bulk_write(
+      [
+        UpdateOne(
+          {"key": key},
+          {"$set": {"key": key, "value": self.codec.dumps(value), "expires": expires}},
+          upsert=True,
+        )
+        for key, value in items.items()
+      ],
+      ordered=False,
+    )
+
+  async def clear_many(self, keys: List[str]) -> int:
+    if not keys:
+      return 0
+    count: int = await self.collection.count_documents(
+      {"key": {"$in": keys}, "expires": {"$gt": self.now}}
+    )
+    await self.collection.delete_many({"key": {"$in": keys}})
+    return count
 
-  async def clear(
-    self, namespace: Optional[StrictStr] = None, key: Optional[StrictStr] = None
-  ) -> int:
+  async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
     count: int = 0
     if namespace:
       raise NotImplementedError
@@ -12,23 +12,35 @@
 
 ### Standard packages ###
 from pickle import load, dump
-from typing import Any, Dict, Optional, Tuple
-
-### Third-party packages ###
-from pydantic import BaseModel, StrictInt, StrictStr
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 ### Local modules ###
 from cachette.backends import Backend
 
 
-class Value(BaseModel):
-  data: Any
-  expires: StrictInt
+class Value(object):
+  __slots__ = ("data", "expires")
+
+  def __init__(self, data: Any, expires: int) -> None:
+    self.data = data
+    self.expires = expires
+
+  def __getstate__(self) -> Tuple[Any, int]:
+    return (self.data, self.expires)
+
+  def __setstate__(self, state: Union[Tuple[Any, int], Dict[str, Any]]) -> None:
+    if isinstance(state, dict):
+      ### Values pickled as pydantic models by earlier versions ###
+      state = (state["__dict__"]["data"], state["__dict__"]["expires"])
+    self.data, self.expires = state
 
 
-class PickleBackend(Backend, BaseModel):
-  pickle_path: StrictStr
-  ttl: StrictInt
+class PickleBackend(Backend):
+  __slots__ = ("pickle_path", "ttl")
+
+  def __init__(self, pickle_path: str, ttl: int) -> None:
+    self.pickle_path = pickle_path
+    self.ttl = ttl
 
   # def __init__(self, pickle_path: str, ttl: int) -> None:
   #     ### TODO: reimplement ###
@@ -71,11 +83,17 @@ class PickleBackend(Backend, BaseModel):
           with open(self.pickle_path, "wb") as f:
             dump(values, f)
           return (0, None)
-        return (value.expires, value.data) if value is not None else None
+        if value is None:
+          return (-1, None)
+        return (value.expires - self.now, value.data)
     except FileNotFoundError:
       return (0, None)
 
-  async def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+  async def put(
+    self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[List[str]] = None
+  ) -> None:
+    if tags:
+      raise NotImplementedError(f"{type(self).__name__} does not support tags.")
     values: Dict[str, Value]
     try:
       with open(self.pickle_path, "rb") as f:
@@ -86,6 +104,53 @@ class PickleBackend(Backend, BaseModel):
     with open(self.pickle_path, "wb") as f:
       dump(values, f)
 
+  async def fetch_many(self, keys: List[str]) -> List[Any]:
+    values: Dict[str, Value]
+    try:
+      with open(self.pickle_path, "rb") as f:
+        values = load(f) or {}
+    except FileNotFoundError:
+      return [None] * len(keys)
+    now: int = self.now
+    expired: List[str] = [
+      key for key in dict.fromkeys(keys) if key in values and values[key].expires < now
+    ]
+    if expired:
+      for key in expired:
+        values.pop(key)
+      with open(self.pickle_path, "wb") as f:
+        dump(values, f)
+    return [values[key].data if key in values else None for key in keys]
+
+  async def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+    values: Dict[str, Value]
+    try:
+      with open(self.pickle_path, "rb") as f:
+        values = load(f)
+    except FileNotFoundError:
+      values = {}
+    expires: int = self.now + (ttl or self.ttl)
+    for key, value in items.items():
+      values[key] = Value(data=value, expires=expires)
+    with open(self.pickle_path, "wb") as f:
+      dump(values, f)
+
+  async def clear_many(self, keys: List[str]) -> int:
+    values: Dict[str, Value]
+    try:
+      with open(self.pickle_path, "rb") as f:
+        values = load(f)
+    except FileNotFoundError:
+      return 0
+    now: int = self.now
+    cleared: int = 0
+    for key in keys:
+      if key in values and values.pop(key).expires >= now:
+        cleared += 1
+    with open(self.pickle_path, "wb") as f:
+      dump(values, f)
+    return cleared
+
   async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
     if namespace is not None:
       raise NotImplemented
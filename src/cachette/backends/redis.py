@@ -12,24 +12,149 @@
 """Module defining `RedisBackend` backend subclass used with Redis key-value store"""
 
 ### Standard packages ###
-from typing import Any, Optional, Tuple
+from hashlib import sha1
+from re import sub
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 ### Third-party packages ###
-from pydantic import BaseModel, StrictStr
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, ConnectionPool, Redis
+from redis.exceptions import NoScriptError
 
 ### Local modules ###
 from cachette.backends import Backend
+from cachette.clients import LoopClients
 from cachette.codecs import Codec
 
 
-class RedisBackend(Backend, BaseModel):
-  class Config:
-    arbitrary_types_allowed: bool = True
+class LuaScript:
+  """Lua source along with SHA1 digest by which it is invoked once loaded on server"""
 
-  codec: Codec
-  redis_url: StrictStr
-  ttl: int
+  __slots__ = ("sha", "source")
+
+  def __init__(self, source: str) -> None:
+    self.source = source
+    self.sha: str = sha1(source.encode()).hexdigest()
+
+
+### Reads remaining time-to-live and value of key at once ###
+FETCH_WITH_TTL: LuaScript = LuaScript("""
+local data = redis.call("GET", KEYS[1])
+if not data then
+  return {-1, false}
+end
+return {redis.call("TTL", KEYS[1]), data}
+""")
+
+### Scans and unlinks pages of keys server-side until cursor completes or time budget runs out ###
+SCAN_UNLINK: LuaScript = LuaScript("""
+local cursor = ARGV[1]
+local started = redis.call("TIME")
+local deadline = started[1] * 1000000 + started[2] + tonumber(ARGV[4])
+local unlinked = 0
+repeat
+  local page = redis.call("SCAN", cursor, "MATCH", ARGV[2], "COUNT", ARGV[3])
+  cursor = page[1]
+  if #page[2] > 0 then
+    unlinked = unlinked + redis.call("UNLINK", unpack(page[2]))
+  end
+  local now = redis.call("TIME")
+until cursor == "0" or now[1] * 1000000 + now[2] >= deadline
+return {cursor, unlinked}
+""")
+
+### Keys unlinked by each command pipelined after a page is scanned ###
+UNLINK_BATCH: int = 128
+
+### Sets of keys by tag, named by prefix and tag ###
+TAG_PREFIX: str = "cachette:tag:"
+
+### Puts value and records key in tag sets outliving it; prunes sampled members already gone ###
+PUT_TAGGED: LuaScript = LuaScript("""
+local ttl = tonumber(ARGV[2])
+redis.call("SET", KEYS[1], ARGV[1], "EX", ttl)
+for index = 2, #KEYS do
+  for _, member in ipairs(redis.call("SRANDMEMBER", KEYS[index], 2)) do
+    if redis.call("EXISTS", member) == 0 then
+      redis.call("SREM", KEYS[index], member)
+    end
+  end
+  redis.call("SADD", KEYS[index], KEYS[1])
+  if redis.call("TTL", KEYS[index]) < ttl then
+    redis.call("EXPIRE", KEYS[index], ttl)
+  end
+end
+""")
+
+### Unlinks keys recorded in tag sets along with the sets; returns amount of keys still present ###
+INVALIDATE_TAGS: LuaScript = LuaScript("""
+local unlinked = 0
+for index = 1, #KEYS do
+  local members = redis.call("SMEMBERS", KEYS[index])
+  for start = 1, #members, 128 do
+    local stop = math.min(start + 127, #members)
+    unlinked = unlinked + redis.call("UNLINK", unpack(members, start, stop))
+  end
+  redis.call("UNLINK", KEYS[index])
+end
+return unlinked
+""")
+
+
+class RedisBackend(Backend):
+  __slots__ = (
+    "_clients",
+    "codec",
+    "max_connections",
+    "namespace_scan_count",
+    "namespace_step_budget",
+    "redis_url",
+    "socket_connect_timeout",
+    "socket_keepalive",
+    "socket_timeout",
+    "ttl",
+  )
+
+  ### Scripts loaded once opened, then invoked by digests ###
+  scripts: Tuple[LuaScript, ...] = (FETCH_WITH_TTL, INVALIDATE_TAGS, PUT_TAGGED, SCAN_UNLINK)
+
+  def __init__(
+    self,
+    codec: Codec,
+    redis_url: str,
+    ttl: int,
+    max_connections: Optional[int] = None,
+    socket_connect_timeout: Optional[Union[int, float]] = None,
+    socket_keepalive: bool = False,
+    socket_timeout: Optional[Union[int, float]] = None,
+    namespace_scan_count: int = 1000,
+    namespace_step_budget: Optional[Union[int, float]] = None,
+  ) -> None:
+    self.codec = codec
+    self.redis_url = redis_url
+    self.ttl = ttl
+
+    ### Namespace clear ###
+    self.namespace_scan_count = namespace_scan_count
+    self.namespace_step_budget = namespace_step_budget
+
+    ### Connection pool ###
+    self.max_connections = max_connections
+    self.socket_connect_timeout = socket_connect_timeout
+    self.socket_keepalive = socket_keepalive
+    self.socket_timeout = socket_timeout
+    self._clients: LoopClients[Redis] = LoopClients()
+
+  async def open(self) -> None:
+    ### Pre-warm connection pool with a single connection ###
+    await self.redis.ping()
+    ### Loads scripts once per connection pool so that calls send digests rather than sources ###
+    for script in self.scripts:
+      await self.redis.script_load(script.source)
+
+  async def close(self) -> None:
+    client: Optional[Redis] = self._clients.pop()
+    if client is not None:
+      await client.connection_pool.disconnect()
 
   async def fetch(self, key: str) -> Any:
     data: bytes = await self.redis.get(key)
@@ -37,29 +162,170 @@ class RedisBackend(Backend, BaseModel):
       return self.codec.loads(data)
 
   async def fetch_with_ttl(self, key: str) -> Tuple[int, Any]:
-    async with self.redis.pipeline(transaction=True) as pipe:
-      data: bytes = await pipe.ttl(key).get(key).execute()
-      if data:
-        return self.codec.loads(data)
+    ttl: int
+    data: Optional[bytes]
+    ttl, data = await self.evalsha(FETCH_WITH_TTL, keys=[key])
+    if data:
+      return ttl, self.codec.loads(data)
     return -1, None
 
-  async def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+  async def put(
+    self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[List[str]] = None
+  ) -> None:
     data: bytes = self.codec.dumps(value)
-    await self.redis.set(key, data, ex=(ttl or self.ttl))
+    if tags:
+      ### Key and its tag sets are written atomically by one script ###
+      tag_keys: List[str] = [f"{TAG_PREFIX}{tag}" for tag in tags]
+      await self.evalsha(PUT_TAGGED, keys=[key, *tag_keys], args=[data, ttl or self.ttl])
+    else:
+      await self.redis.set(key, data, ex=(ttl or self.ttl))
+
+  async def invalidate_tags(self, tags: List[str]) -> int:
+    """
+    Unlinks keys put with any of given tags in one server-side step, costing amount of tagged
+    keys rather than a scan of the keyspace. Tag sets may hold keys already expired, removed or
+    overwritten without the tag; puts prune a sample of those and sets expire along with their
+    longest-lived key, while invalidation skips them.
+
+    ---
+    :param:  tags  `List[str]` identifies groups of keys to be cleared
+    :returns:  `int`  amount of keys unlinked
+    """
+    if not tags:
+      return 0
+    return await self.evalsha(INVALIDATE_TAGS, keys=[f"{TAG_PREFIX}{tag}" for tag in tags])
+
+  async def evalsha(
+    self, script: LuaScript, keys: Sequence[Any] = (), args: Sequence[Any] = (), **options: Any
+  ) -> Any:
+    """
+    Invokes script by its digest with `EVALSHA`; loads script with `SCRIPT LOAD` and retries
+    once when server replies `NOSCRIPT`, having had its script cache flushed or restarted since
+
+    ---
+    :param:  script  `LuaScript` script to be invoked
+    :param:  keys  `Sequence[Any]` keys accessed by script; default: `()`
+    :param:  args  `Sequence[Any]` arguments passed to script; default: `()`
+    :param:  options  `Any` options passed along to client, such as `target_nodes` on cluster
+    :returns:  `Any`  reply of script
+    """
+    ### Annotated here as client leaves `execute_command` untyped ###
+    execute: Callable[..., Awaitable[Any]] = self.redis.execute_command
+    try:
+      return await execute("EVALSHA", script.sha, len(keys), *keys, *args, **options)
+    except NoScriptError:
+      await execute("SCRIPT LOAD", script.source, **options)
+      return await execute("EVALSHA", script.sha, len(keys), *keys, *args, **options)
+
+  async def fetch_many(self, keys: List[str]) -> List[Any]:
+    if not keys:
+      return []
+    ### Replies are left undecoded by client, hence bytes ###
+    datas: List[Optional[bytes]] = cast(List[Optional[bytes]], await self.redis.mget(keys))
+    return [self.codec.loads(data) if data else None for data in datas]
+
+  async def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+    if not items:
+      return
+    ex: int = ttl or self.ttl
+    async with self.redis.pipeline(transaction=False) as pipe:
+      for key, value in items.items():
+        pipe.set(key, self.codec.dumps(value), ex=ex)
+      await pipe.execute()
+
+  async def clear_many(self, keys: List[str]) -> int:
+    if not keys:
+      return 0
+    return await self.redis.delete(*keys)
 
   async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
     if namespace:
-      lua: str = (
-        f'for i, key in ipairs(redis.call("KEYS", "{namespace}:*")) do redis.call("DEL", key); end'
-      )
-      return await self.redis.eval(lua, numkeys=0)
+      return await self.clear_namespace(namespace)
     elif key:
       return await self.redis.delete(key)
     return 0
 
+  async def clear_namespace(
+    self, namespace: str, progress: Optional[Callable[[int, int], Any]] = None
+  ) -> int:
+    """
+    Removes keys within namespace incrementally rather than walking the keyspace at once; each
+    step scans one page of `namespace_scan_count` keys with `SCAN MATCH` and unlinks them with
+    pipelined `UNLINK` batches, freed by the server in background. When `namespace_step_budget`
+    is given, each step runs server-side instead, scanning and unlinking pages until the budget
+    of seconds is spent, saving round-trips while bounding how long other clients are held up.
+
+    ---
+    :param:  namespace  `str` identifies namespace, matching keys prefixed by namespace and ":"
+    :param:  progress  `Callable[[int, int], Any]` invoked after each step with amount of steps
+      taken and keys unlinked so far; default: `None`
+    :returns:  `int`  amount of keys unlinked
+    """
+    ### Escapes glob-style wildcards so that namespace is matched literally ###
+    match: str = sub(r"([\\*?\[\]])", r"\\\1", namespace) + ":*"
+    cursor: int = 0
+    steps: int = 0
+    unlinked: int = 0
+    while True:
+      if self.namespace_step_budget is not None:
+        budget: int = int(self.namespace_step_budget * 1_000_000)
+        step: List[Any] = await self.evalsha(
+          SCAN_UNLINK, args=[cursor, match, self.namespace_scan_count, budget]
+        )
+        cursor, unlinked = int(step[0]), unlinked + step[1]
+      else:
+        keys: List[Union[bytes, str]]
+        cursor, keys = await self.redis.scan(cursor, match=match, count=self.namespace_scan_count)
+        if keys:
+          async with self.redis.pipeline(transaction=False) as pipe:
+            for start in range(0, len(keys), UNLINK_BATCH):
+              pipe.unlink(*keys[start : start + UNLINK_BATCH])
+            unlinked += sum(await pipe.execute())
+      steps += 1
+      if progress is not None:
+        progress(steps, unlinked)
+      if cursor == 0:
+        return unlinked
+
+  @property
+  def url(self) -> str:
+    return self.redis_url
+
+  def connect(self) -> Redis:
+    """
+    Creates client bound to a connection pool of its own, configured by pool options
+
+    ---
+    :returns:  `Redis`  asynchronous client bound to new connection pool
+    """
+    pool: ConnectionPool
+    if self.max_connections is not None:
+      pool = BlockingConnectionPool.from_url(
+        self.url,
+        max_connections=self.max_connections,
+        socket_connect_timeout=self.socket_connect_timeout,
+        socket_keepalive=self.socket_keepalive,
+        socket_timeout=self.socket_timeout,
+      )
+    else:
+      pool = ConnectionPool.from_url(
+        self.url,
+        socket_connect_timeout=self.socket_connect_timeout,
+        socket_keepalive=self.socket_keepalive,
+        socket_timeout=self.socket_timeout,
+      )
+    return Redis(connection_pool=pool)
+
   @property
   def redis(self) -> Redis:
-    return Redis.from_url(url=self.redis_url)
+    """
+    Long-lived client sharing one connection pool across all operations on the running event
+    loop; created on first access from each loop, as by `asyncio.run` within sync endpoints
+
+    ---
+    :returns:  `Redis`  asynchronous client bound to shared connection pool
+    """
+    return self._clients.get(self.connect)
 
 
 __all__ = ("RedisBackend",)
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/backends/redis_cluster.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-19 02:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Module defining `RedisClusterBackend` backend subclass used with Redis Cluster"""
+
+### Standard packages ###
+from asyncio import gather
+from re import sub
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+### Third-party packages ###
+from redis.asyncio import Redis
+from redis.asyncio.cluster import ClusterNode, RedisCluster
+
+### Local modules ###
+from cachette.backends.redis import SCAN_UNLINK, TAG_PREFIX, LuaScript, RedisBackend
+
+### Records key in one tag set outliving it; keys live on other slots so are not pruned ###
+TAG_KEY: LuaScript = LuaScript("""
+local ttl = tonumber(ARGV[2])
+redis.call("SADD", KEYS[1], ARGV[1])
+if redis.call("TTL", KEYS[1]) < ttl then
+  redis.call("EXPIRE", KEYS[1], ttl)
+end
+""")
+
+
+def hashtag(key: str) -> str:
+  """
+  Wraps namespace of key, the part before first ":", in braces so that Redis Cluster hashes
+  only the namespace and keeps all keys of one namespace on one slot; keys without namespace
+  or with braces in namespace are left as given
+
+  ---
+  :param:  key  `str` key as given by caller
+  :returns:  `str`  key as stored on cluster
+  """
+  namespace: str
+  separator: str
+  rest: str
+  namespace, separator, rest = key.partition(":")
+  if not separator or "{" in namespace or "}" in namespace:
+    return key
+  return f"{{{namespace}}}:{rest}"
+
+
+class RedisClusterBackend(RedisBackend):
+  """
+  Redis backend spread across primaries of a Redis Cluster, discovered from any node given by
+  url. Keys are stored with namespaces as hash-tags; batches are grouped by hash slot and sent
+  to the nodes owning them concurrently, and namespace clears scan every primary concurrently.
+  """
+
+  __slots__ = ()
+
+  ### Scripts loaded onto every primary once opened ###
+  scripts: Tuple[LuaScript, ...] = RedisBackend.scripts + (TAG_KEY,)
+
+  async def close(self) -> None:
+    client: Optional[Redis] = self._clients.pop()
+    if client is not None:
+      await cast(RedisCluster, client).aclose()
+
+  async def fetch(self, key: str) -> Any:
+    return await super().fetch(hashtag(key))
+
+  async def fetch_with_ttl(self, key: str) -> Tuple[int, Any]:
+    return await super().fetch_with_ttl(hashtag(key))
+
+  async def put(
+    self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[List[str]] = None
+  ) -> None:
+    key = hashtag(key)
+    ex: int = ttl or self.ttl
+    await self.cluster.set(key, self.codec.dumps(value), ex=ex)
+    if tags:
+      ### Tag sets hash onto other slots than key, each updated by its own script ###
+      await gather(
+        *(self.evalsha(TAG_KEY, keys=[f"{TAG_PREFIX}{tag}"], args=[key, ex]) for tag in tags)
+      )
+
+  async def invalidate_tags(self, tags: List[str]) -> int:
+    """
+    Unlinks keys put with any of given tags along with the tag sets; unlike single node, members
+    are read and unlinked in separate steps since they hash onto slots across the cluster, so
+    keys tagged in between may outlive invalidation.
+
+    ---
+    :param:  tags  `List[str]` identifies groups of keys to be cleared
+    :returns:  `int`  amount of keys unlinked
+    """
+    if not tags:
+      return 0
+    tag_keys: List[str] = [f"{TAG_PREFIX}{tag}" for tag in tags]
+    members: List[set] = await gather(*(self.cluster.smembers(tag_key) for tag_key in tag_keys))
+    keys: List[bytes] = list(set().union(*members))
+    unlinked: int = await self.cluster.unlink(*keys) if keys else 0
+    await self.cluster.unlink(*tag_keys)
+    return unlinked
+
+  async def fetch_many(self, keys: List[str]) -> List[Any]:
+    if not keys:
+      return []
+    ### Groups positions of keys by hash slot, fetched by one `MGET` each ###
+    slots: Dict[int, List[int]] = {}
+    hashtagged: List[str] = [hashtag(key) for key in keys]
+    for index, key in enumerate(hashtagged):
+      slots.setdefault(self.cluster.keyslot(key), []).append(index)
+    ### Cluster pipeline sends commands to each node owning the slots concurrently ###
+    async with self.cluster.pipeline(transaction=False) as pipe:
+      for indices in slots.values():
+        pipe.execute_command("MGET", *(hashtagged[index] for index in indices))
+      results: List[List[Optional[bytes]]] = await pipe.execute()
+    datas: List[Optional[bytes]] = [None] * len(keys)
+    for indices, result in zip(slots.values(), results):
+      for index, data in zip(indices, result):
+        datas[index] = data
+    return [self.codec.loads(data) if data else None for data in datas]
+
+  async def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+    await super().put_many({hashtag(key): value for key, value in items.items()}, ttl)
+
+  async def clear_many(self, keys: List[str]) -> int:
+    if not keys:
+      return 0
+    ### Split into one command per hash slot, sent concurrently ###
+    return await self.cluster.delete(*(hashtag(key) for key in keys))
+
+  async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+    if namespace:
+      return await self.clear_namespace(namespace)
+    elif key:
+      return await self.cluster.delete(hashtag(key))
+    return 0
+
+  async def clear_namespace(
+    self, namespace: str, progress: Optional[Callable[[int, int], Any]] = None
+  ) -> int:
+    """
+    Removes keys within namespace from every primary concurrently, each walked incrementally as
+    on single node; keys of one namespace share a slot, yet all primaries are scanned so that
+    keys amid slot migration or put with braces in namespace are cleared as well.
+
+    ---
+    :param:  namespace  `str` identifies namespace, matching keys prefixed by namespace and ":"
+    :param:  progress  `Callable[[int, int], Any]` invoked after each step on any primary with
+      amount of steps taken and keys unlinked so far across primaries; default: `None`
+    :returns:  `int`  amount of keys unlinked
+    """
+    ### Escapes glob-style wildcards so that namespace is matched literally ###
+    match: str = sub(r"([\\*?\[\]])", r"\\\1", hashtag(f"{namespace}:")) + "*"
+    totals: List[int] = [0, 0]
+    await self.cluster.initialize()
+
+    async def clear_node(node: ClusterNode) -> None:
+      cursor: int = 0
+      while True:
+        unlinked: int
+        if self.namespace_step_budget is not None:
+          budget: int = int(self.namespace_step_budget * 1_000_000)
+          step: List[Any] = await self.evalsha(
+            SCAN_UNLINK,
+            args=[cursor, match, self.namespace_scan_count, budget],
+            target_nodes=node,
+          )
+          cursor, unlinked = int(step[0]), step[1]
+        else:
+          ### Scans on target nodes report cursors keyed by node name, typed as on single node ###
+          scanned: Tuple[Any, List[Any]] = await self.cluster.scan(
+            cursor, match=match, count=self.namespace_scan_count, target_nodes=node
+          )
+          cursors: Dict[str, int] = scanned[0]
+          keys: List[Any] = scanned[1]
+          cursor = cursors[node.name]
+          unlinked = await self.cluster.unlink(*keys) if keys else 0
+        totals[0] += 1
+        totals[1] += unlinked
+        if progress is not None:
+          progress(*totals)
+        if cursor == 0:
+          return
+
+    await gather(*(clear_node(node) for node in self.cluster.get_primaries()))
+    return totals[1]
+
+  def connect(self) -> Redis:
+    """
+    Creates cluster client keeping one connection pool per node, discovering slots and nodes of
+    the cluster once opened; typed as single node client for commands shared with `RedisBackend`,
+    both exposing the same command methods with the cluster routing each by key
+
+    ---
+    :returns:  `Redis`  asynchronous cluster client routing commands to nodes owning keys
+    """
+    return cast(
+      Redis,
+      RedisCluster.from_url(
+        self.url,
+        socket_connect_timeout=self.socket_connect_timeout,
+        socket_keepalive=self.socket_keepalive,
+        socket_timeout=self.socket_timeout,
+        **({"max_connections": self.max_connections} if self.max_connections else {}),
+      ),
+    )
+
+  @property
+  def cluster(self) -> RedisCluster:
+    """
+    Long-lived cluster client of the running event loop, same as `redis` typed as cluster client
+
+    ---
+    :returns:  `RedisCluster`  asynchronous client routing commands to nodes owning keys
+    """
+    return cast(RedisCluster, self.redis)
+
+
+__all__ = ("RedisClusterBackend",)
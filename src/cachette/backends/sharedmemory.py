@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/backends/sharedmemory.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 22:20
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining `SharedMemoryBackend` backend subclass storing encoded values in a memory-mapped
+hash table shared by all worker processes on the same host
+"""
+
+### Standard packages ###
+from fcntl import LOCK_EX, LOCK_UN, lockf
+from hashlib import blake2b
+from mmap import mmap
+from os import O_CREAT, O_RDWR, close, fstat, ftruncate, open as open_fd, pread, pwrite
+from struct import Struct
+from threading import Lock
+from typing import Any, Iterator, List, Optional, Tuple
+from zlib import crc32
+
+### Local modules ###
+from cachette.backends import Backend
+from cachette.codecs import Codec
+
+### Table header; magic, layout version, amount of slots and size of each slot ###
+HEADER: Struct = Struct("<8sIII")
+MAGIC: bytes = b"CACHETTE"
+OFFSET: int = 64
+
+### Slot header; sequence, checksum, key digest, expiry, key length and value length ###
+SLOT: Struct = Struct("<IIQIHI")
+SEQUENCE: Struct = Struct("<I")
+CHECKED: Struct = Struct("<QI")
+
+### Attempts at reading a slot consistently while being written concurrently ###
+RETRIES: int = 16
+
+
+class SharedMemoryBackend(Backend):
+  """
+  Open-addressing hash table of fixed-size slots in a memory-mapped file, `/dev/shm` on Linux
+  being memory-backed. Keys hash onto groups of `probes` consecutive slots; a put takes the slot
+  of the same key, else an empty or expired slot, else the slot expiring soonest in the group.
+
+  Reads take no lock: each slot carries a sequence counter, odd while being written, and a
+  checksum; a read retries until it observes the same even sequence before and after copying
+  the slot and a matching checksum. Writes lock their group only, using `fcntl` byte-range locks
+  shared across processes. Values larger than a slot are not stored.
+  """
+
+  __slots__ = (
+    "_fd",
+    "_lock",
+    "_table",
+    "codec",
+    "groups",
+    "path",
+    "probes",
+    "slot_size",
+    "slots",
+    "ttl",
+  )
+
+  def __init__(
+    self,
+    codec: Codec,
+    path: str,
+    ttl: int,
+    slots: int = 65536,
+    slot_size: int = 1024,
+    probes: int = 8,
+  ) -> None:
+    self.codec = codec
+    self.path = path
+    self.probes = probes
+    self.slot_size = slot_size
+    self.slots = slots - slots % probes
+    self.groups = self.slots // probes
+    self.ttl = ttl
+    ### Descriptor of table file, -1 until table is mapped ###
+    self._fd: int = -1
+    self._lock: Lock = Lock()
+    self._table: Optional[mmap] = None
+
+  @property
+  def table(self) -> mmap:
+    """
+    Memory-mapped table, created and sized on first access by whichever process comes first
+
+    ---
+    :returns:  `mmap`  shared mapping of the table
+    """
+    if self._table is None:
+      size: int = OFFSET + self.slots * self.slot_size
+      fd: int = open_fd(self.path, O_RDWR | O_CREAT, 0o600)
+      layout: Tuple[bytes, int, int, int] = (MAGIC, 1, self.slots, self.slot_size)
+      lockf(fd, LOCK_EX)
+      try:
+        if fstat(fd).st_size == 0:
+          ftruncate(fd, size)
+          pwrite(fd, HEADER.pack(*layout), 0)
+        matched: bool = HEADER.unpack(pread(fd, HEADER.size, 0)) == layout
+      finally:
+        lockf(fd, LOCK_UN)
+      if not matched:
+        close(fd)
+        raise ValueError(f'Shared memory table at "{self.path}" has different slot layout.')
+      self._fd = fd
+      self._table = mmap(fd, size)
+    return self._table
+
+  async def open(self) -> None:
+    self.table
+
+  async def close(self) -> None:
+    if self._table is not None:
+      table: mmap = self._table
+      self._table = None
+      table.close()
+      close(self._fd)
+      self._fd = -1
+
+  ### Table ###
+  @staticmethod
+  def digest(key: bytes) -> int:
+    ### Stable across processes unlike builtin `hash` ###
+    return int.from_bytes(blake2b(key, digest_size=8).digest(), "little") or 1
+
+  def offsets(self, digest: int) -> Iterator[int]:
+    start: int = OFFSET + (digest % self.groups) * self.probes * self.slot_size
+    return iter(range(start, start + self.probes * self.slot_size, self.slot_size))
+
+  def read(self, key: bytes, digest: int, offset: int) -> Optional[Tuple[int, bytes]]:
+    table: mmap = self.table
+    for _ in range(RETRIES):
+      sequence: int = SEQUENCE.unpack_from(table, offset)[0]
+      if sequence & 1:
+        continue
+      _, checksum, key_hash, expires, key_length, value_length = SLOT.unpack_from(table, offset)
+      if key_hash != digest:
+        return None
+      start: int = offset + SLOT.size
+      end: int = start + key_length + value_length
+      if end > offset + self.slot_size:
+        continue
+      payload: bytes = table[start:end]
+      if SEQUENCE.unpack_from(table, offset)[0] != sequence:
+        continue
+      if crc32(payload, crc32(CHECKED.pack(key_hash, expires))) != checksum:
+        continue
+      if payload[:key_length] != key:
+        return None
+      return expires, payload[key_length:]
+    return None
+
+  def name(self, offset: int) -> Optional[bytes]:
+    """
+    Reads key held by slot without locking, retried while slot is being written
+
+    ---
+    :param:  offset  `int` offset of slot within table
+    :returns:  `Optional[bytes]`  encoded key; `None` when slot is vacant or kept being written
+    """
+    table: mmap = self.table
+    for _ in range(RETRIES):
+      sequence: int = SEQUENCE.unpack_from(table, offset)[0]
+      if sequence & 1:
+        continue
+      key_length: int = SLOT.unpack_from(table, offset)[4]
+      if SLOT.size + key_length > self.slot_size:
+        continue
+      name: bytes = table[offset + SLOT.size : offset + SLOT.size + key_length]
+      if SEQUENCE.unpack_from(table, offset)[0] == sequence:
+        return name or None
+    return None
+
+  def lookup(self, key: str) -> Optional[Tuple[int, bytes]]:
+    encoded: bytes = key.encode()
+    digest: int = self.digest(encoded)
+    for offset in self.offsets(digest):
+      record: Optional[Tuple[int, bytes]] = self.read(encoded, digest, offset)
+      if record is not None:
+        return record
+    return None
+
+  def write(self, key: str, data: Optional[bytes], expires: int = 0) -> bool:
+    """
+    Writes encoded value into slot of key, or empties slot of key when data is `None`
+
+    ---
+    :param:  key  `str` identifies key-value pair
+    :param:  data  `bytes` encoded value; `None` to remove key
+    :param:  expires  `int` expiry time in seconds
+    :returns:  `bool`  whether a live value of key was replaced or removed
+    """
+    table: mmap = self.table
+    encoded: bytes = key.encode()
+    digest: int = self.digest(encoded)
+    offsets: Tuple[int, ...] = tuple(self.offsets(digest))
+    now: int = self.now
+    with self._lock:
+      lockf(self._fd, LOCK_EX, 1, offsets[0])
+      try:
+        target: Optional[int] = None
+        replaced: bool = False
+        vacant: Optional[int] = None
+        soonest: Tuple[int, int] = (1 << 32, offsets[0])
+        for offset in offsets:
+          _, _, key_hash, slot_expires, key_length, _ = SLOT.unpack_from(table, offset)
+          name: bytes = table[offset + SLOT.size : offset + SLOT.size + key_length]
+          if key_hash == digest and name == encoded:
+            target, replaced = offset, slot_expires >= now
+            break
+          if vacant is None and (key_length == 0 or slot_expires < now):
+            vacant = offset
+          soonest = min(soonest, (slot_expires, offset))
+        oversized: bool = data is not None and SLOT.size + len(encoded) + len(data) > self.slot_size
+        if data is None or oversized:
+          if target is not None:
+            self.store(table, target, 0, 0, b"")
+          return replaced
+        if target is None:
+          target = vacant if vacant is not None else soonest[1]
+        self.store(table, target, digest, expires, encoded, data)
+        return replaced
+      finally:
+        lockf(self._fd, LOCK_UN, 1, offsets[0])
+
+  @staticmethod
+  def store(
+    table: mmap,
+    offset: int,
+    digest: int,
+    expires: int,
+    key: bytes,
+    data: bytes = b"",
+  ) -> None:
+    ### Odd sequence marks slot as being written for lock-free readers ###
+    sequence: int = SEQUENCE.unpack_from(table, offset)[0]
+    SEQUENCE.pack_into(table, offset, (sequence + 1) & 0xFFFFFFFF)
+    payload: bytes = key + data
+    checksum: int = crc32(payload, crc32(CHECKED.pack(digest, expires)))
+    table[offset + SLOT.size : offset + SLOT.size + len(payload)] = payload
+    SLOT.pack_into(
+      table, offset, (sequence + 1) & 0xFFFFFFFF, checksum, digest, expires, len(key), len(data)
+    )
+    SEQUENCE.pack_into(table, offset, (sequence + 2) & 0xFFFFFFFF)
+
+  async def fetch(self, key: str) -> Any:
+    record: Optional[Tuple[int, bytes]] = self.lookup(key)
+    if record is not None and record[0] >= self.now:
+      return self.codec.loads(record[1])
+
+  async def fetch_with_ttl(self, key: str) -> Tuple[int, Any]:
+    record: Optional[Tuple[int, bytes]] = self.lookup(key)
+    if record is None:
+      return -1, None
+    now: int = self.now
+    if record[0] < now:
+      return 0, None
+    return record[0] - now, self.codec.loads(record[1])
+
+  async def put(
+    self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[List[str]] = None
+  ) -> None:
+    if tags:
+      raise NotImplementedError(f"{type(self).__name__} does not support tags.")
+    self.write(key, self.codec.dumps(value), self.now + (ttl or self.ttl))
+
+  async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+    count: int = 0
+    if namespace:
+      ### Keys are only reachable by digest, namespaces require scanning every slot ###
+      prefix: bytes = f"{namespace}:".encode()
+      for offset in range(OFFSET, OFFSET + self.slots * self.slot_size, self.slot_size):
+        name: Optional[bytes] = self.name(offset)
+        if name is None or not name.startswith(prefix):
+          continue
+        try:
+          decoded: str = name.decode()
+        except UnicodeDecodeError:
+          ### Sequence wrapped around amid read; slot left for next clear ###
+          continue
+        if self.write(decoded, None):
+          count += 1
+    elif key and self.write(key, None):
+      count += 1
+    return count
+
+
+__all__ = ("SharedMemoryBackend",)
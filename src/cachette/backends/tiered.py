@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/backends/tiered.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 17:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining `TieredBackend` backend subclass keeping a bounded in-process near-cache of
+decoded values in front of a remote backend
+"""
+
+### Standard packages ###
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
+
+### Local modules ###
+from cachette.backends import Backend
+
+
+class TieredBackend(Backend):
+  """
+  Two-tier backend reading through a bounded in-process L1 of values decoded from L2, evicted in
+  least-recently-used order, in front of remote L2 backend. Writes go to L2 and drop L1 entries,
+  refilled by the next read, so that L1 never holds objects as given by callers. L1 entries live
+  for `near_cache_ttl` seconds at most, capped by remaining time-to-live of the remote entry; writes
+  made by other processes may therefore be observed late by that much. Remaining time-to-live of
+  the remote entry is kept alongside each L1 entry and reported on L1 hits. L1 hands the very same
+  object to every caller, so that mutating a fetched value alters what others fetch until expiry,
+  whereas L2 decodes a fresh copy on each read.
+  """
+
+  __slots__ = (
+    "backend",
+    "l1_hits",
+    "l1_misses",
+    "l2_hits",
+    "l2_misses",
+    "max_entries",
+    "near_cache_ttl",
+    "store",
+    "ttl",
+  )
+
+  def __init__(self, backend: Backend, near_cache_ttl: float, max_entries: int = 1024) -> None:
+    self.backend = backend
+    self.max_entries = max_entries
+    self.near_cache_ttl = near_cache_ttl
+    self.ttl = backend.ttl
+    ### Entries hold expiry on L1, expiry on L2 or -1 when unknown, and decoded value ###
+    self.store: "OrderedDict[str, Tuple[float, float, Any]]" = OrderedDict()
+    self.l1_hits: int = 0
+    self.l1_misses: int = 0
+    self.l2_hits: int = 0
+    self.l2_misses: int = 0
+
+  def stats(self) -> Dict[str, Dict[str, int]]:
+    """
+    Reports hit and miss counts of each tier; every L1 miss is looked up on L2
+
+    ---
+    :returns:  `Dict[str, Dict[str, int]]`  hits and misses keyed by tier
+    """
+    return {
+      "l1": {"hits": self.l1_hits, "misses": self.l1_misses},
+      "l2": {"hits": self.l2_hits, "misses": self.l2_misses},
+    }
+
+  ### Near-cache ###
+  def near(self, key: str) -> Tuple[float, Any]:
+    entry: Optional[Tuple[float, float, Any]] = self.store.get(key)
+    if entry is None:
+      return -1.0, None
+    if entry[0] <= monotonic():
+      del self.store[key]
+      return -1.0, None
+    self.store.move_to_end(key)
+    return entry[1], entry[2]
+
+  def remember(self, key: str, value: Any, ttl: Optional[float] = None, exact: bool = True) -> None:
+    if value is None:
+      self.store.pop(key, None)
+      return
+    lifetime: float = self.near_cache_ttl if ttl is None else min(self.near_cache_ttl, ttl)
+    if lifetime <= 0:
+      self.store.pop(key, None)
+      return
+    now: float = monotonic()
+    remote: float = now + ttl if exact and ttl is not None else -1.0
+    self.store[key] = (now + lifetime, remote, value)
+    self.store.move_to_end(key)
+    while len(self.store) > self.max_entries:
+      self.store.popitem(last=False)
+
+  ### Lifecycle ###
+  async def open(self) -> None:
+    await self.backend.open()
+
+  async def close(self) -> None:
+    self.store.clear()
+    await self.backend.close()
+
+  async def fetch(self, key: str) -> Any:
+    value: Any = self.near(key)[1]
+    if value is not None:
+      self.l1_hits += 1
+      return value
+    return (await self.fetch_remote(key))[1]
+
+  async def fetch_with_ttl(self, key: str) -> Tuple[int, Any]:
+    remote: float
+    value: Any
+    remote, value = self.near(key)
+    if value is not None and remote >= 0:
+      self.l1_hits += 1
+      return max(int(remote - monotonic()), 0), value
+    ### Remaining time-to-live on L2 unknown for entries remembered from batch reads ###
+    return await self.fetch_remote(key)
+
+  async def fetch_remote(self, key: str) -> Tuple[int, Any]:
+    self.l1_misses += 1
+    ttl: int
+    ttl, value = await self.backend.fetch_with_ttl(key)
+    if value is None:
+      self.l2_misses += 1
+    else:
+      self.l2_hits += 1
+      self.remember(key, value, ttl if ttl >= 0 else None)
+    return ttl, value
+
+  async def put(
+    self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[List[str]] = None
+  ) -> None:
+    await self.backend.put(key, value, ttl, tags)
+    self.store.pop(key, None)
+
+  async def fetch_many(self, keys: List[str]) -> List[Any]:
+    values: List[Any] = [self.near(key)[1] for key in keys]
+    missing: List[int] = [index for index, value in enumerate(values) if value is None]
+    self.l1_hits += len(keys) - len(missing)
+    self.l1_misses += len(missing)
+    if missing:
+      ### Remaining time-to-live unknown from batch reads; cap by configured remote ttl instead ###
+      fetched: List[Any] = await self.backend.fetch_many([keys[index] for index in missing])
+      for index, value in zip(missing, fetched):
+        values[index] = value
+        if value is None:
+          self.l2_misses += 1
+        else:
+          self.l2_hits += 1
+          self.remember(keys[index], value, self.ttl, exact=False)
+    return values
+
+  async def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+    await self.backend.put_many(items, ttl)
+    for key in items:
+      self.store.pop(key, None)
+
+  async def clear_many(self, keys: List[str]) -> int:
+    for key in keys:
+      self.store.pop(key, None)
+    return await self.backend.clear_many(keys)
+
+  async def invalidate_tags(self, tags: List[str]) -> int:
+    ### Tags are only known remotely; drops entire near-cache instead ###
+    self.store.clear()
+    return await self.backend.invalidate_tags(tags)
+
+  async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+    if namespace:
+      prefix: str = f"{namespace}:"
+      for near_key in [near_key for near_key in self.store if near_key.startswith(prefix)]:
+        del self.store[near_key]
+    elif key:
+      self.store.pop(key, None)
+    return await self.backend.clear(namespace, key)
+
+
+__all__ = ("TieredBackend",)
@@ -12,54 +12,44 @@
 """Module defining `ValkeyBackend` backend subclass used with Valkey key-value store"""
 
 ### Standard packages ###
-from typing import Any, Optional, Tuple
-
-### Third-party packages ###
-from pydantic import BaseModel, StrictStr
-from redis.asyncio import Redis
+from typing import Optional, Union
 
 ### Local modules ###
-from cachette.backends import Backend
+from cachette.backends.redis import RedisBackend
 from cachette.codecs import Codec
 
 
-class ValkeyBackend(Backend, BaseModel):
-  class Config:
-    arbitrary_types_allowed: bool = True
-
-  codec: Codec
-  ttl: int
-  valkey_url: StrictStr
-
-  async def fetch(self, key: str) -> Any:
-    data: bytes = await self.redis.get(key)
-    if data:
-      return self.codec.loads(data)
-
-  async def fetch_with_ttl(self, key: str) -> Tuple[int, Any]:
-    async with self.redis.pipeline(transaction=True) as pipe:
-      data: bytes = await pipe.ttl(key).get(key).execute()
-      if data:
-        return self.codec.loads(data)
-    return -1, None
-
-  async def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-    data: bytes = self.codec.dumps(value)
-    await self.redis.set(key, data, ex=(ttl or self.ttl))
-
-  async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
-    if namespace:
-      lua: str = (
-        f'for i, key in ipairs(redis.call("KEYS", "{namespace}:*")) do redis.call("DEL", key); end'
-      )
-      return await self.redis.eval(lua, numkeys=0)
-    elif key:
-      return await self.redis.delete(key)
-    return 0
+class ValkeyBackend(RedisBackend):
+  __slots__ = ("valkey_url",)
+
+  def __init__(
+    self,
+    codec: Codec,
+    valkey_url: str,
+    ttl: int,
+    max_connections: Optional[int] = None,
+    socket_connect_timeout: Optional[Union[int, float]] = None,
+    socket_keepalive: bool = False,
+    socket_timeout: Optional[Union[int, float]] = None,
+    namespace_scan_count: int = 1000,
+    namespace_step_budget: Optional[Union[int, float]] = None,
+  ) -> None:
+    super().__init__(
+      codec=codec,
+      max_connections=max_connections,
+      namespace_scan_count=namespace_scan_count,
+      namespace_step_budget=namespace_step_budget,
+      redis_url="",
+      socket_connect_timeout=socket_connect_timeout,
+      socket_keepalive=socket_keepalive,
+      socket_timeout=socket_timeout,
+      ttl=ttl,
+    )
+    self.valkey_url = valkey_url
 
   @property
-  def redis(self) -> Redis:
-    return Redis.from_url(url=self.valkey_url.replace("valkey://", "redis://"))
+  def url(self) -> str:
+    return self.valkey_url.replace("valkey://", "redis://")
 
 
 __all__ = ("ValkeyBackend",)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/backends/valkey_cluster.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-19 02:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Module defining `ValkeyClusterBackend` backend subclass used with Valkey Cluster"""
+
+### Standard packages ###
+from typing import Optional, Union
+
+### Local modules ###
+from cachette.backends.redis_cluster import RedisClusterBackend
+from cachette.codecs import Codec
+
+
+class ValkeyClusterBackend(RedisClusterBackend):
+  __slots__ = ("valkey_url",)
+
+  def __init__(
+    self,
+    codec: Codec,
+    valkey_url: str,
+    ttl: int,
+    max_connections: Optional[int] = None,
+    socket_connect_timeout: Optional[Union[int, float]] = None,
+    socket_keepalive: bool = False,
+    socket_timeout: Optional[Union[int, float]] = None,
+    namespace_scan_count: int = 1000,
+    namespace_step_budget: Optional[Union[int, float]] = None,
+  ) -> None:
+    super().__init__(
+      codec=codec,
+      max_connections=max_connections,
+      namespace_scan_count=namespace_scan_count,
+      namespace_step_budget=namespace_step_budget,
+      redis_url="",
+      socket_connect_timeout=socket_connect_timeout,
+      socket_keepalive=socket_keepalive,
+      socket_timeout=socket_timeout,
+      ttl=ttl,
+    )
+    self.valkey_url = valkey_url
+
+  @property
+  def url(self) -> str:
+    return self.valkey_url.replace("valkey://", "redis://")
+
+
+__all__ = ("ValkeyClusterBackend",)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/clients.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-19 03:20
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining `LoopClients` keeping pooled clients of remote backends per event loop, since
+connections of asynchronous clients are bound to the loop they were opened on
+"""
+
+### Standard packages ###
+from asyncio import AbstractEventLoop, get_running_loop
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
+
+Client = TypeVar("Client")
+
+
+class LoopClients(Generic[Client]):
+  """
+  Clients keyed by the event loop they were created on; callers running `asyncio.run` from sync
+  endpoints or worker threads each get a client of their own, and clients of loops closed since
+  are dropped as new ones are created
+  """
+
+  __slots__ = ("clients",)
+
+  def __init__(self) -> None:
+    self.clients: Dict[AbstractEventLoop, Client] = {}
+
+  def get(self, factory: Callable[[], Client]) -> Client:
+    """
+    Returns client of the running event loop, created by factory on first access from loop
+
+    ---
+    :param:  factory  `Callable[[], Client]` creates client bound to shared connection pool
+    :returns:  `Client`  client of the running event loop
+    """
+    loop: AbstractEventLoop = get_running_loop()
+    client: Optional[Client] = self.clients.get(loop)
+    if client is None:
+      self.prune()
+      client = self.clients[loop] = factory()
+    return client
+
+  def pop(self) -> Optional[Client]:
+    """
+    Forgets client of the running event loop so that it may be closed, along with clients of
+    loops closed since
+
+    ---
+    :returns:  `Optional[Client]`  client of the running event loop if created
+    """
+    self.prune()
+    return self.clients.pop(get_running_loop(), None)
+
+  def prune(self) -> None:
+    ### Connections of closed loops cannot be awaited any longer; left to garbage collection ###
+    closed: List[AbstractEventLoop] = [loop for loop in self.clients if loop.is_closed()]
+    for loop in closed:
+      del self.clients[loop]
+
+
+__all__ = ("LoopClients",)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/codecs/envelope.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 16:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining `EnvelopeCodec` codec wrapper storing soft-expiry timestamp alongside payload
+encoded by wrapped codec, used when serving stale values while revalidating
+"""
+
+### Standard packages ###
+from struct import Struct
+from typing import Any
+
+### Local modules ###
+from cachette.codecs import Codec
+
+### Marker followed by soft-expiry timestamp as big-endian double ###
+HEADER: Struct = Struct(">3sd")
+MAGIC: bytes = b"\xcaSW"
+
+
+class Envelope(object):
+  __slots__ = ("expires", "value")
+
+  def __init__(self, value: Any, expires: float) -> None:
+    self.expires = expires
+    self.value = value
+
+  def __getstate__(self) -> tuple:
+    return (self.value, self.expires)
+
+  def __setstate__(self, state: tuple) -> None:
+    self.value, self.expires = state
+
+
+class EnvelopeCodec(Codec):
+  def __init__(self, codec: Codec) -> None:
+    self.codec = codec
+
+  def dumps(self, obj: Any) -> bytes:
+    if isinstance(obj, Envelope):
+      return HEADER.pack(MAGIC, obj.expires) + self.codec.dumps(obj.value)
+    return self.codec.dumps(obj)
+
+  def loads(self, data: bytes) -> Any:
+    if data[: len(MAGIC)] == MAGIC and len(data) >= HEADER.size:
+      expires: float = HEADER.unpack_from(data)[1]
+      return Envelope(self.codec.loads(data[HEADER.size :]), expires)
+    ### Values put before stale-while-revalidate mode was enabled ###
+    return self.codec.loads(data)
+
+
+__all__ = ("Envelope", "EnvelopeCodec")
@@ -12,94 +12,374 @@
 """Module containing Core implementation for Cachette extension for FastAPI"""
 
 ### Standard packages ###
-from asyncio import run
-from typing import Any, Optional, Tuple
+from asyncio import Task, ensure_future, get_running_loop, shield, to_thread
+from contextlib import asynccontextmanager
+from functools import wraps
+from inspect import BoundArguments, Signature, isawaitable, iscoroutinefunction, signature
+from math import log
+from random import random
+from threading import Lock
+from time import perf_counter, time
+from types import TracebackType
+from typing import (
+  Any,
+  AsyncIterator,
+  Awaitable,
+  Callable,
+  ClassVar,
+  Dict,
+  List,
+  Optional,
+  Set,
+  Tuple,
+  Type,
+  Union,
+)
 
 ### Local modules ###
 from cachette.backends import Backend
 from cachette.cachette_config import CachetteConfig
 from cachette.codecs import Codec
+from cachette.codecs.envelope import Envelope, EnvelopeCodec
+from cachette.key_builders import KeyBuilder, default_key_builder
+from cachette.policies import Policy
 
 
 class Cachette(CachetteConfig):
+  __slots__ = ("backend",)
   backend: Backend
 
+  ### Process-wide registry of backend built from the currently loaded configuration ###
+  _registry: ClassVar[Optional[Tuple[int, Backend]]] = None
+  _registry_lock: ClassVar[Lock] = Lock()
+
+  ### Backends replaced once configuration is loaded again, awaiting to be closed ###
+  _closing: ClassVar[Set[Task]] = set()
+  _retired: ClassVar[List[Backend]] = []
+
+  ### Tasks computing missing values, coalescing concurrent misses of the same key ###
+  _inflight: ClassVar[Dict[str, Task]] = {}
+
+  ### Most recent recomputation durations in seconds by key, weighting early expiration ###
+  _deltas: ClassVar[Dict[str, float]] = {}
+  _deltas_limit: ClassVar[int] = 4096
+
+  ### Loaders refreshing stale values in background, registered by key ###
+  _loaders: ClassVar[Dict[str, Tuple[Callable[[], Union[Any, Awaitable[Any]]], Optional[int]]]] = {}
+
   def __init__(self):
     """
-    Invoked by FastAPI Depends
+    Invoked by FastAPI Depends; returns a lightweight handle to the backend shared across requests
     """
     # TODO Check request headers if `Cache-Control`` is `no-store`
+    self.backend = self.shared_backend()
+
+  @classmethod
+  def shared_backend(cls) -> Backend:
+    """
+    Returns the backend instance shared process-wide, building codec and backend only once
+    per loaded configuration; rebuilt after `load_config` is invoked again, with the replaced
+    backend closed by way of `retire`.
+
+    ---
+    :returns:  `Backend`  shared backend instance
+    """
+    registry: Optional[Tuple[int, Backend]] = cls._registry
+    if registry is not None and registry[0] == cls._revision:
+      return registry[1]
+    with cls._registry_lock:
+      previous: Optional[Tuple[int, Backend]] = cls._registry
+      registry = previous
+      if registry is None or registry[0] != cls._revision:
+        revision: int = cls._revision
+        registry = (revision, cls.build_backend(cls.build_codec()))
+        cls._registry = registry
+        if previous is not None:
+          cls.retire(previous[1])
+    return registry[1]
+
+  @classmethod
+  def retire(cls, backend: Backend) -> None:
+    """
+    Closes backend replaced after configuration is loaded again, releasing its connection pools,
+    stopping its background tasks and writing its snapshot. Closing is scheduled on the running
+    event loop; outside of one, backend is kept until `open` or `close` is next awaited, since
+    connection pools can only be drained from within an event loop.
+
+    ---
+    :param:  backend  `Backend` backend no longer shared
+    """
+    try:
+      get_running_loop()
+    except RuntimeError:
+      cls._retired.append(backend)
+      return
+    task: Task = ensure_future(cls.close_retired(backend))
+    cls._closing.add(task)
+    task.add_done_callback(cls._closing.discard)
+
+  @classmethod
+  def drain_retired(cls) -> List[Backend]:
+    with cls._registry_lock:
+      retired: List[Backend] = cls._retired
+      cls._retired = []
+    return retired
+
+  @staticmethod
+  async def close_retired(*backends: Backend) -> None:
+    for backend in backends:
+      try:
+        await backend.close()
+      except Exception:
+        ### Backend may be bound to an event loop already closed; nothing left to release ###
+        pass
 
-    ### Determine Encoding and Decoding Codec ###
+  @classmethod
+  def build_codec(cls) -> Codec:
+    """
+    Determine Encoding and Decoding Codec from loaded configuration
+
+    ---
+    :returns:  `Codec`  codec instance used to encode and decode values
+    """
     codec: Codec
-    if self._codec == "csv":
+    if cls._codec == "csv":
       from cachette.codecs.dataframe.csv import CSVCodec
 
       codec = CSVCodec()
-    elif self._codec == "json":
+    elif cls._codec == "json":
       from cachette.codecs.json import JSONCodec
 
       codec = JSONCodec()
-    elif self._codec == "feather":
+    elif cls._codec == "feather":
       from cachette.codecs.dataframe.feather import FeatherCodec
 
       codec = FeatherCodec()
-    elif self._codec == "msgpack":
+    elif cls._codec == "msgpack":
       from cachette.codecs.msgpack import MsgpackCodec
 
       codec = MsgpackCodec()
-    if self._codec == "orjson":
+    elif cls._codec == "orjson":
       from cachette.codecs.orjson import ORJSONCodec
 
       codec = ORJSONCodec()
-    elif self._codec == "parquet":
+    elif cls._codec == "parquet":
       from cachette.codecs.dataframe.parquet import ParquetCodec
 
       codec = ParquetCodec()
-    elif self._codec == "pickle":
+    elif cls._codec == "pickle":
       from cachette.codecs.pickle import PickleCodec
 
       codec = PickleCodec()
-    elif self._codec == "vanilla":
+    elif cls._codec == "vanilla":
       from cachette.codecs.vanilla import VanillaCodec
 
       codec = VanillaCodec()
+    if cls._stale_ttl is not None:
+      ### Stores soft-expiry timestamp alongside payload; serves stale values while revalidating ###
+      codec = EnvelopeCodec(codec)
+    return codec
+
+  @classmethod
+  def value_codec(cls) -> Optional[Codec]:
+    """
+    Determines codec values put are encoded with and fetched values decoded with
+
+    ---
+    :returns:  `Optional[Codec]`  codec from loaded configuration; `None` when backend keeps
+      python objects as given, such as "pickle" backend or "inmemory" backend in object mode
+    """
+    if cls._backend == "pickle" or (cls._backend == "inmemory" and cls._object_mode is not None):
+      return None
+    return cls.build_codec()
+
+  @classmethod
+  def build_policy(cls) -> Policy:
+    """
+    Determine eviction policy of in-memory backend from loaded configuration
+
+    ---
+    :returns:  `Policy`  policy instance selecting entries to be evicted
+    """
+    policy: Policy
+    if cls._eviction_policy == "arc":
+      from cachette.policies.arc import ARCPolicy
+
+      policy = ARCPolicy()
+    elif cls._eviction_policy == "lfu":
+      from cachette.policies.lfu import LFUPolicy
+
+      policy = LFUPolicy()
+    elif cls._eviction_policy == "lru":
+      from cachette.policies.lru import LRUPolicy
 
-    if self._backend == "inmemory":
+      policy = LRUPolicy()
+    elif cls._eviction_policy == "s3fifo":
+      from cachette.policies.s3fifo import S3FIFOPolicy
+
+      policy = S3FIFOPolicy()
+    elif cls._eviction_policy == "tinylfu":
+      from cachette.policies.tinylfu import TinyLFUPolicy
+
+      policy = TinyLFUPolicy()
+    return policy
+
+  @classmethod
+  def build_backend(cls, codec: Codec) -> Backend:
+    """
+    Instantiate backend from loaded configuration
+
+    ---
+    :param:  codec  `Codec` codec instance used to encode and decode values
+    :returns:  `Backend`  backend instance
+    """
+    backend: Backend
+    if cls._backend == "columnar":
+      from cachette.backends.columnar import ColumnarBackend
+
+      backend = ColumnarBackend(
+        codec=codec, expiration_interval=cls._expiration_interval or 1.0, ttl=cls._ttl
+      )
+    elif cls._backend == "inmemory":
       from cachette.backends.inmemory import InMemoryBackend
 
-      self.backend = InMemoryBackend(codec=codec, ttl=self._ttl)
-    elif self._backend == "memcached":
+      backend = InMemoryBackend(
+        codec=codec,
+        expiration_interval=cls._expiration_interval,
+        max_bytes=cls._max_bytes,
+        max_entries=cls._max_entries,
+        object_mode=cls._object_mode,
+        policy=cls.build_policy(),
+        shards=cls._shards,
+        sizeof=cls._object_sizeof,
+        snapshot_path=cls._snapshot_path,
+        ttl=cls._ttl,
+      )
+    elif cls._backend == "memcached":
       from cachette.backends.memcached import MemcachedBackend
 
-      self.backend = MemcachedBackend(
-        codec=codec, memcached_host=self._memcached_host, ttl=self._ttl
+      backend = MemcachedBackend(
+        codec=codec,
+        max_connections=cls._max_connections,
+        memcached_host=cls._memcached_host,
+        min_connections=cls._min_connections,
+        ttl=cls._ttl,
       )
-    elif self._backend == "mongodb":
+    elif cls._backend == "mongodb":
       from cachette.backends.mongodb import MongoDBBackend
 
-      self.backend = run(
-        MongoDBBackend.init(
-          codec,
-          self._database_name,
-          self._table_name,
-          self._ttl,
-          self._mongodb_url,
-        )
+      backend = MongoDBBackend(
+        codec=codec,
+        compressors=cls._mongodb_compressors,
+        database_name=cls._database_name,
+        max_connections=cls._max_connections,
+        min_connections=cls._min_connections,
+        server_selection_timeout=cls._mongodb_server_selection_timeout,
+        socket_connect_timeout=cls._socket_connect_timeout,
+        socket_timeout=cls._socket_timeout,
+        table_name=cls._table_name,
+        ttl=cls._ttl,
+        url=cls._mongodb_url,
       )
-    elif self._backend == "pickle":
+    elif cls._backend == "pickle":
       from cachette.backends.pickle import PickleBackend
 
       ### Ignore codec when pickle backend is chosen ###
-      self.backend = PickleBackend(pickle_path=self._pickle_path, ttl=self._ttl)
-    elif self._backend == "redis":
+      backend = PickleBackend(pickle_path=cls._pickle_path, ttl=cls._ttl)
+    elif cls._backend == "redis":
       from cachette.backends.redis import RedisBackend
 
-      self.backend = RedisBackend(codec=codec, redis_url=self._redis_url, ttl=self._ttl)
-    elif self._backend == "valkey":
+      redis_backend: Type[RedisBackend] = RedisBackend
+      if cls._cluster:
+        from cachette.backends.redis_cluster import RedisClusterBackend
+
+        redis_backend = RedisClusterBackend
+      backend = redis_backend(
+        codec=codec,
+        max_connections=cls._max_connections,
+        namespace_scan_count=cls._namespace_scan_count,
+        namespace_step_budget=cls._namespace_step_budget,
+        redis_url=cls._redis_url,
+        socket_connect_timeout=cls._socket_connect_timeout,
+        socket_keepalive=cls._socket_keepalive,
+        socket_timeout=cls._socket_timeout,
+        ttl=cls._ttl,
+      )
+    elif cls._backend == "sharedmemory":
+      from cachette.backends.sharedmemory import SharedMemoryBackend
+
+      backend = SharedMemoryBackend(
+        codec=codec,
+        path=cls._shared_memory_path,
+        slot_size=cls._shared_memory_slot_size,
+        slots=cls._shared_memory_slots,
+        ttl=cls._ttl,
+      )
+    elif cls._backend == "valkey":
       from cachette.backends.valkey import ValkeyBackend
 
-      self.backend = ValkeyBackend(codec=codec, ttl=self._ttl, valkey_url=self._valkey_url)
+      ### Both subclasses take "valkey_url" in place of "redis_url" ###
+      valkey_backend: Callable[..., Backend] = ValkeyBackend
+      if cls._cluster:
+        from cachette.backends.valkey_cluster import ValkeyClusterBackend
+
+        valkey_backend = ValkeyClusterBackend
+      backend = valkey_backend(
+        codec=codec,
+        max_connections=cls._max_connections,
+        namespace_scan_count=cls._namespace_scan_count,
+        namespace_step_budget=cls._namespace_step_budget,
+        socket_connect_timeout=cls._socket_connect_timeout,
+        socket_keepalive=cls._socket_keepalive,
+        socket_timeout=cls._socket_timeout,
+        ttl=cls._ttl,
+        valkey_url=cls._valkey_url,
+      )
+    if cls._near_cache_ttl is not None and cls._backend not in {"columnar", "inmemory"}:
+      from cachette.backends.tiered import TieredBackend
+
+      backend = TieredBackend(backend, cls._near_cache_ttl, cls._near_cache_max_entries)
+    return backend
+
+  ### Lifecycle ###
+  async def open(self) -> None:
+    """
+    Opens connection pools of the shared backend; to be awaited on application startup
+    """
+    await self.close_retired(*self.drain_retired())
+    await self.backend.open()
+
+  async def close(self) -> None:
+    """
+    Drains connection pools of the shared backend; to be awaited on application shutdown
+    """
+    await self.close_retired(*self.drain_retired())
+    await self.backend.close()
+
+  async def __aenter__(self) -> "Cachette":
+    await self.open()
+    return self
+
+  async def __aexit__(
+    self,
+    exc_type: Optional[Type[BaseException]],
+    exc_value: Optional[BaseException],
+    traceback: Optional[TracebackType],
+  ) -> None:
+    await self.close()
+
+  @classmethod
+  @asynccontextmanager
+  async def lifespan(cls, app: Any = None) -> AsyncIterator[None]:
+    """
+    Lifespan context manager opening backend on startup and closing it on shutdown;
+    compatible with FastAPI, Litestar and Starlette `lifespan` arguments.
+
+    ---
+    :param:  app  `Any` application instance passed by the framework; unused; default: `None`
+    """
+    async with cls():
+      yield
 
   ### Override methods to initiated backend instance ###
   async def fetch(self, key: str) -> Any:
@@ -109,7 +389,7 @@ class Cachette(CachetteConfig):
     ---
     :param:  key  `str` identifies key-value pair
     """
-    return await self.backend.fetch(key)
+    return self.revalidate(key, await self.backend.fetch(key))
 
   async def fetch_with_ttl(self, key: str) -> Tuple[int, Any]:
     """
@@ -119,9 +399,16 @@ class Cachette(CachetteConfig):
     :param:  key  `str` identifies key-value pair
     :returns:  `Tuple[int, str]`  containing timetolive value (ttl) and value
     """
-    return await self.backend.fetch_with_ttl(key)
+    remaining: int
+    value: Any
+    remaining, value = await self.backend.fetch_with_ttl(key)
+    if isinstance(value, Envelope):
+      remaining = max(0, int(value.expires - time()))
+    return remaining, self.revalidate(key, value)
 
-  async def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+  async def put(
+    self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[List[str]] = None
+  ) -> None:
     """
     Puts the value within the cache with key and assigned time-to-live value
 
@@ -129,8 +416,23 @@ class Cachette(CachetteConfig):
     :param:  key  `str` identifies key-value pair
     :param:  value  `Any` value to have stored identified by key
     :param:  ttl  `int` time before value expires within cache; default: `None`
+    :param:  tags  `List[str]` groups key is invalidated along with by `invalidate_tags`;
+      supported by "redis" and "valkey" backends; default: `None`
+    """
+    if self._stale_ttl is not None:
+      ttl = ttl or self._ttl
+      value, ttl = Envelope(value, time() + ttl), ttl + self._stale_ttl
+    await self.backend.put(key, value, ttl, tags)
+
+  async def invalidate_tags(self, tags: List[str]) -> int:
     """
-    await self.backend.put(key, value, ttl)
+    Clears all key-value pairs put with any of given tags
+
+    ---
+    :param:  tags  `List[str]` identifies groups of key-value pairs to be cleared from cache
+    :returns:  `int`  amount of items cleared
+    """
+    return await self.backend.invalidate_tags(tags)
 
   async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
     """
@@ -143,5 +445,259 @@ class Cachette(CachetteConfig):
     """
     return await self.backend.clear(namespace, key)
 
+  async def fetch_or_compute(
+    self,
+    key: str,
+    loader: Callable[[], Union[Any, Awaitable[Any]]],
+    ttl: Optional[int] = None,
+    skip_if: Optional[Callable[[Any], bool]] = None,
+  ) -> Any:
+    """
+    Fetches the value from cache; on cache miss, computes the value with given loader and puts it
+    within the cache. Concurrent misses of the same key within the process share one single
+    in-flight computation, its result handed to every waiter and written to the cache once.
+    When `early_expiration_beta` is configured, cache hits may be recomputed ahead of expiry
+    as decided by `expires_early`; when `stale_ttl` is configured, stale hits are returned
+    right away while recomputed in background.
+
+    ---
+    :param:  key  `str` identifies key-value pair
+    :param:  loader  `Callable` sync or async callable without arguments computing missing value
+    :param:  ttl  `int` time before computed value expires within cache; default: `None`
+    :param:  skip_if  `Callable` predicate on computed value to leave it uncached; default: `None`
+    :returns:  `Any`  cached or freshly computed value
+    """
+    value: Any
+    remaining: int = -1
+    if self._early_expiration_beta is None:
+      value = await self.backend.fetch(key)
+    else:
+      remaining, value = await self.backend.fetch_with_ttl(key)
+    if isinstance(value, Envelope):
+      if value.expires <= time():
+        return self.revalidate(key, value, loader, ttl, skip_if)
+      remaining = int(value.expires - time())
+      value = value.value
+    if value is not None and not self.expires_early(key, remaining):
+      return value
+    return await self.compute(key, loader, ttl, skip_if)
+
+  def expires_early(self, key: str, remaining: int) -> bool:
+    """
+    Decides whether a cached value should be recomputed ahead of its expiry following
+    probabilistic early expiration (XFetch); the probability rises as remaining time-to-live
+    shrinks and as the last measured recomputation of the key grows longer, spreading
+    recomputations of hot keys over time instead of synchronizing them at expiry.
+
+    ---
+    :param:  key  `str` identifies key-value pair
+    :param:  remaining  `int` remaining time-to-live of cached value; negative when unknown
+    :returns:  `bool`  whether value should be recomputed now
+    """
+    delta: Optional[float] = self._deltas.get(key)
+    if self._early_expiration_beta is None or delta is None or remaining < 0:
+      return False
+    return -delta * self._early_expiration_beta * log(1.0 - random()) >= remaining
+
+  async def compute(
+    self,
+    key: str,
+    loader: Callable[[], Union[Any, Awaitable[Any]]],
+    ttl: Optional[int] = None,
+    skip_if: Optional[Callable[[Any], bool]] = None,
+  ) -> Any:
+    """
+    Computes value with given loader and puts it within the cache, joining the computation
+    already in-flight for the same key if there is one.
+
+    ---
+    :param:  key  `str` identifies key-value pair
+    :param:  loader  `Callable` sync or async callable without arguments computing the value
+    :param:  ttl  `int` time before computed value expires within cache; default: `None`
+    :param:  skip_if  `Callable` predicate on computed value to leave it uncached; default: `None`
+    :returns:  `Any`  computed value
+    """
+    ### Shielded so that cancelling one waiter does not cancel computation shared by others ###
+    return await shield(self._spawn(key, loader, ttl, skip_if))
+
+  def register_loader(
+    self,
+    key: str,
+    loader: Callable[[], Union[Any, Awaitable[Any]]],
+    ttl: Optional[int] = None,
+  ) -> None:
+    """
+    Registers loader used to refresh value of given key in background once `fetch` finds it stale;
+    only relevant when `stale_ttl` is configured.
+
+    ---
+    :param:  key  `str` identifies key-value pair
+    :param:  loader  `Callable` sync or async callable without arguments computing the value
+    :param:  ttl  `int` time before refreshed value becomes stale; default: `None`
+    """
+    self._loaders[key] = (loader, ttl)
+
+  def revalidate(
+    self,
+    key: str,
+    value: Any,
+    loader: Optional[Callable[[], Union[Any, Awaitable[Any]]]] = None,
+    ttl: Optional[int] = None,
+    skip_if: Optional[Callable[[Any], bool]] = None,
+  ) -> Any:
+    """
+    Unwraps value fetched in stale-while-revalidate mode; once past its time-to-live, schedules
+    one background refresh using given loader or the one registered for the key.
+
+    ---
+    :param:  key  `str` identifies key-value pair
+    :param:  value  `Any` value as fetched from backend
+    :param:  loader  `Callable` overrides registered loader; default: `None`
+    :param:  ttl  `int` time before refreshed value becomes stale; default: `None`
+    :param:  skip_if  `Callable` predicate on refreshed value to leave it uncached; default: `None`
+    :returns:  `Any`  value, stale or not
+    """
+    if not isinstance(value, Envelope):
+      return value
+    if value.expires <= time():
+      if loader is None and key in self._loaders:
+        loader, ttl = self._loaders[key]
+      if loader is not None:
+        self._spawn(key, loader, ttl, skip_if)
+    return value.value
+
+  def _spawn(
+    self,
+    key: str,
+    loader: Callable[[], Union[Any, Awaitable[Any]]],
+    ttl: Optional[int] = None,
+    skip_if: Optional[Callable[[Any], bool]] = None,
+  ) -> Task:
+    task: Optional[Task] = self._inflight.get(key)
+    if task is None or task.get_loop() is not get_running_loop():
+      task = ensure_future(self._load(key, loader, ttl, skip_if))
+      self._inflight[key] = task
+      task.add_done_callback(lambda done: self._release(key, done))
+    return task
+
+  async def _load(
+    self,
+    key: str,
+    loader: Callable[[], Union[Any, Awaitable[Any]]],
+    ttl: Optional[int] = None,
+    skip_if: Optional[Callable[[Any], bool]] = None,
+  ) -> Any:
+    started: float = perf_counter()
+    value: Any = loader()
+    if isawaitable(value):
+      value = await value
+    self._record_delta(key, perf_counter() - started)
+    if value is not None and (skip_if is None or not skip_if(value)):
+      await self.put(key, value, ttl)
+    return value
+
+  @classmethod
+  def _record_delta(cls, key: str, delta: float) -> None:
+    cls._deltas.pop(key, None)
+    if len(cls._deltas) >= cls._deltas_limit:
+      del cls._deltas[next(iter(cls._deltas))]  # evicts the least recently recomputed key
+    cls._deltas[key] = delta
+
+  @classmethod
+  def _release(cls, key: str, task: Task) -> None:
+    if cls._inflight.get(key) is task:
+      del cls._inflight[key]
+    if not task.cancelled():
+      task.exception()  # marks exception retrieved when no waiter remains
+
+  @classmethod
+  def cached(
+    cls,
+    ttl: Optional[int] = None,
+    namespace: Optional[str] = None,
+    key_builder: KeyBuilder = default_key_builder,
+    skip_if: Optional[Callable[[Any], bool]] = None,
+  ) -> Callable[[Callable[..., Any]], Callable[..., Awaitable[Any]]]:
+    """
+    Decorator memoizing results of async or sync callables, route handlers included, keyed by
+    their arguments; `Cachette` handles among arguments are left out of the key. Sync callables
+    are run in a worker thread on cache miss, thus decorated callables are always awaitable.
+    Results are passed through the configured codec on cache miss as well, so that misses and
+    hits return alike; arguments represented by memory address are left out of the key.
+
+    ---
+    :param:  ttl  `int` time before results expire within cache; default: `None`
+    :param:  namespace  `str` prefix of derived keys; default: module and name of callable
+    :param:  key_builder  `KeyBuilder` derives key from callable and its arguments
+    :param:  skip_if  `Callable` predicate on result to leave it uncached; default: `None`
+    :returns:  `Callable`  decorator
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+      prefix: str = f"{namespace or f'{func.__module__}.{func.__qualname__}'}:"
+      func_signature: Signature = signature(func)
+      is_coroutine: bool = iscoroutinefunction(func)
+
+      @wraps(func)
+      async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        bound: BoundArguments = func_signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments: Dict[str, Any] = {
+          name: value for name, value in bound.arguments.items() if not isinstance(value, cls)
+        }
+        cachette: Cachette = cls()
+
+        async def loader() -> Any:
+          result: Any = await (
+            func(*args, **kwargs) if is_coroutine else to_thread(func, *args, **kwargs)
+          )
+          ### Misses return values as decoded by hits rather than objects returned by callable ###
+          codec: Optional[Codec] = cls.value_codec()
+          return result if codec is None else codec.loads(codec.dumps(result))
+
+        return await cachette.fetch_or_compute(
+          prefix + key_builder(func, (), arguments), loader, ttl, skip_if
+        )
+
+      return wrapper
+
+    return decorator
+
+  async def fetch_many(self, keys: List[str]) -> List[Any]:
+    """
+    Fetches values of multiple keys from cache in as few round trips as backend allows
+
+    ---
+    :param:  keys  `List[str]` identifies key-value pairs
+    :returns:  `List[Any]`  values in the same order as given keys; `None` for missing keys
+    """
+    values: List[Any] = await self.backend.fetch_many(keys)
+    return [self.revalidate(key, value) for key, value in zip(keys, values)]
+
+  async def put_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+    """
+    Puts multiple key-value pairs within the cache with the same time-to-live value
+
+    ---
+    :param:  items  `Dict[str, Any]` key-value pairs to have stored
+    :param:  ttl  `int` time before values expire within cache; default: `None`
+    """
+    if self._stale_ttl is not None:
+      ttl = ttl or self._ttl
+      expires: float = time() + ttl
+      items = {key: Envelope(value, expires) for key, value in items.items()}
+      ttl += self._stale_ttl
+    await self.backend.put_many(items, ttl)
+
+  async def clear_many(self, keys: List[str]) -> int:
+    """
+    Clears multiple key-value pairs from cache
+
+    ---
+    :param:  keys  `List[str]` identifies key-value pairs to be cleared from cache
+    :returns:  `int`  amount of items cleared
+    """
+    return await self.backend.clear_many(keys)
+
 
 __all__ = ("Cachette",)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/key_builders.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 15:02
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining key builders used by `Cachette.cached` decorator to derive stable cache keys
+from arguments of decorated callables
+"""
+
+### Standard packages ###
+from hashlib import blake2b
+from re import Pattern, compile
+from typing import Any, Callable, Dict, Tuple
+
+### Third-party packages ###
+from pydantic import BaseModel
+
+KeyBuilder = Callable[[Callable[..., Any], Tuple[Any, ...], Dict[str, Any]], str]
+
+### Memory address within default representation, differing by instance and process ###
+ADDRESS: Pattern = compile(r" at 0x[0-9a-fA-F]+")
+
+
+class Unkeyable(object):
+  """Placeholder of argument without stable representation, such as injected sessions"""
+
+  __slots__ = ()
+
+  def __repr__(self) -> str:
+    return "<unkeyable>"
+
+
+UNKEYABLE: Unkeyable = Unkeyable()
+
+
+def normalize(argument: Any) -> Any:
+  """
+  Converts argument into a structure with stable representation across processes; pydantic models
+  are dumped, mappings and sets are sorted and requests are reduced to their path and query params;
+  objects represented by memory address are replaced by `UNKEYABLE`
+
+  ---
+  :param:  argument  `Any` argument passed to decorated callable
+  :returns:  `Any`  normalized argument
+  """
+  if argument is None or isinstance(argument, (bool, int, float, str, bytes)):
+    return argument
+  elif isinstance(argument, BaseModel):
+    return (type(argument).__qualname__, normalize(argument.model_dump(mode="json")))
+  elif isinstance(argument, dict):
+    return tuple(sorted((str(key), normalize(value)) for key, value in argument.items()))
+  elif isinstance(argument, (list, tuple)):
+    return tuple(normalize(item) for item in argument)
+  elif isinstance(argument, (set, frozenset)):
+    return tuple(sorted(repr(normalize(item)) for item in argument))
+  elif hasattr(argument, "query_params") and hasattr(argument, "url"):
+    ### Starlette-compatible requests ###
+    return (argument.url.path, tuple(sorted(argument.query_params.multi_items())))
+  representation: str = repr(argument)
+  if ADDRESS.search(representation):
+    return UNKEYABLE
+  return representation
+
+
+def default_key_builder(
+  func: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> str:
+  """
+  Builds cache key from digest of normalized arguments; arguments without stable representation,
+  such as injected database sessions or services, are left out of the key
+
+  ---
+  :param:  func  `Callable` decorated callable
+  :param:  args  `Tuple[Any, ...]` positional arguments of the call
+  :param:  kwargs  `Dict[str, Any]` keyword arguments of the call
+  :returns:  `str`  hexadecimal digest identifying the call
+  """
+  positional: Tuple[Any, ...] = tuple(normalize(arg) for arg in args)
+  named: Dict[str, Any] = {name: normalize(value) for name, value in kwargs.items()}
+  normalized: Tuple[Any, ...] = (
+    tuple(arg for arg in positional if arg is not UNKEYABLE),
+    tuple(sorted((name, value) for name, value in named.items() if value is not UNKEYABLE)),
+  )
+  return blake2b(repr(normalized).encode(), digest_size=16).hexdigest()
+
+
+__all__ = ("KeyBuilder", "UNKEYABLE", "default_key_builder", "normalize")
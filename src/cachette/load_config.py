@@ -12,10 +12,10 @@
 """Module containing `LoadConfig` Pydantic model"""
 
 ### Standard packages ###
-from typing import Optional
+from typing import Any, Callable, List, Optional, Union
 
 ### Third-party packages ###
-from pydantic import BaseModel, validator, StrictInt, StrictStr
+from pydantic import BaseModel, validator, StrictBool, StrictFloat, StrictInt, StrictStr
 
 
 class LoadConfig(BaseModel):
@@ -23,11 +23,40 @@ class LoadConfig(BaseModel):
   codec: Optional[StrictStr] = None
   ttl: Optional[StrictInt] = None
 
+  ### Early expiration ###
+  early_expiration_beta: Optional[Union[StrictInt, StrictFloat]] = None
+
+  ### Near-cache ###
+  near_cache_max_entries: Optional[StrictInt] = None
+  near_cache_ttl: Optional[Union[StrictInt, StrictFloat]] = None
+
+  ### Stale-while-revalidate ###
+  stale_ttl: Optional[StrictInt] = None
+
+  ### Connection pool ###
+  max_connections: Optional[StrictInt] = None
+  min_connections: Optional[StrictInt] = None
+  socket_connect_timeout: Optional[Union[StrictInt, StrictFloat]] = None
+  socket_keepalive: Optional[StrictBool] = None
+  socket_timeout: Optional[Union[StrictInt, StrictFloat]] = None
+
+  ### InMemory ###
+  eviction_policy: Optional[StrictStr] = None
+  expiration_interval: Optional[Union[StrictInt, StrictFloat]] = None
+  max_bytes: Optional[StrictInt] = None
+  max_entries: Optional[StrictInt] = None
+  object_mode: Optional[StrictStr] = None
+  object_sizeof: Optional[Callable[[Any], int]] = None
+  shards: Optional[StrictInt] = None
+  snapshot_path: Optional[StrictStr] = None
+
   ### Memcached ###
   memcached_host: Optional[StrictStr] = None
 
   ### MongoDB ###
   database_name: Optional[StrictStr] = None
+  mongodb_compressors: Optional[List[StrictStr]] = None
+  mongodb_server_selection_timeout: Optional[Union[StrictInt, StrictFloat]] = None
   mongodb_url: Optional[StrictStr] = None
   table_name: Optional[StrictStr] = None
 
@@ -35,23 +64,34 @@ class LoadConfig(BaseModel):
   pickle_path: Optional[StrictStr] = None
 
   ### Redis ###
+  cluster: Optional[StrictBool] = None
+  namespace_scan_count: Optional[StrictInt] = None
+  namespace_step_budget: Optional[Union[StrictInt, StrictFloat]] = None
   redis_url: Optional[StrictStr] = None
 
+  ### SharedMemory ###
+  shared_memory_path: Optional[StrictStr] = None
+  shared_memory_slot_size: Optional[StrictInt] = None
+  shared_memory_slots: Optional[StrictInt] = None
+
   ### Valkey ###
   valkey_url: Optional[StrictStr] = None
 
   @validator("backend")
   def validate_backend(cls, value: str) -> str:
     if value.lower() not in {
+      "columnar",
       "inmemory",
       "memcached",
       "mongodb",
       "pickle",
       "redis",
+      "sharedmemory",
       "valkey",
     }:
       raise ValueError(
-        'The "backend" value must be one of "inmemory", "memcached", "pickle", "redis" or "valkey".'
+        'The "backend" value must be one of "columnar", "inmemory", "memcached", "pickle", '
+        '"redis", "sharedmemory" or "valkey".'
       )
     return value.lower()
 
@@ -61,6 +101,93 @@ class LoadConfig(BaseModel):
       raise ValueError('The "ttl" value must between 1 or 3600 seconds.')
     return value
 
+  @validator("early_expiration_beta")
+  def validate_early_expiration_beta(cls, value: float) -> float:
+    if value is not None and value <= 0:
+      raise ValueError('The "early_expiration_beta" value must be a positive number.')
+    return value
+
+  @validator("near_cache_max_entries")
+  def validate_near_cache_max_entries(cls, value: int) -> int:
+    if value is not None and value <= 0:
+      raise ValueError('The "near_cache_max_entries" value must be a positive integer.')
+    return value
+
+  @validator("near_cache_ttl")
+  def validate_near_cache_time_to_live(cls, value: float) -> float:
+    if value is not None and (value <= 0 or value > 3600):
+      raise ValueError(
+        'The "near_cache_ttl" value must be greater than 0 and at most 3600 seconds.'
+      )
+    return value
+
+  @validator("stale_ttl")
+  def validate_stale_time_to_live(cls, value: int) -> int:
+    if value is not None and (value <= 0 or value > 3600):
+      raise ValueError('The "stale_ttl" value must between 1 or 3600 seconds.')
+    return value
+
+  @validator("eviction_policy")
+  def validate_eviction_policy(cls, value: str) -> str:
+    if value is not None and value.lower() not in {"arc", "lfu", "lru", "s3fifo", "tinylfu"}:
+      raise ValueError(
+        'The "eviction_policy" value must be one of "arc", "lfu", "lru", "s3fifo" or "tinylfu".'
+      )
+    return value.lower() if value is not None else value
+
+  @validator("expiration_interval")
+  def validate_expiration_interval(cls, value: float) -> float:
+    if value is not None and (value <= 0 or value > 3600):
+      raise ValueError(
+        'The "expiration_interval" value must be greater than 0 and at most 3600 seconds.'
+      )
+    return value
+
+  @validator("max_bytes", "max_entries")
+  def validate_inmemory_bounds(cls, value: int) -> int:
+    if value is not None and value <= 0:
+      raise ValueError('The "max_bytes" and "max_entries" values must be positive integers.')
+    return value
+
+  @validator("object_mode")
+  def validate_object_mode(cls, value: str) -> str:
+    if value is not None and value.lower() not in {"copy", "deepcopy", "frozen", "reference"}:
+      raise ValueError(
+        'The "object_mode" value must be one of "copy", "deepcopy", "frozen" or "reference".'
+      )
+    return value.lower() if value is not None else value
+
+  @validator("shards")
+  def validate_shards(cls, value: int, values: dict) -> int:
+    if value is not None and (value <= 0 or value > 1024):
+      raise ValueError('The "shards" value must be between 1 and 1024.')
+    for bound in ("max_bytes", "max_entries"):
+      maximum: Optional[int] = values.get(bound)
+      if value is not None and maximum is not None and maximum < value:
+        raise ValueError(f'The "{bound}" value cannot be less than "shards".')
+    return value
+
+  @validator("max_connections")
+  def validate_max_connections(cls, value: int) -> int:
+    if value is not None and value <= 0:
+      raise ValueError('The "max_connections" value must be a positive integer.')
+    return value
+
+  @validator("min_connections")
+  def validate_min_connections(cls, value: int, values: dict) -> int:
+    if value is not None and value <= 0:
+      raise ValueError('The "min_connections" value must be a positive integer.')
+    maximum: Optional[int] = values.get("max_connections")
+    if value is not None and maximum is not None and value > maximum:
+      raise ValueError('The "min_connections" value cannot exceed "max_connections".')
+    return value
+
+  @validator("socket_connect_timeout", "socket_timeout", "mongodb_server_selection_timeout")
+  def validate_timeouts(cls, value: float) -> float:
+    if value is not None and value <= 0:
+      raise ValueError("Timeout values must be positive amount of seconds.")
+    return value
+
   @validator("codec")
   def validate_codec(cls, value: str) -> str:
     if value.lower() not in {
@@ -117,6 +244,12 @@ class LoadConfig(BaseModel):
     ### TODO: More validations ###
     return value
 
+  @validator("mongodb_compressors")
+  def validate_mongodb_compressors(cls, value: List[str]) -> List[str]:
+    if value is not None and not set(value).issubset({"snappy", "zlib", "zstd"}):
+      raise ValueError('The "mongodb_compressors" values must be "snappy", "zlib" or "zstd".')
+    return value
+
   @validator("pickle_path", always=True)
   def validate_pickle_path(cls, value: str, values: dict) -> str:
     backend: str = values["backend"].lower()
@@ -125,6 +258,40 @@ class LoadConfig(BaseModel):
     ### TODO: More validations ###
     return value
 
+  @validator("namespace_scan_count")
+  def validate_namespace_scan_count(cls, value: int) -> int:
+    if value is not None and (value <= 0 or value > 5000):
+      raise ValueError('The "namespace_scan_count" value must be between 1 and 5000.')
+    return value
+
+  @validator("namespace_step_budget")
+  def validate_namespace_step_budget(cls, value: float) -> float:
+    if value is not None and (value <= 0 or value > 1):
+      raise ValueError(
+        'The "namespace_step_budget" value must be greater than 0 and at most 1 second.'
+      )
+    return value
+
+  @validator("shared_memory_path", always=True)
+  def validate_shared_memory_path(cls, value: str, values: dict) -> str:
+    if values["backend"].lower() == "sharedmemory" and not value:
+      raise ValueError(
+        'The "shared_memory_path" cannot be null when using sharedmemory as backend.'
+      )
+    return value
+
+  @validator("shared_memory_slot_size")
+  def validate_shared_memory_slot_size(cls, value: int) -> int:
+    if value is not None and (value < 64 or value > 1 << 24):
+      raise ValueError('The "shared_memory_slot_size" value must be between 64 and 16777216.')
+    return value
+
+  @validator("shared_memory_slots")
+  def validate_shared_memory_slots(cls, value: int) -> int:
+    if value is not None and value < 8:
+      raise ValueError('The "shared_memory_slots" value must be at least 8.')
+    return value
+
   @validator("valkey_url", always=True)
   def validate_valkey_url(cls, value: str, values: dict) -> str:
     if values["backend"].lower() == "valkey" and not value:
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/objects.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 21:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining helpers used when in-memory backend stores python objects as they are instead of
+encoding them with codecs; freezing objects into read-only views and estimating their size
+"""
+
+### Standard packages ###
+from sys import getsizeof
+from types import MappingProxyType
+from typing import Any, Callable, List, Set
+
+### Local modules ###
+from cachette.codecs.envelope import Envelope
+
+
+def freeze(obj: Any) -> Any:
+  """
+  Converts object into read-only counterpart; mappings become read-only proxies, lists tuples,
+  sets frozensets and numpy-like arrays non-writeable copies; other objects are left untouched
+
+  ---
+  :param:  obj  `Any` object to be frozen
+  :returns:  `Any`  read-only view of object
+  """
+  if isinstance(obj, (dict, MappingProxyType)):
+    return MappingProxyType({key: freeze(value) for key, value in obj.items()})
+  elif isinstance(obj, (list, tuple)):
+    return tuple(freeze(item) for item in obj)
+  elif isinstance(obj, (set, frozenset)):
+    return frozenset(obj)
+  elif isinstance(obj, bytearray):
+    return bytes(obj)
+  elif hasattr(obj, "setflags") and hasattr(obj, "copy"):
+    frozen: Any = obj.copy()
+    frozen.setflags(write=False)
+    return frozen
+  return obj
+
+
+def thaw(obj: Any) -> Any:
+  """
+  Converts read-only proxies of mappings back into dicts, reaching into tuples, so that frozen
+  objects may be pickled into snapshots; frozen again as they are restored
+
+  ---
+  :param:  obj  `Any` object as frozen by `freeze`
+  :returns:  `Any`  picklable counterpart of object
+  """
+  if isinstance(obj, MappingProxyType):
+    return {key: thaw(value) for key, value in obj.items()}
+  elif isinstance(obj, tuple):
+    return tuple(thaw(item) for item in obj)
+  return obj
+
+
+def unwrapped(transform: Callable[[Any], Any]) -> Callable[[Any], Any]:
+  """
+  Applies transform to values wrapped in envelopes under stale-while-revalidate mode rather than
+  to envelopes themselves, re-wrapping transformed values along with their soft-expiry
+
+  ---
+  :param:  transform  `Callable[[Any], Any]` copies or freezes objects
+  :returns:  `Callable[[Any], Any]`  transform reaching into envelopes
+  """
+
+  def apply(obj: Any) -> Any:
+    if isinstance(obj, Envelope):
+      return Envelope(transform(obj.value), obj.expires)
+    return transform(obj)
+
+  return apply
+
+
+def estimate_size(obj: Any) -> int:
+  """
+  Estimates amount of bytes held by object including objects it refers to; dataframes report
+  their deep memory usage, containers and instance attributes are traversed once each
+
+  ---
+  :param:  obj  `Any` object to be measured
+  :returns:  `int`  estimated amount of bytes
+  """
+  size: int = 0
+  seen: Set[int] = set()
+  pending: List[Any] = [obj]
+  while pending:
+    item: Any = pending.pop()
+    if id(item) in seen:
+      continue
+    seen.add(id(item))
+    if hasattr(item, "memory_usage") and callable(item.memory_usage):
+      ### pandas DataFrame returns usage per column, Series returns an integer ###
+      usage: Any = item.memory_usage(deep=True)
+      size += int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+      continue
+    size += getsizeof(item)
+    if isinstance(item, (str, bytes, bytearray, int, float, bool)) or item is None:
+      continue
+    elif isinstance(item, (dict, MappingProxyType)):
+      pending.extend(item.keys())
+      pending.extend(item.values())
+    elif isinstance(item, (list, tuple, set, frozenset)):
+      pending.extend(item)
+    elif hasattr(item, "__dict__"):
+      pending.append(vars(item))
+    elif hasattr(item, "__slots__"):
+      pending.extend(getattr(item, slot) for slot in item.__slots__ if hasattr(item, slot))
+  return size
+
+
+__all__ = ("estimate_size", "freeze", "thaw", "unwrapped")
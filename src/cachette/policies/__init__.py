@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/policies/__init__.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 18:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Module defining `Policy` abstract class defining eviction policies' method schemas"""
+
+### Standard packages ###
+from abc import abstractmethod
+
+
+class Policy:
+  @abstractmethod
+  def insert(self, key: str) -> None:
+    """
+    Abstract Method: Records key newly put within the store
+
+    ---
+    :param:  key  `str` identifies key-value pair
+    """
+    raise NotImplementedError
+
+  @abstractmethod
+  def touch(self, key: str) -> None:
+    """
+    Abstract Method: Records access of key already within the store, including overwrites
+
+    ---
+    :param:  key  `str` identifies key-value pair
+    """
+    raise NotImplementedError
+
+  @abstractmethod
+  def remove(self, key: str) -> None:
+    """
+    Abstract Method: Forgets key removed from the store by expiry or clear
+
+    ---
+    :param:  key  `str` identifies key-value pair
+    """
+    raise NotImplementedError
+
+  @abstractmethod
+  def evict(self) -> str:
+    """
+    Abstract Method: Selects and forgets key to be evicted from the store; only called while the
+    store holds at least one key
+
+    ---
+    :returns:  `str`  key to be evicted
+    """
+    raise NotImplementedError
+
+
+__all__ = ("Policy",)
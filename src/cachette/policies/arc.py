@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/policies/arc.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 19:15
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining `ARCPolicy` policy subclass balancing recency and frequency lists, adapting
+their target sizes from hits on ghost lists of recently evicted keys (Adaptive Replacement Cache)
+"""
+
+### Standard packages ###
+from collections import OrderedDict
+
+### Local modules ###
+from cachette.policies import Policy
+
+
+class ARCPolicy(Policy):
+  def __init__(self) -> None:
+    self.recent: "OrderedDict[str, None]" = OrderedDict()
+    self.frequent: "OrderedDict[str, None]" = OrderedDict()
+    self.recent_ghost: "OrderedDict[str, None]" = OrderedDict()
+    self.frequent_ghost: "OrderedDict[str, None]" = OrderedDict()
+    self.target: float = 0.0
+
+  def insert(self, key: str) -> None:
+    capacity: int = len(self.recent) + len(self.frequent) + 1
+    if key in self.recent_ghost:
+      step: float = max(len(self.frequent_ghost) / len(self.recent_ghost), 1.0)
+      self.target = min(float(capacity), self.target + step)
+      del self.recent_ghost[key]
+      self.frequent[key] = None
+    elif key in self.frequent_ghost:
+      step = max(len(self.recent_ghost) / len(self.frequent_ghost), 1.0)
+      self.target = max(0.0, self.target - step)
+      del self.frequent_ghost[key]
+      self.frequent[key] = None
+    else:
+      self.recent[key] = None
+
+  def touch(self, key: str) -> None:
+    if key in self.recent:
+      del self.recent[key]
+      self.frequent[key] = None
+    else:
+      self.frequent.move_to_end(key)
+
+  def remove(self, key: str) -> None:
+    if key in self.recent:
+      del self.recent[key]
+    else:
+      self.frequent.pop(key, None)
+
+  def evict(self) -> str:
+    key: str
+    if self.recent and (len(self.recent) > self.target or not self.frequent):
+      key = self.recent.popitem(last=False)[0]
+      self.recent_ghost[key] = None
+    else:
+      key = self.frequent.popitem(last=False)[0]
+      self.frequent_ghost[key] = None
+    ### Ghost lists remember at most as many keys as remain cached ###
+    capacity: int = len(self.recent) + len(self.frequent)
+    while self.recent_ghost and len(self.recent_ghost) + len(self.recent) > capacity:
+      self.recent_ghost.popitem(last=False)
+    while len(self.recent_ghost) + len(self.frequent_ghost) > capacity:
+      self.frequent_ghost.popitem(last=False)
+    return key
+
+
+__all__ = ("ARCPolicy",)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/policies/lfu.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 18:50
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining `LFUPolicy` policy subclass evicting least frequently used keys first, least
+recently used among equally frequent keys
+"""
+
+### Standard packages ###
+from collections import OrderedDict
+from typing import Dict
+
+### Local modules ###
+from cachette.policies import Policy
+
+
+class LFUPolicy(Policy):
+  def __init__(self) -> None:
+    self.buckets: Dict[int, "OrderedDict[str, None]"] = {}
+    self.frequencies: Dict[str, int] = {}
+    self.minimum: int = 0
+
+  def link(self, key: str, frequency: int) -> None:
+    self.frequencies[key] = frequency
+    bucket: "OrderedDict[str, None]" = self.buckets.get(frequency) or self.buckets.setdefault(
+      frequency, OrderedDict()
+    )
+    bucket[key] = None
+
+  def unlink(self, key: str) -> int:
+    frequency: int = self.frequencies.pop(key)
+    bucket: "OrderedDict[str, None]" = self.buckets[frequency]
+    del bucket[key]
+    if not bucket:
+      del self.buckets[frequency]
+    return frequency
+
+  def insert(self, key: str) -> None:
+    self.link(key, 1)
+    self.minimum = 1
+
+  def touch(self, key: str) -> None:
+    frequency: int = self.unlink(key)
+    if frequency == self.minimum and frequency not in self.buckets:
+      self.minimum = frequency + 1
+    self.link(key, frequency + 1)
+
+  def remove(self, key: str) -> None:
+    if key in self.frequencies:
+      self.unlink(key)
+
+  def evict(self) -> str:
+    if self.minimum not in self.buckets:
+      ### Minimum frequency emptied by removals; rescan the few distinct frequencies ###
+      self.minimum = min(self.buckets)
+    key: str = next(iter(self.buckets[self.minimum]))
+    self.unlink(key)
+    return key
+
+
+__all__ = ("LFUPolicy",)
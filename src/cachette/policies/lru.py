@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/policies/lru.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 18:45
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Module defining `LRUPolicy` policy subclass evicting least recently used keys first"""
+
+### Standard packages ###
+from collections import OrderedDict
+
+### Local modules ###
+from cachette.policies import Policy
+
+
+class LRUPolicy(Policy):
+  def __init__(self) -> None:
+    self.order: "OrderedDict[str, None]" = OrderedDict()
+
+  def insert(self, key: str) -> None:
+    self.order[key] = None
+
+  def touch(self, key: str) -> None:
+    self.order.move_to_end(key)
+
+  def remove(self, key: str) -> None:
+    self.order.pop(key, None)
+
+  def evict(self) -> str:
+    return self.order.popitem(last=False)[0]
+
+
+__all__ = ("LRUPolicy",)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/policies/s3fifo.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 18:55
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining `S3FIFOPolicy` policy subclass using a small probationary FIFO queue filtering
+one-hit wonders ahead of a main FIFO queue with lazy promotion, and a ghost queue remembering
+recently evicted keys (S3-FIFO)
+"""
+
+### Standard packages ###
+from collections import OrderedDict
+from typing import Dict
+
+### Local modules ###
+from cachette.policies import Policy
+
+
+class S3FIFOPolicy(Policy):
+  def __init__(self, small_ratio: float = 0.1, maximum_frequency: int = 3) -> None:
+    self.frequencies: Dict[str, int] = {}
+    self.ghost: "OrderedDict[str, None]" = OrderedDict()
+    self.main: "OrderedDict[str, None]" = OrderedDict()
+    self.maximum_frequency = maximum_frequency
+    self.small: "OrderedDict[str, None]" = OrderedDict()
+    self.small_ratio = small_ratio
+
+  def insert(self, key: str) -> None:
+    self.frequencies[key] = 0
+    if key in self.ghost:
+      del self.ghost[key]
+      self.main[key] = None
+    else:
+      self.small[key] = None
+
+  def touch(self, key: str) -> None:
+    frequency: int = self.frequencies[key]
+    if frequency < self.maximum_frequency:
+      self.frequencies[key] = frequency + 1
+
+  def remove(self, key: str) -> None:
+    if self.frequencies.pop(key, None) is None:
+      return
+    if key in self.small:
+      del self.small[key]
+    else:
+      del self.main[key]
+
+  def evict(self) -> str:
+    key: str
+    while True:
+      if self.small and (
+        len(self.small) >= self.small_ratio * (len(self.small) + len(self.main)) or not self.main
+      ):
+        key = self.small.popitem(last=False)[0]
+        if self.frequencies[key] > 1:
+          self.frequencies[key] = 0
+          self.main[key] = None
+          continue
+        self.ghost[key] = None
+        while len(self.ghost) > max(len(self.main), 1):
+          self.ghost.popitem(last=False)
+      else:
+        key = self.main.popitem(last=False)[0]
+        if self.frequencies[key] > 0:
+          self.frequencies[key] -= 1
+          self.main[key] = None
+          continue
+      del self.frequencies[key]
+      return key
+
+
+__all__ = ("S3FIFOPolicy",)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/policies/tinylfu.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 19:05
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining `TinyLFUPolicy` policy subclass admitting keys from a small recency window into
+a segmented main region only when estimated more frequently used than the key they would evict,
+frequencies being estimated by an aging count-min sketch (W-TinyLFU)
+"""
+
+### Standard packages ###
+from collections import OrderedDict
+from typing import List
+
+### Local modules ###
+from cachette.policies import Policy
+
+
+class CountMinSketch(object):
+  """
+  Four rows of 4-bit saturating counters estimating access frequencies of keys; all counters are
+  halved once amount of increments reaches ten times the width so that estimates favor recency
+  """
+
+  def __init__(self, width: int = 1 << 16) -> None:
+    self.mask: int = (1 << (width - 1).bit_length()) - 1
+    self.rows: List[bytearray] = [bytearray(self.mask + 1) for _ in range(4)]
+    self.sample_size: int = 10 * (self.mask + 1)
+    self.additions: int = 0
+
+  def indexes(self, key: str) -> List[int]:
+    digest: int = hash(key)
+    return [(digest >> (row * 16)) & self.mask for row in range(4)]
+
+  def increment(self, key: str) -> None:
+    added: bool = False
+    for row, index in zip(self.rows, self.indexes(key)):
+      if row[index] < 15:
+        row[index] += 1
+        added = True
+    if added:
+      self.additions += 1
+      if self.additions >= self.sample_size:
+        self.age()
+
+  def estimate(self, key: str) -> int:
+    return min(row[index] for row, index in zip(self.rows, self.indexes(key)))
+
+  def age(self) -> None:
+    self.additions //= 2
+    for row in self.rows:
+      row[:] = bytes(counter >> 1 for counter in row)
+
+
+class TinyLFUPolicy(Policy):
+  def __init__(
+    self, window_ratio: float = 0.01, protected_ratio: float = 0.8, width: int = 1 << 16
+  ) -> None:
+    self.probation: "OrderedDict[str, None]" = OrderedDict()
+    self.protected: "OrderedDict[str, None]" = OrderedDict()
+    self.protected_ratio = protected_ratio
+    self.sketch: CountMinSketch = CountMinSketch(width)
+    self.window: "OrderedDict[str, None]" = OrderedDict()
+    self.window_ratio = window_ratio
+
+  def insert(self, key: str) -> None:
+    self.sketch.increment(key)
+    self.window[key] = None
+    total: int = len(self.window) + len(self.probation) + len(self.protected)
+    ### Window overflow moves on to probation, where it stands as candidate against the victim ###
+    while len(self.window) > max(1, int(total * self.window_ratio)):
+      self.probation[self.window.popitem(last=False)[0]] = None
+
+  def touch(self, key: str) -> None:
+    self.sketch.increment(key)
+    if key in self.window:
+      self.window.move_to_end(key)
+    elif key in self.protected:
+      self.protected.move_to_end(key)
+    else:
+      del self.probation[key]
+      self.protected[key] = None
+      if len(self.protected) > self.protected_ratio * (len(self.probation) + len(self.protected)):
+        self.probation[self.protected.popitem(last=False)[0]] = None
+
+  def remove(self, key: str) -> None:
+    for segment in (self.window, self.probation, self.protected):
+      if key in segment:
+        del segment[key]
+        return
+
+  def evict(self) -> str:
+    if len(self.probation) > 1:
+      victim: str = next(iter(self.probation))
+      candidate: str = next(reversed(self.probation))
+      if self.sketch.estimate(candidate) > self.sketch.estimate(victim):
+        del self.probation[victim]
+        return victim
+      del self.probation[candidate]
+      return candidate
+    for segment in (self.probation, self.protected, self.window):
+      if segment:
+        return segment.popitem(last=False)[0]
+    raise KeyError("evict from empty policy")
+
+
+__all__ = ("CountMinSketch", "TinyLFUPolicy")
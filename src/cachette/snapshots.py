@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/src/cachette/snapshots.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 23:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining helpers writing and reading snapshots of in-memory entries; compact binary files
+of keys, expiry times and encoded values used to warm caches across restarts
+"""
+
+### Standard packages ###
+from os import getpid, replace
+from pickle import HIGHEST_PROTOCOL, PicklingError, dumps, loads
+from struct import Struct
+from typing import Any, BinaryIO, Iterable, List, Tuple
+
+### Snapshot header; magic, format version and whether values are python objects ###
+HEADER: Struct = Struct(">8sBB")
+MAGIC: bytes = b"CACHETTE"
+
+### Record header; expiry time in seconds, key length and value length ###
+RECORD: Struct = Struct(">QHI")
+
+
+def write_snapshot(
+  path: str, entries: Iterable[Tuple[str, int, Any]], objects: bool
+) -> Tuple[int, int]:
+  """
+  Streams entries into snapshot file, replacing any previous snapshot at path atomically once
+  complete; python objects which cannot be pickled are left out and counted as skipped
+
+  ---
+  :param:  path  `str` file-system path of snapshot
+  :param:  entries  `Iterable[Tuple[str, int, Any]]` keys, expiry times and values
+  :param:  objects  `bool` whether values are python objects rather than encoded bytes
+  :returns:  `Tuple[int, int]`  amounts of entries written and skipped
+  """
+  count: int = 0
+  skipped: int = 0
+  partial: str = f"{path}.{getpid()}.partial"
+  with open(partial, "wb") as file:
+    file.write(HEADER.pack(MAGIC, 1, objects))
+    for key, expires, data in entries:
+      if objects:
+        try:
+          data = dumps(data, protocol=HIGHEST_PROTOCOL)
+        except (AttributeError, PicklingError, TypeError):
+          skipped += 1
+          continue
+      encoded: bytes = key.encode()
+      file.write(RECORD.pack(expires, len(encoded), len(data)))
+      file.write(encoded)
+      file.write(data)
+      count += 1
+  replace(partial, path)
+  return count, skipped
+
+
+def read_exactly(file: BinaryIO, size: int) -> bytes:
+  data: bytes = file.read(size)
+  if len(data) != size:
+    raise ValueError(f'Snapshot at "{file.name}" is truncated.')
+  return data
+
+
+def read_snapshot(path: str, now: int, objects: bool) -> List[Tuple[str, int, Any]]:
+  """
+  Reads entries out of snapshot file, skipping those expired by now
+
+  ---
+  :param:  path  `str` file-system path of snapshot
+  :param:  now  `int` current time in seconds
+  :param:  objects  `bool` whether values are expected to be python objects
+  :returns:  `List[Tuple[str, int, Any]]`  keys, expiry times and values not yet expired
+  """
+  entries: List[Tuple[str, int, Any]] = []
+  with open(path, "rb") as file:
+    magic, version, pickled = HEADER.unpack(read_exactly(file, HEADER.size))
+    if magic != MAGIC or version != 1:
+      raise ValueError(f'File at "{path}" is not a snapshot.')
+    if pickled != objects:
+      raise ValueError(f'Snapshot at "{path}" was written with different "object_mode".')
+    header: bytes = file.read(RECORD.size)
+    while header:
+      if len(header) != RECORD.size:
+        raise ValueError(f'Snapshot at "{path}" is truncated.')
+      expires, key_length, data_length = RECORD.unpack(header)
+      key: bytes = read_exactly(file, key_length)
+      data: bytes = read_exactly(file, data_length)
+      if expires >= now:
+        entries.append((key.decode(), expires, loads(data) if objects else data))
+      header = file.read(RECORD.size)
+  return entries
+
+
+__all__ = ("read_snapshot", "write_snapshot")
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/active_expiration.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 20:05
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting expired in-memory entries never fetched again are reclaimed actively"""
+
+### Standard packages ###
+from asyncio import sleep
+from typing import Any, Dict, List, Tuple
+
+### Local modules ###
+from cachette import Cachette
+
+
+async def test_reclaim_expired_entries_in_background() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("expiration_interval", 0.1)]
+
+  async with Cachette() as cachette:
+    await cachette.put_many({f"reclaim-{index}": "value" for index in range(1000)}, ttl=1)
+    await cachette.put("reclaim-later", "value", ttl=60)
+    await cachette.put("reclaim-0", "overwritten", ttl=60)
+    await sleep(2.2)
+    stats: Dict[str, float] = cachette.backend.stats()
+    assert stats["entries"] == 2
+    assert stats["reclaimed"] == 999
+    assert stats["reclaimed_per_second"] > 0
+    assert await cachette.fetch("reclaim-0") == "overwritten"
+  assert cachette.backend.reaper is None
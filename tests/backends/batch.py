@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/backends/batch.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 14:05
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining a test case where multiple key-value pairs are put, fetched and cleared
+using batch methods
+"""
+
+### Standard packages ###
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Dict, List, Tuple
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.testclient import TestClient
+from httpx import Response
+from pytest import FixtureRequest, mark
+from pytest_asyncio import fixture
+
+### Local modules ###
+from cachette import Cachette
+
+
+@asynccontextmanager
+@fixture(scope="function")
+async def client(request: FixtureRequest) -> AsyncGenerator[TestClient, None]:
+  configs: List[Tuple[str, Any]] = request.param
+
+  @Cachette.load_config
+  def get_cachette_config():
+    return configs
+
+  app: FastAPI = FastAPI(lifespan=Cachette.lifespan)
+
+  ### Routing ###
+  @app.post("/", response_class=PlainTextResponse)
+  async def setter(items: Dict[str, str], cachette: Cachette = Depends()):
+    """
+    Submit multiple cache key-pair values
+    """
+    await cachette.put_many(items)
+    return "OK"
+
+  @app.get("/", response_class=JSONResponse)
+  async def getter(keys: str, cachette: Cachette = Depends()):
+    """
+    Returns values of comma-separated keys
+    """
+    return await cachette.fetch_many(keys.split(","))
+
+  @app.delete("/", response_class=PlainTextResponse)
+  async def destroy(keys: str, cachette: Cachette = Depends()):
+    """
+    Clears cached values of comma-separated keys
+    """
+    return str(await cachette.clear_many(keys.split(",")))
+
+  with TestClient(app) as test_client:
+    yield test_client
+
+
+@mark.parametrize(
+  "client",
+  [
+    [("backend", "inmemory")],
+    [("backend", "memcached"), ("memcached_host", "localhost")],
+    [
+      ("backend", "mongodb"),
+      ("database_name", "cachette-db"),
+      ("mongodb_url", "mongodb://localhost:27017"),
+    ],
+    [("backend", "pickle"), ("pickle_path", "tests/cachette.pkl")],
+    [("backend", "redis"), ("redis_url", "redis://localhost:6379")],
+    [("backend", "valkey"), ("valkey_url", "valkey://localhost:6380")],
+  ],
+  ids=["inmemory", "memcached", "mongodb", "pickle", "redis", "valkey"],
+  indirect=True,
+)
+def test_put_fetch_then_clear_many(client: TestClient) -> None:
+  response: Response = client.post("/", json={"batch-a": "alpha", "batch-b": "bravo"})
+  assert response.text == "OK"
+  response = client.get("/", params={"keys": "batch-a,batch-missing,batch-b,batch-a"})
+  assert response.json() == ["alpha", None, "bravo", "alpha"]
+  response = client.delete("/", params={"keys": "batch-a,batch-b,batch-missing"})
+  assert response.text == "2"
+  response = client.get("/", params={"keys": "batch-a,batch-b"})
+  assert response.json() == [None, None]
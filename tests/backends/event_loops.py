@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/backends/event_loops.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-19 03:20
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining a test case where backend is used from consecutive event loops, as by sync
+endpoints calling `asyncio.run` from worker threads
+"""
+
+### Standard packages ###
+from asyncio import run
+from typing import Any, Iterator, List, Tuple
+
+### Third-party packages ###
+from pytest import FixtureRequest, fixture, mark
+
+### Local modules ###
+from cachette import Cachette
+
+
+@fixture(scope="function")
+def client(request: FixtureRequest) -> Iterator[Cachette]:
+  configs: List[Tuple[str, Any]] = request.param
+
+  @Cachette.load_config
+  def get_cachette_config():
+    return configs
+
+  cachette: Cachette = Cachette()
+  yield cachette
+  run(cachette.close())
+
+
+@mark.parametrize(
+  "client",
+  [
+    [("backend", "memcached"), ("memcached_host", "localhost")],
+    [
+      ("backend", "mongodb"),
+      ("database_name", "cachette-db"),
+      ("mongodb_url", "mongodb://localhost:27017"),
+    ],
+    [("backend", "redis"), ("redis_url", "redis://localhost:6379")],
+    [("backend", "valkey"), ("valkey_url", "valkey://localhost:6380")],
+  ],
+  ids=["memcached", "mongodb", "redis", "valkey"],
+  indirect=True,
+)
+def test_consecutive_event_loops(client: Cachette) -> None:
+  run(client.put("loops", "value"))
+  assert run(client.fetch("loops")) == "value"
+  assert run(client.clear(key="loops")) == 1
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/backends/lifespan.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 11:02
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining a test case where backend is opened on application startup, used by requests
+and closed on application shutdown
+"""
+
+### Standard packages ###
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, List, Tuple
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from httpx import Response
+from pytest import FixtureRequest, mark
+from pytest_asyncio import fixture
+
+### Local modules ###
+from cachette import Cachette
+
+
+@asynccontextmanager
+@fixture(scope="function")
+async def client(request: FixtureRequest) -> AsyncGenerator[TestClient, None]:
+  configs: List[Tuple[str, Any]] = request.param
+
+  @Cachette.load_config
+  def get_cachette_config():
+    return configs
+
+  app: FastAPI = FastAPI(lifespan=Cachette.lifespan)
+
+  ### Routing ###
+  @app.put("/{key}/{value}", response_class=PlainTextResponse)
+  async def setter(key: str, value: str, cachette: Cachette = Depends()):
+    """
+    Submit a new cache key-pair value
+    """
+    await cachette.put(key, value)
+    return "OK"
+
+  @app.get("/{key}", response_class=PlainTextResponse, status_code=200)
+  async def getter(key: str, cachette: Cachette = Depends()):
+    """
+    Returns key value
+    """
+    return await cachette.fetch(key)
+
+  with TestClient(app) as test_client:
+    yield test_client
+
+
+@mark.parametrize(
+  "client",
+  [
+    [("backend", "inmemory")],
+    [("backend", "memcached"), ("memcached_host", "localhost")],
+    [
+      ("backend", "mongodb"),
+      ("database_name", "cachette-db"),
+      ("mongodb_url", "mongodb://localhost:27017"),
+    ],
+    [("backend", "pickle"), ("pickle_path", "tests/cachette.pkl")],
+    [("backend", "redis"), ("redis_url", "redis://localhost:6379")],
+    [("backend", "valkey"), ("valkey_url", "valkey://localhost:6380")],
+  ],
+  ids=["inmemory", "memcached", "mongodb", "pickle", "redis", "valkey"],
+  indirect=True,
+)
+def test_open_then_close(client: TestClient) -> None:
+  response: Response = client.put("/lifespan/opened")
+  assert response.text == "OK"
+  response = client.get("/lifespan")
+  assert response.text == "opened"
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/backends/near_cache.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 17:55
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining a test case where repeated fetches are served by in-process near-cache in front
+of remote backends, invalidated when cleared
+"""
+
+### Standard packages ###
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, List, Tuple
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.testclient import TestClient
+from httpx import Response
+from pytest import FixtureRequest, mark
+from pytest_asyncio import fixture
+
+### Local modules ###
+from cachette import Cachette
+
+
+@asynccontextmanager
+@fixture(scope="function")
+async def client(request: FixtureRequest) -> AsyncGenerator[TestClient, None]:
+  configs: List[Tuple[str, Any]] = request.param
+
+  @Cachette.load_config
+  def get_cachette_config():
+    return configs
+
+  app: FastAPI = FastAPI(lifespan=Cachette.lifespan)
+
+  ### Routing ###
+  @app.put("/{key}/{value}", response_class=PlainTextResponse)
+  async def setter(key: str, value: str, cachette: Cachette = Depends()):
+    """
+    Submit a new cache key-pair value
+    """
+    await cachette.put(key, value)
+    return "OK"
+
+  @app.get("/stats", response_class=JSONResponse)
+  async def stats(cachette: Cachette = Depends()):
+    """
+    Returns hit and miss counts of each tier
+    """
+    return cachette.backend.stats()
+
+  @app.get("/{key}", response_class=PlainTextResponse, status_code=200)
+  async def getter(key: str, cachette: Cachette = Depends()):
+    """
+    Returns key value
+    """
+    return await cachette.fetch(key)
+
+  @app.delete("/{key}", response_class=PlainTextResponse)
+  async def destroy(key: str, cachette: Cachette = Depends()):
+    """
+    Clears cached value of key
+    """
+    return str(await cachette.clear(key=key))
+
+  with TestClient(app) as test_client:
+    yield test_client
+
+
+@mark.parametrize(
+  "client",
+  [
+    [("backend", "memcached"), ("memcached_host", "localhost"), ("near_cache_ttl", 5)],
+    [
+      ("backend", "mongodb"),
+      ("database_name", "cachette-db"),
+      ("mongodb_url", "mongodb://localhost:27017"),
+      ("near_cache_ttl", 5),
+    ],
+    [("backend", "pickle"), ("near_cache_ttl", 5), ("pickle_path", "tests/cachette.pkl")],
+    [("backend", "redis"), ("near_cache_ttl", 5), ("redis_url", "redis://localhost:6379")],
+    [("backend", "valkey"), ("near_cache_ttl", 5), ("valkey_url", "valkey://localhost:6380")],
+  ],
+  ids=["memcached", "mongodb", "pickle", "redis", "valkey"],
+  indirect=True,
+)
+def test_read_through_then_invalidate(client: TestClient) -> None:
+  response: Response = client.put("/near/cached")
+  assert response.text == "OK"
+  for _ in range(3):
+    response = client.get("/near")
+    assert response.text == "cached"
+  response = client.get("/stats")
+  assert response.json() == {"l1": {"hits": 2, "misses": 1}, "l2": {"hits": 1, "misses": 0}}
+  response = client.delete("/near")
+  assert response.text == "1"
+  response = client.get("/near")
+  assert response.text == ""
+  response = client.get("/stats")
+  assert response.json() == {"l1": {"hits": 2, "misses": 2}, "l2": {"hits": 1, "misses": 1}}
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/backends/stale_while_revalidate.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 17:05
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""
+Module defining a test case where a value past its time-to-live is served stale while being
+refreshed in background by registered loader
+"""
+
+### Standard packages ###
+from contextlib import asynccontextmanager
+from time import sleep
+from typing import Any, AsyncGenerator, List, Tuple
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from httpx import Response
+from pytest import FixtureRequest, mark
+from pytest_asyncio import fixture
+
+### Local modules ###
+from cachette import Cachette
+
+
+@asynccontextmanager
+@fixture(scope="function")
+async def client(request: FixtureRequest) -> AsyncGenerator[TestClient, None]:
+  configs: List[Tuple[str, Any]] = request.param
+
+  @Cachette.load_config
+  def get_cachette_config():
+    return configs
+
+  app: FastAPI = FastAPI(lifespan=Cachette.lifespan)
+
+  ### Routing ###
+  @app.put("/{key}/{value}", response_class=PlainTextResponse)
+  async def setter(key: str, value: str, cachette: Cachette = Depends()):
+    """
+    Submit a new cache key-pair value and register loader refreshing it
+    """
+    await cachette.put(key, value)
+    cachette.register_loader(key, lambda: f"{value}-refreshed")
+    return "OK"
+
+  @app.get("/{key}", response_class=PlainTextResponse, status_code=200)
+  async def getter(key: str, cachette: Cachette = Depends()):
+    """
+    Returns key value
+    """
+    return await cachette.fetch(key)
+
+  with TestClient(app) as test_client:
+    yield test_client
+
+
+@mark.parametrize(
+  "client",
+  [
+    [("backend", "inmemory"), ("stale_ttl", 5), ("ttl", 1)],
+    [("backend", "memcached"), ("memcached_host", "localhost"), ("stale_ttl", 5), ("ttl", 1)],
+    [
+      ("backend", "mongodb"),
+      ("database_name", "cachette-db"),
+      ("mongodb_url", "mongodb://localhost:27017"),
+      ("stale_ttl", 5),
+      ("ttl", 1),
+    ],
+    [("backend", "pickle"), ("pickle_path", "tests/cachette.pkl"), ("stale_ttl", 5), ("ttl", 1)],
+    [("backend", "redis"), ("redis_url", "redis://localhost:6379"), ("stale_ttl", 5), ("ttl", 1)],
+    [
+      ("backend", "valkey"),
+      ("stale_ttl", 5),
+      ("ttl", 1),
+      ("valkey_url", "valkey://localhost:6380"),
+    ],
+  ],
+  ids=["inmemory", "memcached", "mongodb", "pickle", "redis", "valkey"],
+  indirect=True,
+)
+def test_serve_stale_while_revalidating(client: TestClient) -> None:
+  response: Response = client.put("/swr/value")
+  assert response.text == "OK"
+  response = client.get("/swr")
+  assert response.text == "value"
+  sleep(1.2)
+  response = client.get("/swr")
+  assert response.text == "value"
+  sleep(0.2)
+  response = client.get("/swr")
+  assert response.text == "value-refreshed"
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/cached.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 15:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite for `Cachette.cached` decorator memoizing callables and route handlers"""
+
+### Standard packages ###
+from typing import Any, List, Optional, Tuple
+
+### Third-party packages ###
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+from httpx import Response
+from pydantic import BaseModel
+from pytest import fixture
+
+### Local modules ###
+from cachette import Cachette
+from cachette.key_builders import default_key_builder
+
+
+class Query(BaseModel):
+  term: str
+  limit: int = 10
+
+
+@fixture(autouse=True)
+def load_inmemory_configs() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("codec", "pickle")]
+
+
+async def test_async_callable_with_pydantic_arguments() -> None:
+  calls: List[Query] = []
+
+  @Cachette.cached(ttl=5)
+  async def search(query: Query, page: int = 1) -> List[str]:
+    calls.append(query)
+    return [f"{query.term}-{page}"]
+
+  assert await search(Query(term="cache")) == ["cache-1"]
+  assert await search(Query(term="cache"), page=1) == ["cache-1"]
+  assert await search(query=Query(term="cache", limit=10)) == ["cache-1"]
+  assert len(calls) == 1
+  assert await search(Query(term="cache", limit=20)) == ["cache-1"]
+  assert await search(Query(term="cache"), 2) == ["cache-2"]
+  assert len(calls) == 3
+
+
+async def test_sync_callable_and_skip_predicate() -> None:
+  calls: List[int] = []
+
+  @Cachette.cached(namespace="lookup", skip_if=lambda result: result == [])
+  def lookup(identifier: int) -> List[int]:
+    calls.append(identifier)
+    return [identifier] if identifier > 0 else []
+
+  assert await lookup(1) == [1]
+  assert await lookup(1) == [1]
+  assert await lookup(0) == []
+  assert await lookup(0) == []
+  assert calls == [1, 0, 0]
+  assert await Cachette().clear(namespace="lookup") == 1
+
+
+def test_route_handler_keyed_by_query_params() -> None:
+  calls: List[Optional[str]] = []
+  app: FastAPI = FastAPI()
+
+  @app.get("/items")
+  @Cachette.cached(ttl=5)
+  async def items(request: Request, cachette: Cachette = Depends()) -> dict:
+    calls.append(request.query_params.get("color"))
+    return {"color": request.query_params.get("color")}
+
+  with TestClient(app) as client:
+    response: Response = client.get("/items", params={"color": "red"})
+    assert response.json() == {"color": "red"}
+    response = client.get("/items", params={"color": "red"})
+    assert response.json() == {"color": "red"}
+    response = client.get("/items", params={"color": "blue"})
+    assert response.json() == {"color": "blue"}
+  assert calls == ["red", "blue"]
+
+
+async def test_misses_decoded_alike_hits() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory")]
+
+  @Cachette.cached(ttl=5)
+  async def describe(index: int) -> dict:
+    return {"index": index}
+
+  assert await describe(1) == "{'index': 1}"
+  assert await describe(1) == "{'index': 1}"
+
+
+async def test_arguments_without_stable_representation_left_out() -> None:
+  class Session(object):
+    pass
+
+  calls: List[Session] = []
+
+  @Cachette.cached(ttl=5)
+  async def lookup(term: str, session: Session) -> List[str]:
+    calls.append(session)
+    return [term]
+
+  assert await lookup("cache", Session()) == ["cache"]
+  assert await lookup("cache", session=Session()) == ["cache"]
+  assert len(calls) == 1
+  assert default_key_builder(lookup, ("cache", Session()), {}) == default_key_builder(
+    lookup, ("cache",), {}
+  )
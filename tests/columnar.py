@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/columnar.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-19 00:20
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite for `ColumnarBackend` keeping encoded values in arena indexed by NumPy arrays"""
+
+### Standard packages ###
+from asyncio import sleep
+from typing import Any, List, Tuple
+
+### Third-party packages ###
+from pytest import importorskip
+
+### Local modules ###
+from cachette import Cachette
+from cachette.codecs.pickle import PickleCodec
+
+importorskip("numpy", reason='"numpy" dependency is required for "columnar" backend test.')
+
+from cachette.backends.columnar import ColumnarBackend  # noqa: E402
+
+
+async def test_fetch_many_checks_expiry_in_bulk() -> None:
+  backend: ColumnarBackend = ColumnarBackend(codec=PickleCodec(), capacity=4, ttl=60)
+  await backend.put_many({f"live:{index}": [index] for index in range(10)})
+  await backend.put_many({f"expired:{index}": [index] for index in range(5)}, ttl=-1)
+  keys: List[str] = ["live:0", "expired:0", "missing", "live:9", "expired:0", "live:0"]
+  assert await backend.fetch_many(keys) == [[0], None, None, [9], None, [0]]
+  assert backend.stats()["entries"] == 14
+  assert backend.stats()["capacity"] == 16
+  assert await backend.fetch_with_ttl("missing") == (-1, None)
+  ttl: int
+  value: Any
+  ttl, value = await backend.fetch_with_ttl("live:3")
+  assert (value, 0 < ttl <= 60) == ([3], True)
+  assert await backend.clear(namespace="live") == 10
+  assert await backend.clear(key="live:0") == 0
+  assert backend.sweep(backend.now) == 4
+  assert backend.size == 0
+
+
+async def test_sweep_and_compact_reclaim_slots_and_arena() -> None:
+  backend: ColumnarBackend = ColumnarBackend(codec=PickleCodec(), capacity=8, ttl=60)
+  await backend.put_many({f"short:{index}": "x" * 100 for index in range(6)}, ttl=-1)
+  await backend.put("long", "y" * 100)
+  await backend.put("long", "z" * 100)
+  assert backend.sweep(backend.now) == 6
+  assert len(backend.free) == 7
+  assert backend.stats()["garbage"] > 0
+  backend.compact()
+  assert backend.stats()["garbage"] == 0
+  assert backend.stats()["arena"] == len(PickleCodec().dumps("z" * 100))
+  assert await backend.fetch("long") == "z" * 100
+  await backend.put("short:0", "again")
+  assert await backend.fetch("short:0") == "again"
+
+
+async def test_background_sweeps_after_open() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "columnar"), ("codec", "pickle"), ("expiration_interval", 0.1)]
+
+  async with Cachette() as cachette:
+    await cachette.put_many({f"sweep:{index}": index for index in range(100)}, ttl=1)
+    await cachette.put("kept", "value", ttl=60)
+    await sleep(2.3)
+    assert cachette.backend.stats() == {
+      "arena": len(PickleCodec().dumps("value")),
+      "capacity": 1024,
+      "entries": 1,
+      "garbage": 0,
+    }
+  assert cachette.backend.sweeper is None
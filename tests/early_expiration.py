@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/early_expiration.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 16:10
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting probabilistic early expiration recomputes hot keys ahead of expiry"""
+
+### Standard packages ###
+from asyncio import sleep
+from typing import Any, List, Tuple
+
+### Third-party packages ###
+from pytest import mark
+
+### Local modules ###
+from cachette import Cachette
+
+
+@mark.parametrize("beta, recomputations", [(None, 1), (1e12, 3)], ids=["disabled", "eager"])
+async def test_recomputes_hits_ahead_of_expiry(beta: float, recomputations: int) -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("codec", "pickle"), ("early_expiration_beta", beta)]
+
+  calls: List[int] = []
+
+  async def loader() -> int:
+    calls.append(1)
+    await sleep(0.01)
+    return len(calls)
+
+  cachette: Cachette = Cachette()
+  key: str = f"xfetch-{beta}"
+  for _ in range(3):
+    await cachette.fetch_or_compute(key, loader, ttl=60)
+  assert len(calls) == recomputations
+  assert await cachette.fetch(key) == recomputations
+
+
+async def test_unmeasured_keys_never_expire_early() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("early_expiration_beta", 1e12)]
+
+  cachette: Cachette = Cachette()
+  assert not cachette.expires_early("xfetch-unmeasured", 1)
+  Cachette._record_delta("xfetch-measured", 1.0)
+  assert cachette.expires_early("xfetch-measured", 1)
+  assert not cachette.expires_early("xfetch-measured", -1)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/fetch_or_compute.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 14:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting concurrent cache misses are coalesced onto a single computation"""
+
+### Standard packages ###
+from asyncio import gather, sleep
+from typing import Any, List, Tuple
+
+### Third-party packages ###
+from pytest import fixture, raises
+
+### Local modules ###
+from cachette import Cachette
+
+
+@fixture(autouse=True)
+def load_inmemory_configs() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("codec", "pickle")]
+
+
+async def test_concurrent_misses_compute_once() -> None:
+  calls: List[int] = []
+
+  async def loader() -> dict:
+    calls.append(1)
+    await sleep(0.05)
+    return {"expensive": len(calls)}
+
+  cachette: Cachette = Cachette()
+  values: List[Any] = await gather(
+    *(cachette.fetch_or_compute("stampede", loader) for _ in range(20))
+  )
+  assert len(calls) == 1
+  assert values == [{"expensive": 1}] * 20
+  assert await cachette.fetch("stampede") == {"expensive": 1}
+  assert await cachette.fetch_or_compute("stampede", loader) == {"expensive": 1}
+  assert len(calls) == 1
+
+
+async def test_sync_loader() -> None:
+  cachette: Cachette = Cachette()
+  assert await cachette.fetch_or_compute("sync", lambda: "computed", ttl=5) == "computed"
+  assert await cachette.fetch("sync") == "computed"
+
+
+async def test_failed_computation_propagates_to_every_waiter() -> None:
+  async def loader() -> str:
+    await sleep(0.05)
+    raise ValueError("database unavailable")
+
+  cachette: Cachette = Cachette()
+  results: List[Any] = await gather(
+    *(cachette.fetch_or_compute("failure", loader) for _ in range(5)), return_exceptions=True
+  )
+  assert all(isinstance(result, ValueError) for result in results)
+  assert await cachette.fetch("failure") is None
+  with raises(ValueError):
+    await cachette.fetch_or_compute("failure", loader)
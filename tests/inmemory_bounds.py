@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/inmemory_bounds.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 18:20
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting in-memory backend evicts least recently used entries to stay bounded"""
+
+### Standard packages ###
+from typing import Any, Dict, List, Tuple
+
+### Local modules ###
+from cachette import Cachette
+
+
+async def test_evict_least_recently_used_over_max_entries() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("max_entries", 2)]
+
+  cachette: Cachette = Cachette()
+  await cachette.put("bounded-a", "alpha")
+  await cachette.put("bounded-b", "bravo")
+  assert await cachette.fetch("bounded-a") == "alpha"
+  await cachette.put("bounded-c", "charlie")
+  assert await cachette.fetch_many(["bounded-a", "bounded-b", "bounded-c"]) == [
+    "alpha",
+    None,
+    "charlie",
+  ]
+  stats: Dict[str, float] = cachette.backend.stats()
+  assert (stats["bytes"], stats["entries"], stats["evictions"]) == (12, 2, 1)
+
+
+async def test_evict_least_recently_used_over_max_bytes() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("max_bytes", 10)]
+
+  cachette: Cachette = Cachette()
+  await cachette.put("bounded-a", "aaaa")
+  await cachette.put("bounded-b", "bbbb")
+  await cachette.put("bounded-c", "cccc")
+  assert await cachette.fetch("bounded-a") is None
+  await cachette.put("bounded-d", "d" * 11)
+  assert await cachette.fetch("bounded-d") is None
+  assert await cachette.clear(key="bounded-b") == 1
+  stats: Dict[str, float] = cachette.backend.stats()
+  assert (stats["bytes"], stats["entries"], stats["evictions"]) == (4, 1, 2)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/inmemory_threads.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 23:10
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting in-memory backend stays consistent when shared by many threads"""
+
+### Standard packages ###
+from asyncio import run
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
+from typing import Any, List
+
+### Third-party packages ###
+from pytest import mark, raises
+
+### Local modules ###
+from cachette.backends.inmemory import InMemoryBackend
+from cachette.codecs.vanilla import VanillaCodec
+from cachette.policies.tinylfu import TinyLFUPolicy
+
+
+@mark.parametrize("shards", [1, 8])
+def test_consistent_under_concurrent_threads(shards: int) -> None:
+  backend: InMemoryBackend = InMemoryBackend(
+    codec=VanillaCodec(), max_entries=64, policy=TinyLFUPolicy(), shards=shards, ttl=60
+  )
+
+  async def operate(seed: int) -> None:
+    random: Random = Random(seed)
+    for _ in range(2000):
+      key: str = f"users:{random.randrange(256)}"
+      operation: float = random.random()
+      if operation < 0.5:
+        assert await backend.fetch(key) in {None, key}
+      elif operation < 0.9:
+        await backend.put(key, key, ttl=random.choice([-1, 60]))
+      elif operation < 0.95:
+        await backend.clear(key=key)
+      else:
+        await backend.clear(namespace="users")
+
+  with ThreadPoolExecutor(max_workers=8) as executor:
+    results: List[Any] = list(executor.map(lambda seed: run(operate(seed)), range(16)))
+  assert results == [None] * 16
+  assert backend.size <= 64
+  for shard in backend.shards:
+    assert shard.nbytes == sum(value.size for value in shard.store.values())
+    assert set(shard.namespaces.get("users", ())) == set(shard.store)
+  assert backend.count("users") == backend.size
+
+
+def test_bounds_split_across_shards() -> None:
+  backend: InMemoryBackend = InMemoryBackend(
+    codec=VanillaCodec(), max_bytes=100, max_entries=10, shards=4, ttl=60
+  )
+  assert [shard.max_entries for shard in backend.shards] == [3, 3, 2, 2]
+  assert sum(shard.max_bytes or 0 for shard in backend.shards) == 100
+  with raises(ValueError, match='"max_entries" value cannot be less than "shards"'):
+    InMemoryBackend(codec=VanillaCodec(), max_entries=10, shards=16, ttl=60)
@@ -25,11 +25,33 @@ from cachette import Cachette
 @mark.parametrize(
   "configs",
   [
+    ### Columnar ###
+    [("backend", "columnar")],
+    [("backend", "columnar"), ("expiration_interval", 0.5), ("ttl", 5)],
     ### InMemory ###
     [("backend", "inmemory")],
     [("backend", "inmemory"), ("ttl", 1)],
     [("backend", "inmemory"), ("ttl", 3600)],
     [("backend", "inmemory"), ("table_name", None)],
+    [("backend", "inmemory"), ("early_expiration_beta", 1.5)],
+    [("backend", "inmemory"), ("stale_ttl", 30)],
+    [("backend", "inmemory"), ("max_bytes", 1 << 20), ("max_entries", 1000)],
+    [("backend", "inmemory"), ("eviction_policy", "S3FIFO"), ("max_entries", 1000)],
+    [("backend", "inmemory"), ("expiration_interval", 0.5)],
+    [("backend", "inmemory"), ("max_entries", 1000), ("shards", 16)],
+    [("backend", "inmemory"), ("snapshot_path", "tests/cachette.snapshot")],
+    [
+      ("backend", "inmemory"),
+      ("max_bytes", 1 << 20),
+      ("object_mode", "frozen"),
+      ("object_sizeof", len),
+    ],
+    [
+      ("backend", "redis"),
+      ("near_cache_max_entries", 256),
+      ("near_cache_ttl", 0.5),
+      ("redis_url", "redis://localhost:6379"),
+    ],
     ### Memcached ###
     [("backend", "memcached"), ("memcached_host", "localhost")],
     [("backend", "memcached"), ("ttl", 1), ("memcached_host", "localhost")],
@@ -56,6 +78,14 @@ from cachette import Cachette
       ("ttl", 3600),
       ("mongodb_url", "mongodb://localhost:27017"),
     ],
+    [
+      ("backend", "mongodb"),
+      ("max_connections", 50),
+      ("min_connections", 5),
+      ("mongodb_compressors", ["zstd", "zlib"]),
+      ("mongodb_server_selection_timeout", 2.5),
+      ("mongodb_url", "mongodb://localhost:27017"),
+    ],
     ### Redis ###
     [("backend", "redis"), ("redis_url", "redis://localhost:6379")],
     [("backend", "redis"), ("ttl", 1), ("redis_url", "redis://localhost:6379")],
@@ -65,6 +95,29 @@ from cachette import Cachette
       ("redis_url", "redis://localhost:6379"),
       ("table_name", None),
     ],
+    [
+      ("backend", "redis"),
+      ("max_connections", 32),
+      ("redis_url", "redis://localhost:6379"),
+      ("socket_connect_timeout", 1.5),
+      ("socket_keepalive", True),
+      ("socket_timeout", 1),
+    ],
+    [("backend", "redis"), ("cluster", True), ("redis_url", "redis://localhost:7000")],
+    [
+      ("backend", "redis"),
+      ("namespace_scan_count", 500),
+      ("namespace_step_budget", 0.005),
+      ("redis_url", "redis://localhost:6379"),
+    ],
+    ### SharedMemory ###
+    [("backend", "sharedmemory"), ("shared_memory_path", "/dev/shm/cachette")],
+    [
+      ("backend", "sharedmemory"),
+      ("shared_memory_path", "/dev/shm/cachette"),
+      ("shared_memory_slot_size", 4096),
+      ("shared_memory_slots", 1 << 20),
+    ],
   ],
 )
 def test_load_valid_configs(configs: List[Tuple[str, Any]]) -> None:
@@ -85,6 +138,51 @@ def test_load_valid_configs(configs: List[Tuple[str, Any]]) -> None:
       [("backend", "inmemory"), ("ttl", 3601)],
       'The "ttl" value must between 1 or 3600 seconds.',
     ),
+    (
+      [("backend", "inmemory"), ("early_expiration_beta", 0)],
+      'The "early_expiration_beta" value must be a positive number.',
+    ),
+    (
+      [("backend", "inmemory"), ("eviction_policy", "clock")],
+      'The "eviction_policy" value must be one of "arc", "lfu", "lru", "s3fifo" or "tinylfu".',
+    ),
+    (
+      [("backend", "inmemory"), ("expiration_interval", 0)],
+      'The "expiration_interval" value must be greater than 0 and at most 3600 seconds.',
+    ),
+    (
+      [("backend", "inmemory"), ("object_mode", "pointer")],
+      'The "object_mode" value must be one of "copy", "deepcopy", "frozen" or "reference".',
+    ),
+    (
+      [("backend", "inmemory"), ("shards", 0)],
+      'The "shards" value must be between 1 and 1024.',
+    ),
+    (
+      [("backend", "inmemory"), ("max_entries", 10), ("shards", 16)],
+      'The "max_entries" value cannot be less than "shards".',
+    ),
+    (
+      [("backend", "inmemory"), ("max_entries", 0)],
+      'The "max_bytes" and "max_entries" values must be positive integers.',
+    ),
+    (
+      [("backend", "inmemory"), ("stale_ttl", 0)],
+      'The "stale_ttl" value must between 1 or 3600 seconds.',
+    ),
+    (
+      [("backend", "redis"), ("near_cache_ttl", 0), ("redis_url", "redis://localhost:6379")],
+      'The "near_cache_ttl" value must be greater than 0 and at most 3600 seconds.',
+    ),
+    (
+      [
+        ("backend", "redis"),
+        ("near_cache_max_entries", 0),
+        ("near_cache_ttl", 1),
+        ("redis_url", "redis://localhost:6379"),
+      ],
+      'The "near_cache_max_entries" value must be a positive integer.',
+    ),
     ### Memcached ###
     (
       [("backend", "memcached")],
@@ -124,6 +222,23 @@ def test_load_valid_configs(configs: List[Tuple[str, Any]]) -> None:
       ],
       'The "table_name" cannot be null when using MongoDB as backend.',
     ),
+    (
+      [
+        ("backend", "mongodb"),
+        ("max_connections", 5),
+        ("min_connections", 10),
+        ("mongodb_url", "mongodb://localhost:27017"),
+      ],
+      'The "min_connections" value cannot exceed "max_connections".',
+    ),
+    (
+      [
+        ("backend", "mongodb"),
+        ("mongodb_compressors", ["gzip"]),
+        ("mongodb_url", "mongodb://localhost:27017"),
+      ],
+      'The "mongodb_compressors" values must be "snappy", "zlib" or "zstd".',
+    ),
     ### Redis ###
     (
       [("backend", "redis")],
@@ -141,6 +256,22 @@ def test_load_valid_configs(configs: List[Tuple[str, Any]]) -> None:
       ],
       'The "ttl" value must between 1 or 3600 seconds.',
     ),
+    (
+      [("backend", "redis"), ("max_connections", 0), ("redis_url", "redis://localhost:6379")],
+      'The "max_connections" value must be a positive integer.',
+    ),
+    (
+      [("backend", "redis"), ("redis_url", "redis://localhost:6379"), ("socket_timeout", -1)],
+      "Timeout values must be positive amount of seconds.",
+    ),
+    (
+      [("backend", "redis"), ("namespace_scan_count", 0), ("redis_url", "redis://localhost:6379")],
+      'The "namespace_scan_count" value must be between 1 and 5000.',
+    ),
+    (
+      [("backend", "redis"), ("namespace_step_budget", 2), ("redis_url", "redis://localhost:6379")],
+      'The "namespace_step_budget" value must be greater than 0 and at most 1 second.',
+    ),
     ### Pickle ###
     (
       [("backend", "pickle")],
@@ -150,6 +281,27 @@ def test_load_valid_configs(configs: List[Tuple[str, Any]]) -> None:
       [("backend", "pickle"), ("ttl", 0), ("pickle_path", "tests/cachette.pkl")],
       'The "ttl" value must between 1 or 3600 seconds.',
     ),
+    ### SharedMemory ###
+    (
+      [("backend", "sharedmemory")],
+      'The "shared_memory_path" cannot be null when using sharedmemory as backend.',
+    ),
+    (
+      [
+        ("backend", "sharedmemory"),
+        ("shared_memory_path", "/dev/shm/cachette"),
+        ("shared_memory_slot_size", 32),
+      ],
+      'The "shared_memory_slot_size" value must be between 64 and 16777216.',
+    ),
+    (
+      [
+        ("backend", "sharedmemory"),
+        ("shared_memory_path", "/dev/shm/cachette"),
+        ("shared_memory_slots", 4),
+      ],
+      'The "shared_memory_slots" value must be at least 8.',
+    ),
   ],
 )
 def test_load_invalid_configs(invalid_configs: List[Tuple[str, Any]], reason: str) -> None:
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/mongodb_index.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-19 03:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting MongoDB backend indexes keys uniquely over collections of old versions"""
+
+### Standard packages ###
+from typing import Any, AsyncIterator, Dict
+
+### Third-party packages ###
+from pytest import fixture, importorskip, mark, skip
+
+### Local modules ###
+from cachette.codecs.vanilla import VanillaCodec
+
+importorskip("motor", reason='"motor" dependency is required for "mongodb" backend test.')
+
+from cachette.backends.mongodb import MongoDBBackend  # noqa: E402
+
+
+@fixture
+async def backend() -> AsyncIterator[MongoDBBackend]:
+  from pymongo.errors import ServerSelectionTimeoutError
+
+  backend: MongoDBBackend = MongoDBBackend(
+    codec=VanillaCodec(),
+    database_name="cachette-db",
+    server_selection_timeout=1,
+    table_name="cachette-index",
+    ttl=60,
+    url="mongodb://localhost:27017",
+  )
+  try:
+    await backend.collection.drop()
+  except ServerSelectionTimeoutError:
+    skip(reason="MongoDB Server cannot be reached.")
+  yield backend
+  await backend.collection.drop()
+  await backend.close()
+
+
+@mark.parametrize("indexed", [False, True], ids=["unindexed", "non-unique"])
+async def test_open_deduplicates_keys(backend: MongoDBBackend, indexed: bool) -> None:
+  if indexed:
+    await backend.collection.create_index("key")
+  await backend.collection.insert_many(
+    [
+      {"key": "duplicated", "value": b"stale", "expires": backend.now + 30},
+      {"key": "duplicated", "value": b"fresh", "expires": backend.now + 60},
+      {"key": "single", "value": b"single", "expires": backend.now + 60},
+    ]
+  )
+  await backend.open()
+  indexes: Dict[str, Any] = await backend.collection.index_information()
+  assert indexes["key_1"].get("unique") is True
+  assert await backend.collection.count_documents({}) == 2
+  assert await backend.fetch("duplicated") == "fresh"
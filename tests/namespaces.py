@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/namespaces.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 20:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting in-memory namespace index stays in sync with puts, evictions and clears"""
+
+### Local modules ###
+from cachette.backends.inmemory import InMemoryBackend
+from cachette.codecs.vanilla import VanillaCodec
+
+
+async def test_count_then_clear_namespaces() -> None:
+  backend: InMemoryBackend = InMemoryBackend(codec=VanillaCodec(), max_entries=5, ttl=60)
+  await backend.put_many(
+    {
+      "users:1": "alice",
+      "users:2": "bob",
+      "users:admin:3": "carol",
+      "usersx:1": "dave",
+      "orders:1": "widget",
+    }
+  )
+  await backend.put("users:1", "alice")
+  assert (backend.count("users"), backend.count("users:admin")) == (3, 1)
+  assert backend.count("orders") == 1
+  await backend.put("orders:2", "gadget")  # evicts "users:2" as least recently used
+  assert (backend.count("users"), backend.count("orders")) == (2, 2)
+  assert await backend.clear(namespace="users") == 2
+  assert (backend.count("users"), backend.count("users:admin")) == (0, 0)
+  assert await backend.fetch_many(["usersx:1", "orders:1", "orders:2"]) == [
+    "dave",
+    "widget",
+    "gadget",
+  ]
+  assert await backend.clear(key="orders:1") == 1
+  assert backend.shards[0].namespaces == {"orders": {"orders:2"}, "usersx": {"usersx:1"}}
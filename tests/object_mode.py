@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/object_mode.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 22:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting in-memory backend keeps python objects as-is with selected read semantics"""
+
+### Standard packages ###
+from typing import Any, Dict, List, Tuple
+
+### Third-party packages ###
+from pytest import mark, raises
+
+### Local modules ###
+from cachette import Cachette
+
+
+def load_object_mode(mode: str, *configs: Tuple[str, Any]) -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("object_mode", mode), *configs]
+
+
+@mark.parametrize(
+  "mode, shared, nested_shared",
+  [("reference", True, True), ("copy", False, True), ("deepcopy", False, False)],
+)
+@mark.parametrize("stale", [False, True], ids=["fresh", "stale-while-revalidate"])
+async def test_read_semantics(mode: str, shared: bool, nested_shared: bool, stale: bool) -> None:
+  load_object_mode(mode, *([("stale_ttl", 30)] if stale else []))
+  cachette: Cachette = Cachette()
+  value: Dict[str, Any] = {"tags": ["a"], "count": 1}
+  await cachette.put("object", value)
+  fetched: Dict[str, Any] = await cachette.fetch("object")
+  assert fetched == value
+  assert (fetched is value) is shared
+  fetched["tags"].append("b")
+  fetched["count"] = 2
+  fetched = await cachette.fetch("object")
+  assert (fetched["count"] == 2) is shared
+  assert (fetched["tags"] == ["a", "b"]) is nested_shared
+
+
+@mark.parametrize("stale", [False, True], ids=["fresh", "stale-while-revalidate"])
+async def test_frozen_views(stale: bool) -> None:
+  load_object_mode("frozen", *([("stale_ttl", 30)] if stale else []))
+  cachette: Cachette = Cachette()
+  value: Dict[str, Any] = {"tags": ["a"], "nested": {"count": 1}}
+  await cachette.put("frozen", value)
+  value["tags"].append("b")
+  fetched: Any = await cachette.fetch("frozen")
+  assert fetched["tags"] == ("a",)
+  with raises(TypeError):
+    fetched["nested"]["count"] = 2
+
+
+async def test_estimated_size_bounds() -> None:
+  load_object_mode("reference", ("max_bytes", 1000), ("object_sizeof", lambda obj: len(obj) * 100))
+  cachette: Cachette = Cachette()
+  await cachette.put("small", list(range(4)))
+  await cachette.put("large", list(range(8)))
+  assert await cachette.fetch("small") is None
+  assert cachette.backend.stats()["bytes"] == 800
+  await cachette.put("oversized", list(range(11)))
+  assert await cachette.fetch_many(["large", "oversized"]) == [list(range(8)), None]
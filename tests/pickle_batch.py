@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/pickle_batch.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-19 03:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting pickle backend fetches batches holding duplicate keys"""
+
+### Standard packages ###
+from pathlib import Path
+
+### Local modules ###
+from cachette.backends.pickle import PickleBackend
+
+
+async def test_fetch_many_with_duplicate_expired_keys(tmp_path: Path) -> None:
+  backend: PickleBackend = PickleBackend(pickle_path=str(tmp_path / "cachette.pkl"), ttl=60)
+  await backend.put("expired", "value", ttl=-1)
+  await backend.put("live", "value")
+  assert await backend.fetch_many(["expired", "live", "expired", "live"]) == [
+    None,
+    "value",
+    None,
+    "value",
+  ]
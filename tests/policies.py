@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/policies.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 19:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting eviction policies keep in-memory backend bounded and hot keys cached"""
+
+### Standard packages ###
+from random import Random
+from typing import List, Type
+
+### Third-party packages ###
+from pytest import mark
+
+### Local modules ###
+from cachette.backends.inmemory import InMemoryBackend
+from cachette.codecs.vanilla import VanillaCodec
+from cachette.policies import Policy
+from cachette.policies.arc import ARCPolicy
+from cachette.policies.lfu import LFUPolicy
+from cachette.policies.lru import LRUPolicy
+from cachette.policies.s3fifo import S3FIFOPolicy
+from cachette.policies.tinylfu import TinyLFUPolicy
+
+policies: List[Type[Policy]] = [ARCPolicy, LFUPolicy, LRUPolicy, S3FIFOPolicy, TinyLFUPolicy]
+
+
+@mark.parametrize("policy", policies, ids=lambda policy: policy.__name__)
+async def test_stay_bounded_under_random_operations(policy: Type[Policy]) -> None:
+  backend: InMemoryBackend = InMemoryBackend(
+    codec=VanillaCodec(), max_entries=32, policy=policy(), ttl=60
+  )
+  random: Random = Random(8)
+  for _ in range(5000):
+    key: str = f"key-{random.randrange(100)}"
+    operation: float = random.random()
+    if operation < 0.5:
+      await backend.fetch(key)
+    elif operation < 0.9:
+      await backend.put(key, key)
+    else:
+      await backend.clear(key=key)
+    assert backend.size <= 32
+  for key in [key for shard in backend.shards for key in shard.store]:
+    assert await backend.fetch(key) == key
+    await backend.clear(key=key)
+  assert backend.stats()["bytes"] == 0
+
+
+@mark.parametrize(
+  "policy", [LFUPolicy, S3FIFOPolicy, TinyLFUPolicy], ids=lambda policy: policy.__name__
+)
+async def test_keep_hot_keys_through_scan(policy: Type[Policy]) -> None:
+  backend: InMemoryBackend = InMemoryBackend(
+    codec=VanillaCodec(), max_entries=20, policy=policy(), ttl=60
+  )
+  hot: List[str] = [f"hot-{index}" for index in range(10)]
+  for _ in range(5):
+    for key in hot:
+      if await backend.fetch(key) is None:
+        await backend.put(key, key)
+  for index in range(200):
+    await backend.put(f"scan-{index}", "scan")
+  assert await backend.fetch_many(hot) == hot
+
+
+@mark.parametrize("max_entries", [1, 3, 1000])
+@mark.parametrize("policy", policies, ids=lambda policy: policy.__name__)
+async def test_put_into_warm_cache_then_fetch(policy: Type[Policy], max_entries: int) -> None:
+  backend: InMemoryBackend = InMemoryBackend(
+    codec=VanillaCodec(), max_entries=max_entries, policy=policy(), ttl=60
+  )
+  for _ in range(3):
+    for index in range(max_entries):
+      await backend.put(f"warm-{index}", "warm")
+      await backend.fetch(f"warm-{index}")
+  for index in range(10):
+    await backend.put(f"new-{index}", "new")
+    assert await backend.fetch(f"new-{index}") == "new"
+    assert backend.size <= max_entries
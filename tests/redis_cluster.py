@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/redis_cluster.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-19 02:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting Redis Cluster backend keeps namespaces on one slot and batches by slot"""
+
+### Standard packages ###
+from typing import Any, AsyncIterator, List, Set, Tuple
+
+### Third-party packages ###
+from pytest import FixtureRequest, fixture, importorskip, mark, skip
+
+### Local modules ###
+from cachette import Cachette
+from cachette.codecs.vanilla import VanillaCodec
+
+importorskip("redis", reason='"redis" dependency is required for "redis" backend test.')
+
+from cachette.backends.redis_cluster import RedisClusterBackend, hashtag  # noqa: E402
+
+
+@fixture
+async def backend(request: FixtureRequest) -> AsyncIterator[RedisClusterBackend]:
+  from redis.exceptions import ConnectionError, RedisClusterException
+
+  backend: RedisClusterBackend = RedisClusterBackend(
+    codec=VanillaCodec(),
+    namespace_scan_count=100,
+    namespace_step_budget=request.param,
+    redis_url="redis://localhost:7000",
+    ttl=60,
+  )
+  try:
+    await backend.open()
+  except (ConnectionError, RedisClusterException):
+    skip(reason="Redis Cluster cannot be reached.")
+  yield backend
+  for namespace in ("cluster", "other", "{braced}"):
+    await backend.clear(namespace=namespace)
+  await backend.close()
+
+
+def test_hashtag() -> None:
+  assert hashtag("users:42") == "{users}:42"
+  assert hashtag("users:42:orders") == "{users}:42:orders"
+  assert hashtag("untagged") == "untagged"
+  assert hashtag("{braced}:42") == "{braced}:42"
+
+
+@mark.parametrize("backend", [None, 0.001], ids=["round-trips", "budget"], indirect=True)
+async def test_namespace_stays_on_one_slot(backend: RedisClusterBackend) -> None:
+  await backend.put_many({f"cluster:{index}": index for index in range(300)})
+  await backend.put_many({f"other:{index}": index for index in range(300)})
+  await backend.put("{braced}:0", "value")
+  assert backend.redis.keyslot("{cluster}:0") == backend.redis.keyslot("{cluster}:299")
+  assert await backend.redis.exists("{cluster}:299") == 1
+  ttl: int
+  value: Any
+  ttl, value = await backend.fetch_with_ttl("cluster:0")
+  assert (value, 0 < ttl <= 60) == ("0", True)
+  ### Scripts flushed from every primary are reloaded onto nodes as invoked ###
+  await backend.redis.script_flush()
+  steps: List[Tuple[int, int]] = []
+  unlinked: int = await backend.clear_namespace(
+    "cluster", progress=lambda step, count: steps.append((step, count))
+  )
+  assert unlinked == 300
+  ### Every primary is scanned at least once ###
+  assert len(steps) >= len(backend.redis.get_primaries())
+  assert await backend.fetch("cluster:0") is None
+  assert await backend.clear(namespace="{braced}") == 1
+  assert await backend.clear(key="other:0") == 1
+
+
+@mark.parametrize("backend", [None], ids=["round-trips"], indirect=True)
+async def test_batches_span_slots(backend: RedisClusterBackend) -> None:
+  namespaces: List[str] = [f"other{index}" for index in range(32)]
+  slots: Set[int] = {backend.redis.keyslot(hashtag(f"{namespace}:0")) for namespace in namespaces}
+  assert len(slots) > 1
+  await backend.put_many({f"{namespace}:0": namespace for namespace in namespaces}, ttl=5)
+  keys: List[str] = [f"{namespace}:0" for namespace in reversed(namespaces)] + ["missing:0"]
+  assert await backend.fetch_many(keys) == list(reversed(namespaces)) + [None]
+  assert await backend.clear_many(keys) == 32
+
+
+async def test_tags_across_slots() -> None:
+  from redis.exceptions import ConnectionError, RedisClusterException
+
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "redis"), ("cluster", True), ("redis_url", "redis://localhost:7000")]
+
+  cachette: Cachette = Cachette()
+  assert isinstance(cachette.backend, RedisClusterBackend)
+  try:
+    await cachette.open()
+  except (ConnectionError, RedisClusterException):
+    skip(reason="Redis Cluster cannot be reached.")
+  try:
+    for index in range(16):
+      await cachette.put(f"tagged{index}:0", index, tags=["cluster"])
+    await cachette.put("untagged:0", "value")
+    assert await cachette.invalidate_tags(["cluster"]) == 16
+    assert await cachette.fetch_many([f"tagged{index}:0" for index in range(16)]) == [None] * 16
+    assert await cachette.fetch("untagged:0") == "value"
+    assert await cachette.clear(key="untagged:0") == 1
+  finally:
+    await cachette.close()
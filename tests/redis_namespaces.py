@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/redis_namespaces.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-19 01:00
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting Redis namespaces are cleared incrementally with `SCAN` and `UNLINK`"""
+
+### Standard packages ###
+from typing import AsyncIterator, List, Optional, Tuple
+
+### Third-party packages ###
+from pytest import FixtureRequest, fixture, importorskip, mark, skip
+
+### Local modules ###
+from cachette.codecs.vanilla import VanillaCodec
+
+importorskip("redis", reason='"redis" dependency is required for "redis" backend test.')
+
+from cachette.backends.redis import RedisBackend  # noqa: E402
+
+
+@fixture
+async def backend(request: FixtureRequest) -> AsyncIterator[RedisBackend]:
+  from redis.exceptions import ConnectionError
+
+  backend: RedisBackend = RedisBackend(
+    codec=VanillaCodec(),
+    namespace_scan_count=100,
+    namespace_step_budget=request.param,
+    redis_url="redis://localhost:6379",
+    ttl=60,
+  )
+  try:
+    await backend.open()
+  except ConnectionError:
+    skip(reason="Redis Server cannot be reached.")
+  yield backend
+  await backend.clear(namespace="scan*[ns]")
+  await backend.clear(namespace="scanned")
+  await backend.close()
+
+
+@mark.parametrize("backend", [None, 0.001], ids=["round-trips", "budget"], indirect=True)
+async def test_clear_namespace_in_steps(backend: RedisBackend) -> None:
+  await backend.put_many({f"scanned:{index}": "value" for index in range(1050)})
+  await backend.put_many({f"scan*[ns]:{index}": "value" for index in range(10)})
+  await backend.put("scannedx:1", "value")
+  steps: List[Tuple[int, int]] = []
+  unlinked: int = await backend.clear_namespace(
+    "scanned", progress=lambda step, count: steps.append((step, count))
+  )
+  assert unlinked == 1050
+  assert steps[-1] == (len(steps), 1050)
+  assert all(previous <= count for (_, previous), (_, count) in zip(steps, steps[1:]))
+  assert await backend.fetch("scanned:0") is None
+  assert await backend.fetch("scannedx:1") == "value"
+  assert await backend.clear(namespace="scan*[ns]") == 10
+  assert await backend.clear(key="scannedx:1") == 1
+  fetched: Optional[str] = await backend.fetch("scan*[ns]:0")
+  assert fetched is None
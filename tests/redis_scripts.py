@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/redis_scripts.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-19 02:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting Redis scripts are loaded once and invoked by digest with `EVALSHA`"""
+
+### Standard packages ###
+from typing import Any, AsyncIterator, Dict, List
+
+### Third-party packages ###
+from pytest import fixture, importorskip, skip
+
+### Local modules ###
+from cachette.codecs.vanilla import VanillaCodec
+
+importorskip("redis", reason='"redis" dependency is required for "redis" backend test.')
+
+from cachette.backends.redis import RedisBackend  # noqa: E402
+
+
+@fixture
+async def backend() -> AsyncIterator[RedisBackend]:
+  from redis.exceptions import ConnectionError
+
+  backend: RedisBackend = RedisBackend(
+    codec=VanillaCodec(), namespace_step_budget=0.001, redis_url="redis://localhost:6379", ttl=60
+  )
+  try:
+    await backend.open()
+  except ConnectionError:
+    skip(reason="Redis Server cannot be reached.")
+  yield backend
+  await backend.clear(namespace="scripted")
+  await backend.close()
+
+
+async def calls(backend: RedisBackend, command: str) -> int:
+  stats: Dict[str, Any] = await backend.redis.info("commandstats")
+  return stats.get(f"cmdstat_{command}", {}).get("calls", 0)
+
+
+async def test_scripts_loaded_on_open(backend: RedisBackend) -> None:
+  shas: List[str] = [script.sha for script in backend.scripts]
+  assert await backend.redis.script_exists(*shas) == [True] * len(shas)
+  evals: int = await calls(backend, "eval")
+  await backend.put("scripted:0", "value", tags=["scripted"])
+  assert await backend.fetch_with_ttl("scripted:0") == (60, "value")
+  assert await backend.fetch_with_ttl("scripted:missing") == (-1, None)
+  assert await backend.invalidate_tags(["scripted"]) == 1
+  await backend.put("scripted:1", "value")
+  assert await backend.clear(namespace="scripted") == 1
+  assert await calls(backend, "eval") == evals
+
+
+async def test_reload_on_noscript(backend: RedisBackend) -> None:
+  await backend.put("scripted:0", "value")
+  await backend.redis.script_flush()
+  assert await backend.fetch_with_ttl("scripted:0") == (60, "value")
+  assert await backend.redis.script_exists(backend.scripts[0].sha) == [True]
+  assert await backend.invalidate_tags(["scripted"]) == 0
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/registry.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 10:12
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting backend instances are shared until configuration is loaded again"""
+
+### Standard packages ###
+from asyncio import sleep
+from typing import Any, List, Tuple
+
+### Local modules ###
+from cachette import Cachette
+
+
+def test_backend_shared_across_handles() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("codec", "json")]
+
+  first: Cachette = Cachette()
+  second: Cachette = Cachette()
+  assert first is not second
+  assert first.backend is second.backend
+
+
+def test_backend_rebuilt_after_reload() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("codec", "json")]
+
+  before: Cachette = Cachette()
+
+  @Cachette.load_config
+  def reload_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("codec", "pickle"), ("ttl", 5)]
+
+  after: Cachette = Cachette()
+  assert before.backend is not after.backend
+  assert after.backend.ttl == 5
+
+
+async def test_async_context_manager() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory")]
+
+  async with Cachette() as cachette:
+    await cachette.put("context", "managed")
+    assert await cachette.fetch("context") == "managed"
+
+
+async def test_replaced_backend_closed() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("expiration_interval", 0.1)]
+
+  before: Cachette = Cachette()
+  await before.open()
+  assert before.backend.reaper is not None
+
+  @Cachette.load_config
+  def reload_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory")]
+
+  async with Cachette() as after:
+    assert after.backend is not before.backend
+    await sleep(0)
+    assert before.backend.reaper is None
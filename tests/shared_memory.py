@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/shared_memory.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 22:20
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite for `SharedMemoryBackend` sharing one memory-mapped table across worker processes"""
+
+### Standard packages ###
+from asyncio import run
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, List, Tuple
+
+### Third-party packages ###
+from pytest import raises
+
+### Local modules ###
+from cachette import Cachette
+from cachette.backends.sharedmemory import OFFSET, SEQUENCE, SLOT, SharedMemoryBackend
+from cachette.codecs.vanilla import VanillaCodec
+
+
+def load_shared_memory(path: Path, *configs: Tuple[str, Any]) -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "sharedmemory"), ("shared_memory_path", str(path)), *configs]
+
+
+def worker(path: str, index: int) -> None:
+  async def put_and_fetch() -> None:
+    backend: SharedMemoryBackend = SharedMemoryBackend(
+      codec=VanillaCodec(), path=path, slots=64, ttl=60
+    )
+    await backend.put(f"worker-{index}", f"written by worker {index}")
+    assert await backend.fetch("parent") == "written by parent"
+    await backend.close()
+
+  run(put_and_fetch())
+
+
+async def test_values_shared_across_processes(tmp_path: Path) -> None:
+  path: str = str(tmp_path / "cachette.shm")
+  backend: SharedMemoryBackend = SharedMemoryBackend(
+    codec=VanillaCodec(), path=path, slots=64, ttl=60
+  )
+  await backend.put("parent", "written by parent")
+  processes: List[Any] = [
+    get_context("spawn").Process(target=worker, args=(path, index)) for index in range(3)
+  ]
+  for process in processes:
+    process.start()
+  for process in processes:
+    process.join(30)
+    assert process.exitcode == 0
+  assert [await backend.fetch(f"worker-{index}") for index in range(3)] == [
+    "written by worker 0",
+    "written by worker 1",
+    "written by worker 2",
+  ]
+  await backend.close()
+
+
+async def test_put_fetch_and_clear(tmp_path: Path) -> None:
+  load_shared_memory(tmp_path / "cachette.shm", ("shared_memory_slots", 64))
+  async with Cachette() as cachette:
+    await cachette.put("users:1", "alice", ttl=5)
+    await cachette.put("users:2", "bob")
+    await cachette.put("users-list", "alice,bob")
+    assert await cachette.fetch("users:1") == "alice"
+    ttl: int
+    value: Any
+    ttl, value = await cachette.fetch_with_ttl("users:1")
+    assert (value, 0 < ttl <= 5) == ("alice", True)
+    assert await cachette.fetch_with_ttl("missing") == (-1, None)
+    await cachette.put("users:1", "carol")
+    assert await cachette.fetch("users:1") == "carol"
+    assert await cachette.clear(namespace="users") == 2
+    assert await cachette.fetch("users:2") is None
+    assert await cachette.fetch("users-list") == "alice,bob"
+    assert await cachette.clear(key="users-list") == 1
+    assert await cachette.clear(key="users-list") == 0
+
+
+async def test_oversized_values_not_cached(tmp_path: Path) -> None:
+  load_shared_memory(tmp_path / "cachette.shm", ("shared_memory_slot_size", 64))
+  async with Cachette() as cachette:
+    await cachette.put("oversized", "small")
+    assert await cachette.fetch("oversized") == "small"
+    await cachette.put("oversized", "x" * 64)
+    assert await cachette.fetch("oversized") is None
+
+
+async def test_full_group_overwrites_soonest_expiring(tmp_path: Path) -> None:
+  backend: SharedMemoryBackend = SharedMemoryBackend(
+    codec=VanillaCodec(), path=str(tmp_path / "cachette.shm"), slots=8, ttl=60
+  )
+  await backend.put("shortest", "value", ttl=1)
+  for index in range(7):
+    await backend.put(f"longer-{index}", "value", ttl=60)
+  await backend.put("newest", "value", ttl=60)
+  assert await backend.fetch("shortest") is None
+  assert await backend.fetch("newest") == "value"
+  assert all([await backend.fetch(f"longer-{index}") == "value" for index in range(7)])
+  await backend.close()
+
+
+async def test_mismatched_layout_rejected(tmp_path: Path) -> None:
+  path: str = str(tmp_path / "cachette.shm")
+  await SharedMemoryBackend(codec=VanillaCodec(), path=path, slots=64, ttl=60).open()
+  with raises(ValueError, match="different slot layout"):
+    await SharedMemoryBackend(codec=VanillaCodec(), path=path, slots=128, ttl=60).open()
+
+
+async def test_namespace_clear_skips_slots_being_written(tmp_path: Path) -> None:
+  backend: SharedMemoryBackend = SharedMemoryBackend(
+    codec=VanillaCodec(), path=str(tmp_path / "table"), slots=8, ttl=60
+  )
+  await backend.put("torn:1", "value")
+  offset: int = next(
+    offset
+    for offset in range(OFFSET, OFFSET + backend.slots * backend.slot_size, backend.slot_size)
+    if backend.name(offset) == b"torn:1"
+  )
+  ### Odd sequence and key bytes not valid UTF-8 as seen amid a concurrent write ###
+  sequence: int = SEQUENCE.unpack_from(backend.table, offset)[0]
+  SEQUENCE.pack_into(backend.table, offset, sequence + 1)
+  backend.table[offset + SLOT.size + 5] = 0xFF
+  assert await backend.clear(namespace="torn") == 0
+  SEQUENCE.pack_into(backend.table, offset, sequence)
+  backend.table[offset + SLOT.size + 5] = ord("1")
+  assert await backend.clear(namespace="torn") == 1
+  await backend.close()
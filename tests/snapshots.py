@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/snapshots.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-18 23:40
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting in-memory entries survive restarts by way of snapshots"""
+
+### Standard packages ###
+from pathlib import Path
+from typing import Any, List, Tuple
+
+### Third-party packages ###
+from pytest import raises
+
+### Local modules ###
+from cachette import Cachette
+from cachette.backends.inmemory import InMemoryBackend
+from cachette.codecs.pickle import PickleCodec
+from cachette.codecs.vanilla import VanillaCodec
+
+
+async def test_snapshot_then_restore_skipping_expired(tmp_path: Path) -> None:
+  path: str = str(tmp_path / "cachette.snapshot")
+  backend: InMemoryBackend = InMemoryBackend(codec=PickleCodec(), shards=4, ttl=60)
+  await backend.put_many({f"warm:{index}": {"index": index} for index in range(3000)})
+  await backend.put("expired", "value", ttl=-1)
+  assert await backend.snapshot(path) == 3000
+  restored: InMemoryBackend = InMemoryBackend(codec=PickleCodec(), ttl=60)
+  await restored.put("warm:0", {"index": "fresher"})
+  assert await restored.restore(path, batch=100) == 2999
+  assert await restored.fetch("warm:0") == {"index": "fresher"}
+  assert await restored.fetch("warm:2999") == {"index": 2999}
+  assert await restored.fetch("expired") is None
+  assert restored.count("warm") == 3000
+  ttl: int
+  ttl, _ = await restored.fetch_with_ttl("warm:1")
+  assert 0 < ttl <= 60
+
+
+async def test_object_mode_snapshot_mismatch(tmp_path: Path) -> None:
+  path: str = str(tmp_path / "cachette.snapshot")
+  backend: InMemoryBackend = InMemoryBackend(codec=VanillaCodec(), object_mode="copy", ttl=60)
+  await backend.put("objects:list", [1, 2, 3])
+  await backend.put("objects:lambda", lambda: None)
+  assert await backend.snapshot(path) == 1
+  restored: InMemoryBackend = InMemoryBackend(codec=VanillaCodec(), object_mode="frozen", ttl=60)
+  assert await restored.restore(path) == 1
+  assert await restored.fetch("objects:list") == (1, 2, 3)
+  with raises(ValueError, match='different "object_mode"'):
+    await InMemoryBackend(codec=VanillaCodec(), ttl=60).restore(path)
+
+
+async def test_restore_on_open_and_snapshot_on_close(tmp_path: Path) -> None:
+  path: Path = tmp_path / "cachette.snapshot"
+
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("snapshot_path", str(path))]
+
+  async with Cachette() as cachette:
+    await cachette.put("deploy", "before")
+  assert path.exists()
+
+  @Cachette.load_config
+  def reload_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory"), ("snapshot_path", str(path))]
+
+  async with Cachette() as cachette:
+    await cachette.backend.restorer
+    assert await cachette.fetch("deploy") == "before"
+
+
+async def test_frozen_objects_thawed_into_snapshot(tmp_path: Path) -> None:
+  path: str = str(tmp_path / "cachette.snapshot")
+  backend: InMemoryBackend = InMemoryBackend(codec=VanillaCodec(), object_mode="frozen", ttl=60)
+  await backend.put("objects:dict", {"nested": {"items": [1, 2]}})
+  await backend.put("objects:lambda", lambda: None)
+  assert await backend.snapshot(path) == 1
+  assert backend.stats()["snapshot_skipped"] == 1
+  restored: InMemoryBackend = InMemoryBackend(codec=VanillaCodec(), object_mode="frozen", ttl=60)
+  assert await restored.restore(path) == 1
+  value: Any = await restored.fetch("objects:dict")
+  assert value == {"nested": {"items": (1, 2)}}
+  with raises(TypeError):
+    value["nested"]["items"] = None
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/tags.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-19 01:30
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting keys put with tags are invalidated together on Redis backend"""
+
+### Standard packages ###
+from typing import Any, List, Tuple
+
+### Third-party packages ###
+from pytest import fixture, importorskip, mark, raises, skip
+
+### Local modules ###
+from cachette import Cachette
+
+importorskip("redis", reason='"redis" dependency is required for "redis" backend test.')
+
+
+@fixture(autouse=True)
+def skip_if_redis_server_cannot_be_reached() -> None:
+  from redis import Redis
+  from redis.exceptions import ConnectionError
+
+  try:
+    Redis.from_url("redis://localhost:6379").ping()
+  except ConnectionError:
+    skip(reason="Redis Server cannot be reached.")
+
+
+@mark.parametrize("near_cache", [False, True], ids=["redis", "near-cache"])
+async def test_invalidate_keys_sharing_tags(near_cache: bool) -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    configs: List[Tuple[str, Any]] = [("backend", "redis"), ("redis_url", "redis://localhost:6379")]
+    return configs + [("near_cache_ttl", 30)] if near_cache else configs
+
+  async with Cachette() as cachette:
+    await cachette.put("profile:42", "alice", tags=["user:42"])
+    await cachette.put("orders:42", "3 orders", tags=["user:42", "orders"])
+    await cachette.put("orders:7", "1 order", tags=["orders"])
+    await cachette.put("untagged", "value")
+    await cachette.clear(key="orders:42")
+    assert await cachette.invalidate_tags(["user:42"]) == 1
+    assert await cachette.fetch("profile:42") is None
+    assert await cachette.fetch("orders:7") == "1 order"
+    assert await cachette.invalidate_tags(["user:42", "orders"]) == 1
+    assert await cachette.fetch("orders:7") is None
+    assert await cachette.fetch("untagged") == "value"
+    assert await cachette.invalidate_tags([]) == 0
+    await cachette.clear(key="untagged")
+
+
+async def test_tag_sets_outlive_keys_and_prune_stale_members() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "redis"), ("redis_url", "redis://localhost:6379")]
+
+  async with Cachette() as cachette:
+    redis: Any = cachette.backend.redis
+    await cachette.put("short", "value", ttl=5, tags=["pruned"])
+    await cachette.put("long", "value", ttl=60, tags=["pruned"])
+    assert 55 < await redis.ttl("cachette:tag:pruned") <= 60
+    await cachette.clear(key="short")
+    await cachette.clear(key="long")
+    for index in range(10):
+      await cachette.put(f"fresh:{index}", "value", ttl=5, tags=["pruned"])
+    assert len(await redis.smembers("cachette:tag:pruned")) < 12
+    assert await cachette.invalidate_tags(["pruned"]) == 10
+    assert await redis.exists("cachette:tag:pruned") == 0
+
+
+async def test_unsupported_backend_raises() -> None:
+  @Cachette.load_config
+  def load_cachette_configs() -> List[Tuple[str, Any]]:
+    return [("backend", "inmemory")]
+
+  cachette: Cachette = Cachette()
+  with raises(NotImplementedError, match="InMemoryBackend does not support tags."):
+    await cachette.put("profile:42", "alice", tags=["user:42"])
+  with raises(NotImplementedError, match="InMemoryBackend does not support tags."):
+    await cachette.invalidate_tags(["user:42"])
+  await cachette.put("profile:42", "alice", tags=[])
+  assert await cachette.fetch("profile:42") == "alice"
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# coding:utf-8
+# Copyright (C) 2022-2024, All rights reserved.
+# FILENAME:    ~~/tests/tiered.py
+# VERSION:     0.1.8
+# CREATED:     2026-10-19 03:10
+# AUTHOR:      Sitt Guruvanich <aekazitt+github@gmail.com>
+# DESCRIPTION:
+#
+# HISTORY:
+# *************************************************************
+"""Test suite asserting near-cache hits report remaining time-to-live of remote entries and hold
+values as decoded by remote backend"""
+
+### Local modules ###
+from cachette.backends.inmemory import InMemoryBackend
+from cachette.backends.tiered import TieredBackend
+from cachette.codecs.pickle import PickleCodec
+from cachette.codecs.vanilla import VanillaCodec
+
+
+async def test_near_hits_report_remote_ttl() -> None:
+  backend: TieredBackend = TieredBackend(InMemoryBackend(codec=PickleCodec(), ttl=60), 5)
+  await backend.put("tiered:put", "value", ttl=600)
+  ttl: int
+  ttl, _ = await backend.fetch_with_ttl("tiered:put")
+  assert 595 < ttl <= 600
+  ttl, _ = await backend.fetch_with_ttl("tiered:put")
+  assert 595 < ttl <= 600
+  assert backend.stats()["l1"] == {"hits": 1, "misses": 1}
+  await backend.backend.put("tiered:batch", "value", ttl=300)
+  assert await backend.fetch_many(["tiered:batch"]) == ["value"]
+  ttl, _ = await backend.fetch_with_ttl("tiered:batch")
+  assert 295 < ttl <= 300
+  ttl, _ = await backend.fetch_with_ttl("tiered:batch")
+  assert 295 < ttl <= 300
+  assert backend.stats()["l1"] == {"hits": 2, "misses": 3}
+
+
+async def test_near_hits_decoded_by_remote_codec() -> None:
+  backend: TieredBackend = TieredBackend(InMemoryBackend(codec=VanillaCodec(), ttl=60), 5)
+  value: list = [42]
+  await backend.put("tiered:put", value)
+  value.append(43)
+  await backend.put_many({"tiered:many": 42})
+  assert await backend.fetch("tiered:put") == await backend.fetch("tiered:put") == "[42]"
+  assert await backend.fetch_many(["tiered:many"]) == ["42"]
+  assert await backend.fetch("tiered:many") == "42"
+  assert backend.stats()["l1"] == {"hits": 2, "misses": 2}